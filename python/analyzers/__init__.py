@@ -2,6 +2,10 @@
 # Ported from C:\Users\adm_r\SpineHUB\src\analyzers
 
 from .analyzer_base import AnalyzerBase, AnalyzerResult, Issue, Severity
+from .baseline import Baseline
+from .capabilities import TOOL_CAPABILITIES, ToolCapability, ToolCapabilityCache
+from .issue_store import IssueStore
+from .result_cache import AnalysisCache
 from .code_analyzer import CodeAnalyzer, RuffAnalyzer, BanditAnalyzer, VultureAnalyzer, RadonAnalyzer, FullAnalysisResult
 
 __all__ = [
@@ -15,4 +19,10 @@ __all__ = [
     "VultureAnalyzer",
     "RadonAnalyzer",
     "FullAnalysisResult",
+    "ToolCapability",
+    "ToolCapabilityCache",
+    "TOOL_CAPABILITIES",
+    "AnalysisCache",
+    "IssueStore",
+    "Baseline",
 ]
@@ -3,11 +3,27 @@ Base classes for code analyzers.
 Ported from SpineHUB.
 """
 
+import importlib.util
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Sequence
+
+from .capabilities import TOOL_CAPABILITIES
+
+if TYPE_CHECKING:
+    from .issue_store import IssueStore
+
+# Slotted dataclasses need Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Directories skipped when expanding a directory into Python files
+EXCLUDED_DIRS = {
+    ".git", ".hg", ".mypy_cache", ".ruff_cache", ".tox", ".venv",
+    "__pycache__", "build", "dist", "node_modules", "venv",
+}
 
 
 class Severity(str, Enum):
@@ -18,7 +34,7 @@ class Severity(str, Enum):
     SECURITY = "security"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Issue:
     """A single issue found by an analyzer."""
     file: str
@@ -31,28 +47,57 @@ class Issue:
     fix_available: bool = False
     fix_description: Optional[str] = None
 
+    def to_dict(self) -> dict:
+        return {**asdict(self), "severity": self.severity.value}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Issue":
+        return cls(**{**data, "severity": Severity(data["severity"])})
+
 
 @dataclass
 class AnalyzerResult:
     """Result from running an analyzer."""
     tool: str
     success: bool
-    issues: list[Issue] = field(default_factory=list)
+    # A list, or an IssueStore for tools that stream large outputs
+    issues: Sequence[Issue] = field(default_factory=list)
     summary: dict = field(default_factory=dict)
     raw_output: str = ""
     error: Optional[str] = None
+    _store: Optional["IssueStore"] = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def issue_count(self) -> int:
         return len(self.issues)
 
+    @property
+    def store(self) -> "IssueStore":
+        """Columnar view of the issues, built once (or the issues themselves if already columnar)."""
+        from .issue_store import IssueStore
+
+        if isinstance(self.issues, IssueStore):
+            return self.issues
+        if self._store is None or len(self._store) != len(self.issues):
+            self._store = IssueStore(self.issues)
+        return self._store
+
+    def _is_columnar(self) -> bool:
+        # Building a store only pays off for repeated queries; plain lists are scanned
+        return self._store is not None or not isinstance(self.issues, list)
+
+    def _has_severity(self, severity: Severity) -> bool:
+        if self._is_columnar():
+            return self.store.has_severity(severity)
+        return any(i.severity == severity for i in self.issues)
+
     @property
     def has_errors(self) -> bool:
-        return any(i.severity == Severity.ERROR for i in self.issues)
+        return self._has_severity(Severity.ERROR)
 
     @property
     def has_security_issues(self) -> bool:
-        return any(i.severity == Severity.SECURITY for i in self.issues)
+        return self._has_severity(Severity.SECURITY)
 
     def format_summary(self) -> str:
         """Format a summary of the results."""
@@ -63,10 +108,13 @@ class AnalyzerResult:
         ]
 
         if self.issues:
-            by_severity = {}
-            for issue in self.issues:
-                sev = issue.severity.value
-                by_severity[sev] = by_severity.get(sev, 0) + 1
+            if self._is_columnar():
+                by_severity = self.store.count_by_severity()
+            else:
+                by_severity = {}
+                for issue in self.issues:
+                    sev = issue.severity.value
+                    by_severity[sev] = by_severity.get(sev, 0) + 1
 
             lines.append("By Severity:")
             for sev, count in sorted(by_severity.items()):
@@ -80,14 +128,38 @@ class AnalyzerBase(ABC):
 
     name: str = "base"
     description: str = "Base analyzer"
+    # Whether a file's issues depend only on that file (enables per-file caching)
+    per_file: bool = True
+    # Importable module for an in-process backend (None: subprocess only)
+    inprocess_module: Optional[str] = None
+
+    # "auto" runs in-process when the library is importable, else as a subprocess
+    BACKENDS = ("auto", "subprocess", "inprocess")
 
-    def __init__(self, project_path: str):
+    def __init__(self, project_path: str, backend: str = "auto", keep_raw_output: bool = True):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown analyzer backend: {backend}. Available: {list(self.BACKENDS)}")
         self.project_path = Path(project_path)
+        self.backend = backend
+        # False drops the tool's stdout once parsed instead of keeping it in raw_output
+        self.keep_raw_output = keep_raw_output
+
+    def use_inprocess(self) -> bool:
+        """Whether this run should call the tool's library API instead of a subprocess."""
+        if self.inprocess_module is None or self.backend == "subprocess":
+            return False
+        if self.backend == "inprocess":
+            return True
+        return importlib.util.find_spec(self.inprocess_module) is not None
 
-    @abstractmethod
     def is_available(self) -> bool:
-        """Check if the tool is installed and available."""
-        pass
+        """Check if the tool is installed and available (cached per interpreter)."""
+        return TOOL_CAPABILITIES.probe(self.name).available
+
+    @property
+    def tool_version(self) -> Optional[str]:
+        """Installed version of the tool, if available."""
+        return TOOL_CAPABILITIES.probe(self.name).version
 
     @abstractmethod
     def run(self, paths: Optional[list[str]] = None) -> AnalyzerResult:
@@ -99,9 +171,33 @@ class AnalyzerBase(ABC):
         """Parse the tool's output into Issue objects."""
         pass
 
-    def get_python_files(self, paths: Optional[list[str]] = None) -> list[Path]:
-        """Get all Python files in the project or specified paths."""
-        if paths:
-            return [Path(p) for p in paths if p.endswith(".py")]
+    def summarize(self, issues: list[Issue]) -> dict:
+        """Build the result summary for a list of issues."""
+        return {"total_issues": len(issues)}
 
-        return list(self.project_path.rglob("*.py"))
+    def get_python_files(self, paths: Optional[list[str]] = None) -> list[Path]:
+        """Get all Python files in the project or specified paths (directories are expanded)."""
+        roots = [Path(p) for p in paths] if paths else [self.project_path]
+        files = []
+        for root in roots:
+            if not root.is_absolute():
+                # Tools run with cwd=project_path, so relative paths are relative to it
+                root = self.project_path / root
+            if root.is_dir():
+                files.extend(
+                    f for f in root.rglob("*.py")
+                    if not EXCLUDED_DIRS.intersection(f.relative_to(root).parts)
+                )
+            elif root.suffix == ".py":
+                files.append(root)
+        return sorted(files)
+
+    def discover_files(self, paths: Optional[list[str]] = None) -> list[Path]:
+        """
+        The files ``run(paths)`` analyzes, in the order it reports them.
+
+        Sharded and incremental runs pass these back to ``run`` as explicit
+        paths, so an analyzer must apply its tool's exclusions to explicit
+        paths as well. Tools with their own file discovery override this.
+        """
+        return self.get_python_files(paths)
@@ -0,0 +1,144 @@
+"""
+Baseline of known analyzer issues.
+
+A baseline records the issues a project already has, so later runs report
+only what is new. Issues are matched by a fingerprint that survives
+unrelated edits: tool, code, file path relative to the project, the
+enclosing function/class and a hash of the message. Line numbers are left
+out on purpose, since they move whenever code above an issue changes.
+
+Identical fingerprints are counted: if a function had two matching issues
+when the baseline was written, a third one is reported as new.
+"""
+
+import ast
+import bisect
+import hashlib
+import json
+import os
+from collections import Counter
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .analyzer_base import AnalyzerResult, Issue
+
+BASELINE_VERSION = 1
+
+
+class SymbolIndex:
+    """Finds the innermost function/class enclosing a line, per file (parsed once)."""
+
+    def __init__(self):
+        self._files: dict[Path, tuple[list[int], list[tuple[int, int, str]]]] = {}
+
+    def enclosing(self, path: Path, line: int) -> str:
+        starts, spans = self._spans(path)
+        # Spans are sorted by start; walk back from the last one starting at or before line
+        for index in range(bisect.bisect_right(starts, line) - 1, -1, -1):
+            start, end, name = spans[index]
+            if end >= line:
+                return name
+        return ""
+
+    def _spans(self, path: Path) -> tuple[list[int], list[tuple[int, int, str]]]:
+        cached = self._files.get(path)
+        if cached is not None:
+            return cached
+
+        spans: list[tuple[int, int, str]] = []
+        try:
+            tree = ast.parse(path.read_text(encoding="utf-8"))
+        except (OSError, SyntaxError, UnicodeDecodeError, ValueError):
+            tree = None
+
+        def visit(node: ast.AST, prefix: str) -> None:
+            for child in ast.iter_child_nodes(node):
+                if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                    name = f"{prefix}{child.name}"
+                    spans.append((child.lineno, child.end_lineno, name))
+                    visit(child, f"{name}.")
+                else:
+                    visit(child, prefix)
+
+        if tree is not None:
+            visit(tree, "")
+        # Nested spans start after their parent, so the innermost match is found first
+        spans.sort(key=lambda span: span[0])
+        cached = self._files[path] = ([span[0] for span in spans], spans)
+        return cached
+
+
+class Baseline:
+    """Hashed index of known issue fingerprints with occurrence counts."""
+
+    def __init__(self, project_path: str, counts: Optional[dict[str, int]] = None):
+        self.project_path = Path(project_path).resolve()
+        self.counts: Counter = Counter(counts or {})
+
+    def __len__(self) -> int:
+        return sum(self.counts.values())
+
+    # Fingerprints
+
+    def _path(self, issue: Issue) -> Path:
+        path = Path(issue.file)
+        if not path.is_absolute():
+            path = self.project_path / path
+        return path.resolve()
+
+    def fingerprint(self, issue: Issue, symbols: Optional[SymbolIndex] = None) -> str:
+        """Stable key of an issue; pass one ``symbols`` index per run to parse each file once."""
+        path = self._path(issue)
+        try:
+            relative = path.relative_to(self.project_path).as_posix()
+        except ValueError:
+            relative = path.as_posix()
+        symbol = (symbols or SymbolIndex()).enclosing(path, issue.line)
+        message = hashlib.sha1(" ".join(issue.message.split()).encode()).hexdigest()
+        return hashlib.sha1(
+            "\0".join((issue.tool, issue.code, relative, symbol, message)).encode()
+        ).hexdigest()
+
+    # Building and persistence
+
+    def add(self, issues: Iterable[Issue]) -> None:
+        symbols = SymbolIndex()
+        self.counts.update(self.fingerprint(issue, symbols) for issue in issues)
+
+    @classmethod
+    def from_results(cls, project_path: str, results: Iterable[AnalyzerResult]) -> "Baseline":
+        baseline = cls(project_path)
+        for result in results:
+            if result.success:
+                baseline.add(result.issues)
+        return baseline
+
+    @classmethod
+    def load(cls, project_path: str, path: str) -> "Baseline":
+        with open(path, encoding="utf-8") as handle:
+            data = json.load(handle)
+        if data.get("version") != BASELINE_VERSION:
+            raise ValueError(f"Unsupported baseline version: {data.get('version')}")
+        return cls(project_path, data.get("fingerprints", {}))
+
+    def save(self, path: str) -> None:
+        data = {"version": BASELINE_VERSION, "fingerprints": dict(sorted(self.counts.items()))}
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as handle:
+            json.dump(data, handle, indent=1)
+        os.replace(tmp, path)
+
+    # Filtering
+
+    def new_issues(self, issues: Iterable[Issue]) -> list[Issue]:
+        """Issues not covered by the baseline, in their original order."""
+        symbols = SymbolIndex()
+        matched: Counter = Counter()
+        new = []
+        for issue in issues:
+            key = self.fingerprint(issue, symbols)
+            if matched[key] < self.counts[key]:
+                matched[key] += 1
+            else:
+                new.append(issue)
+        return new
@@ -0,0 +1,107 @@
+"""
+Backend benchmark for the analyzers.
+
+Runs radon and vulture through both the subprocess and the in-process
+backend on the same tree, reports the best wall time of each and checks
+that both backends find the same issues.
+
+Usage:
+    python -m analyzers.benchmark [PATH] [--repeat N] [--json]
+
+PATH defaults to the repository's ``scripts/`` tree.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from .code_analyzer import RadonAnalyzer, VultureAnalyzer
+
+DEFAULT_TARGET = Path(__file__).resolve().parents[2] / "scripts"
+
+ANALYZERS = (RadonAnalyzer, VultureAnalyzer)
+BACKENDS = ("subprocess", "inprocess")
+
+
+def _fingerprints(project_path: Path, result) -> list[tuple]:
+    """Backend-independent view of a result (paths resolved, order ignored)."""
+    fingerprints = []
+    for issue in result.issues:
+        path = Path(issue.file)
+        if not path.is_absolute():
+            path = project_path / path
+        fingerprints.append((str(path.resolve()), issue.line, issue.code, issue.message))
+    return sorted(fingerprints)
+
+
+def compare_backends(project_path: Path, repeat: int = 3) -> list[dict]:
+    """Time each analyzer under each backend and check the issue lists match."""
+    rows = []
+    for analyzer_cls in ANALYZERS:
+        timings = {}
+        found = {}
+        for backend in BACKENDS:
+            analyzer = analyzer_cls(str(project_path), backend=backend)
+            if not analyzer.is_available():
+                break
+            best = None
+            for _ in range(repeat):
+                start = time.perf_counter()
+                result = analyzer.run()
+                elapsed = (time.perf_counter() - start) * 1000
+                if not result.success:
+                    raise RuntimeError(f"{analyzer.name} ({backend}) failed: {result.error}")
+                best = elapsed if best is None else min(best, elapsed)
+            timings[backend] = round(best, 1)
+            found[backend] = _fingerprints(project_path, result)
+
+        if len(found) < len(BACKENDS):
+            rows.append({"tool": analyzer_cls.name, "available": False})
+            continue
+
+        rows.append({
+            "tool": analyzer_cls.name,
+            "available": True,
+            "issues": len(found["subprocess"]),
+            "subprocess_ms": timings["subprocess"],
+            "inprocess_ms": timings["inprocess"],
+            "speedup": round(timings["subprocess"] / max(timings["inprocess"], 0.1), 1),
+            "identical": found["subprocess"] == found["inprocess"],
+        })
+    return rows
+
+
+def format_table(project_path: Path, rows: list[dict]) -> str:
+    lines = [
+        f"Target: {project_path}",
+        f"{'tool':<10}{'issues':>8}{'subprocess ms':>16}{'inprocess ms':>15}{'speedup':>10}  identical",
+    ]
+    for row in rows:
+        if not row["available"]:
+            lines.append(f"{row['tool']:<10}  (not installed)")
+            continue
+        lines.append(
+            f"{row['tool']:<10}{row['issues']:>8}{row['subprocess_ms']:>16}"
+            f"{row['inprocess_ms']:>15}{row['speedup']:>9}x  {'yes' if row['identical'] else 'NO'}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compare analyzer backends")
+    parser.add_argument("path", nargs="?", default=str(DEFAULT_TARGET))
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per backend (best is kept)")
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of a table")
+    args = parser.parse_args(argv)
+
+    project_path = Path(args.path).resolve()
+    rows = compare_backends(project_path, args.repeat)
+    print(json.dumps(rows, indent=2) if args.json else format_table(project_path, rows))
+    # Non-zero exit when the backends disagree, so this can gate CI
+    return 0 if all(row.get("identical", True) for row in rows) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""
+Tool capability cache for the analyzers.
+
+Checking whether a tool is installed means starting an interpreter
+(``python -m <tool> --version``). The answer only changes when the
+interpreter or its installed packages change, so results are cached
+process-wide and shared by every analyzer.
+"""
+
+import importlib.util
+import site
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+
+@dataclass
+class ToolCapability:
+    """What is known about one analysis tool in the current interpreter."""
+    tool: str
+    available: bool
+    version: Optional[str] = None
+    module_path: Optional[str] = None
+    checked_at: float = 0.0
+
+
+class ToolCapabilityCache:
+    """
+    Process-wide cache of tool probes.
+
+    Entries stay valid while the interpreter path and the modification times
+    of its site-packages directories are unchanged; installing or removing a
+    package touches site-packages and drops every entry.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tool_locks: dict[str, threading.Lock] = defaultdict(threading.Lock)
+        self._entries: dict[str, ToolCapability] = {}
+        self._environment: Optional[tuple] = None
+
+    def probe(self, tool: str) -> ToolCapability:
+        """Return the cached capability for ``tool``, checking it if needed."""
+        with self._tool_locks[tool]:
+            environment = self._environment_key()
+            with self._lock:
+                if environment != self._environment:
+                    self._entries.clear()
+                    self._environment = environment
+                cached = self._entries.get(tool)
+            if cached is not None:
+                return cached
+
+            capability = self._check(tool)
+            with self._lock:
+                self._entries[tool] = capability
+            return capability
+
+    def invalidate(self, tool: Optional[str] = None) -> None:
+        """Forget one tool, or every tool when ``tool`` is None."""
+        with self._lock:
+            if tool is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(tool, None)
+
+    @staticmethod
+    def _environment_key() -> tuple:
+        directories = list(site.getsitepackages()) if hasattr(site, "getsitepackages") else []
+        directories.append(site.getusersitepackages())
+        mtimes = []
+        for directory in directories:
+            try:
+                mtimes.append((directory, Path(directory).stat().st_mtime_ns))
+            except OSError:
+                continue
+        return (sys.executable, tuple(mtimes))
+
+    @staticmethod
+    def _check(tool: str) -> ToolCapability:
+        try:
+            result = subprocess.run(
+                [sys.executable, "-m", tool, "--version"],
+                capture_output=True,
+                text=True,
+            )
+        except Exception:
+            return ToolCapability(tool=tool, available=False, checked_at=time.time())
+
+        if result.returncode != 0:
+            return ToolCapability(tool=tool, available=False, checked_at=time.time())
+
+        try:
+            from importlib.metadata import version as package_version
+            version = package_version(tool)
+        except Exception:
+            lines = result.stdout.strip().splitlines()
+            version = lines[0].split()[-1] if lines else None
+
+        spec = importlib.util.find_spec(tool)
+        return ToolCapability(
+            tool=tool,
+            available=True,
+            version=version,
+            module_path=spec.origin if spec else None,
+            checked_at=time.time(),
+        )
+
+
+# Shared by every analyzer in this process
+TOOL_CAPABILITIES = ToolCapabilityCache()
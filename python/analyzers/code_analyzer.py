@@ -6,15 +6,26 @@ Orchestrates multiple code analysis tools and provides
 a unified interface for code quality checking.
 """
 
+import heapq
+import io
 import json
+import os
 import subprocess
 import sys
 import re
+import time
+from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional
 from dataclasses import dataclass
 
 from .analyzer_base import AnalyzerBase, AnalyzerResult, Issue, Severity
+from .issue_store import IssueStore
+from .baseline import Baseline
+from .json_stream import iter_array
+from .git_diff import changed_line_ranges, changed_python_files, definition_ranges
+from .result_cache import AnalysisCache
 
 
 def run_python_module(module: str, args: list[str], cwd: str = None) -> subprocess.CompletedProcess:
@@ -27,7 +38,117 @@ def run_python_module(module: str, args: list[str], cwd: str = None) -> subproce
     )
 
 
-class RuffAnalyzer(AnalyzerBase):
+def stream_python_module(module: str, args: list[str], cwd: str = None) -> subprocess.Popen:
+    """Start ``python -m module`` with stdout available as a text stream."""
+    return subprocess.Popen(
+        [sys.executable, "-m", module] + args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        cwd=cwd,
+    )
+
+
+class _Tee:
+    """Read-through wrapper that keeps a copy of everything read from a stream."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.parts: list[str] = []
+
+    def read(self, size: int = -1) -> str:
+        chunk = self.stream.read(size)
+        self.parts.append(chunk)
+        return chunk
+
+    def getvalue(self) -> str:
+        return "".join(self.parts)
+
+
+class _Stopwatch:
+    """Collects named phase durations (ms) for one analyzer run."""
+
+    def __init__(self):
+        self._start = self._last = time.perf_counter()
+        self.phases: dict[str, float] = {}
+
+    def lap(self, phase: str) -> None:
+        now = time.perf_counter()
+        self.phases[phase] = round((now - self._last) * 1000, 1)
+        self._last = now
+
+    def as_dict(self) -> dict[str, float]:
+        return {**self.phases, "total": round((self._last - self._start) * 1000, 1)}
+
+
+def shard_files(files: list[Path], count: int) -> list[list[Path]]:
+    """
+    Split ``files`` into at most ``count`` shards of similar total size.
+
+    Files are assigned largest first to the currently lightest shard, and
+    each shard keeps the files in sorted order.
+    """
+    sizes = {}
+    for f in files:
+        try:
+            sizes[f] = f.stat().st_size
+        except OSError:
+            sizes[f] = 0
+
+    buckets: list[list[Path]] = [[] for _ in range(max(count, 1))]
+    heap = [(0, i) for i in range(len(buckets))]
+    for f in sorted(files, key=lambda f: (-sizes[f], f)):
+        total, i = heapq.heappop(heap)
+        buckets[i].append(f)
+        heapq.heappush(heap, (total + sizes[f], i))
+    return [sorted(bucket) for bucket in buckets if bucket]
+
+
+class JsonStreamAnalyzer(AnalyzerBase):
+    """Analyzer whose tool prints its findings as one JSON array, parsed as a stream."""
+
+    # Key of the findings array when the tool's JSON report is an object
+    results_key: Optional[str] = None
+
+    @abstractmethod
+    def parse_item(self, item: dict) -> Issue:
+        """Convert one finding of the tool's JSON report."""
+        pass
+
+    def parse_output(self, output: str) -> list[Issue]:
+        try:
+            return [
+                self.parse_item(item)
+                for item in iter_array(io.StringIO(output), key=self.results_key)
+            ]
+        except json.JSONDecodeError:
+            return []
+
+    def _stream_issues(self, module: str, args: list[str]) -> tuple[IssueStore, str]:
+        """
+        Run ``python -m module`` and parse its JSON findings while it writes them.
+
+        Only one finding and a small read buffer are decoded at a time, and
+        findings go straight into a columnar IssueStore. Output that is not a
+        complete JSON report yields no issues, as in ``parse_output``. The
+        stdout copy is returned only when ``keep_raw_output`` is set.
+        """
+        with stream_python_module(module, args, cwd=str(self.project_path)) as process:
+            stdout = _Tee(process.stdout) if self.keep_raw_output else process.stdout
+            try:
+                issues = IssueStore(
+                    self.parse_item(item)
+                    for item in iter_array(stdout, key=self.results_key)
+                )
+            except json.JSONDecodeError:
+                issues = IssueStore()
+            # Drain whatever follows the array so the tool never blocks on a full pipe
+            while stdout.read(1 << 16):
+                pass
+        return issues, stdout.getvalue() if self.keep_raw_output else ""
+
+
+class RuffAnalyzer(JsonStreamAnalyzer):
     """
     Ruff - Fast Python linter and formatter.
 
@@ -41,14 +162,8 @@ class RuffAnalyzer(AnalyzerBase):
     name = "ruff"
     description = "Fast Python linter (10-100x faster than flake8)"
 
-    def is_available(self) -> bool:
-        try:
-            result = run_python_module("ruff", ["--version"])
-            return result.returncode == 0
-        except Exception:
-            return False
-
     def run(self, paths: Optional[list[str]] = None) -> AnalyzerResult:
+        timer = _Stopwatch()
         if not self.is_available():
             return AnalyzerResult(
                 tool=self.name,
@@ -56,26 +171,23 @@ class RuffAnalyzer(AnalyzerBase):
                 error="Ruff is not installed. Run: pip install ruff",
             )
 
+        timer.lap("probe")
         target = paths if paths else [str(self.project_path)]
 
         try:
-            result = run_python_module(
-                "ruff",
-                ["check", "--output-format=json"] + target,
-                cwd=str(self.project_path),
+            # Issues are decoded while ruff is still writing; parsing is part of "run"
+            # --force-exclude applies ruff's exclude settings to explicit files too
+            issues, raw_output = self._stream_issues(
+                "ruff", ["check", "--output-format=json", "--force-exclude"] + target
             )
-
-            issues = self.parse_output(result.stdout)
+            timer.lap("run")
 
             return AnalyzerResult(
                 tool=self.name,
                 success=True,
                 issues=issues,
-                raw_output=result.stdout,
-                summary={
-                    "total_issues": len(issues),
-                    "fixable": sum(1 for i in issues if i.fix_available),
-                },
+                raw_output=raw_output,
+                summary={**self.summarize(issues), "timing_ms": timer.as_dict()},
             )
         except Exception as e:
             return AnalyzerResult(
@@ -84,44 +196,48 @@ class RuffAnalyzer(AnalyzerBase):
                 error=str(e),
             )
 
-    def parse_output(self, output: str) -> list[Issue]:
-        if not output.strip():
-            return []
-
-        try:
-            data = json.loads(output)
-        except json.JSONDecodeError:
-            return []
-
-        issues = []
-        for item in data:
-            # Determine severity based on code
-            code = item.get("code", "")
-            if code.startswith("E"):
-                severity = Severity.ERROR
-            elif code.startswith("W"):
-                severity = Severity.WARNING
-            else:
-                severity = Severity.INFO
-
-            issues.append(
-                Issue(
-                    file=item.get("filename", ""),
-                    line=item.get("location", {}).get("row", 0),
-                    column=item.get("location", {}).get("column", 0),
-                    code=code,
-                    message=item.get("message", ""),
-                    severity=severity,
-                    tool=self.name,
-                    fix_available=item.get("fix") is not None,
-                    fix_description=item.get("fix", {}).get("message") if item.get("fix") else None,
-                )
-            )
-
-        return issues
-
+    def summarize(self, issues: list[Issue]) -> dict:
+        return {
+            "total_issues": len(issues),
+            "fixable": sum(1 for i in issues if i.fix_available),
+        }
 
-class BanditAnalyzer(AnalyzerBase):
+    def discover_files(self, paths: Optional[list[str]] = None) -> list[Path]:
+        # ruff's own discovery: its default and configured excludes, .gitignore,
+        # and every file type it checks (.pyi, notebooks, pyproject.toml)
+        target = paths if paths else [str(self.project_path)]
+        result = run_python_module(
+            "ruff", ["check", "--show-files", "--force-exclude"] + target, cwd=str(self.project_path)
+        )
+        if result.returncode != 0:
+            # Broken config: let the run itself report the error
+            return super().discover_files(paths)
+        return [Path(line) for line in result.stdout.splitlines() if line]
+
+    def parse_item(self, item: dict) -> Issue:
+        # Determine severity based on code (syntax errors have no code)
+        code = item.get("code") or ""
+        if code.startswith("E"):
+            severity = Severity.ERROR
+        elif code.startswith("W"):
+            severity = Severity.WARNING
+        else:
+            severity = Severity.INFO
+
+        return Issue(
+            file=item.get("filename", ""),
+            line=item.get("location", {}).get("row", 0),
+            column=item.get("location", {}).get("column", 0),
+            code=code,
+            message=item.get("message", ""),
+            severity=severity,
+            tool=self.name,
+            fix_available=item.get("fix") is not None,
+            fix_description=item.get("fix", {}).get("message") if item.get("fix") else None,
+        )
+
+
+class BanditAnalyzer(JsonStreamAnalyzer):
     """
     Bandit - Security-focused Python linter.
 
@@ -134,15 +250,12 @@ class BanditAnalyzer(AnalyzerBase):
 
     name = "bandit"
     description = "Python security scanner"
-
-    def is_available(self) -> bool:
-        try:
-            result = run_python_module("bandit", ["--version"])
-            return result.returncode == 0
-        except Exception:
-            return False
+    # Findings live under "results"; recursive scans also print a progress
+    # line before the report, which iter_array skips
+    results_key = "results"
 
     def run(self, paths: Optional[list[str]] = None) -> AnalyzerResult:
+        timer = _Stopwatch()
         if not self.is_available():
             return AnalyzerResult(
                 tool=self.name,
@@ -150,28 +263,24 @@ class BanditAnalyzer(AnalyzerBase):
                 error="Bandit is not installed. Run: pip install bandit",
             )
 
+        timer.lap("probe")
         target = paths if paths else [str(self.project_path)]
 
         try:
-            result = run_python_module(
-                "bandit",
-                ["-r", "-f", "json"] + target,
-                cwd=str(self.project_path),
-            )
-
-            issues = self.parse_output(result.stdout)
+            args = ["-r", "-f", "json"]
+            ini = self.project_path / ".bandit"
+            if ini.is_file():
+                # bandit only looks for .bandit inside directory targets, not next to files
+                args += ["--ini", str(ini)]
+            issues, raw_output = self._stream_issues("bandit", args + target)
+            timer.lap("run")
 
             return AnalyzerResult(
                 tool=self.name,
                 success=True,
                 issues=issues,
-                raw_output=result.stdout,
-                summary={
-                    "total_issues": len(issues),
-                    "high_severity": sum(
-                        1 for i in issues if i.severity == Severity.SECURITY
-                    ),
-                },
+                raw_output=raw_output,
+                summary={**self.summarize(issues), "timing_ms": timer.as_dict()},
             )
         except Exception as e:
             return AnalyzerResult(
@@ -180,39 +289,49 @@ class BanditAnalyzer(AnalyzerBase):
                 error=str(e),
             )
 
-    def parse_output(self, output: str) -> list[Issue]:
-        if not output.strip():
-            return []
-
-        try:
-            data = json.loads(output)
-        except json.JSONDecodeError:
-            return []
+    def summarize(self, issues: list[Issue]) -> dict:
+        return {
+            "total_issues": len(issues),
+            "high_severity": sum(1 for i in issues if i.severity == Severity.SECURITY),
+        }
 
-        issues = []
-        for item in data.get("results", []):
-            # Map Bandit severity to our severity
-            bandit_severity = item.get("issue_severity", "").upper()
-            if bandit_severity == "HIGH":
-                severity = Severity.SECURITY
-            elif bandit_severity == "MEDIUM":
-                severity = Severity.WARNING
-            else:
-                severity = Severity.INFO
-
-            issues.append(
-                Issue(
-                    file=item.get("filename", ""),
-                    line=item.get("line_number", 0),
-                    column=0,
-                    code=item.get("test_id", ""),
-                    message=f"{item.get('issue_text', '')} (Confidence: {item.get('issue_confidence', '')})",
-                    severity=severity,
-                    tool=self.name,
+    def discover_files(self, paths: Optional[list[str]] = None) -> list[Path]:
+        # Every .py file bandit -r walks into. Bandit drops its excluded paths
+        # from explicit file lists as well, so they need no filtering here;
+        # its report is sorted by file name.
+        files = []
+        for target in paths if paths else [str(self.project_path)]:
+            root = self.project_path / target
+            if root.is_dir():
+                files.extend(
+                    Path(directory, name)
+                    for directory, _, names in os.walk(root)
+                    for name in names
+                    if name.endswith(".py")
                 )
-            )
-
-        return issues
+            else:
+                files.append(root)
+        return sorted(files, key=str)
+
+    def parse_item(self, item: dict) -> Issue:
+        # Map Bandit severity to our severity
+        bandit_severity = item.get("issue_severity", "").upper()
+        if bandit_severity == "HIGH":
+            severity = Severity.SECURITY
+        elif bandit_severity == "MEDIUM":
+            severity = Severity.WARNING
+        else:
+            severity = Severity.INFO
+
+        return Issue(
+            file=item.get("filename", ""),
+            line=item.get("line_number", 0),
+            column=0,
+            code=item.get("test_id", ""),
+            message=f"{item.get('issue_text', '')} (Confidence: {item.get('issue_confidence', '')})",
+            severity=severity,
+            tool=self.name,
+        )
 
 
 class VultureAnalyzer(AnalyzerBase):
@@ -228,15 +347,14 @@ class VultureAnalyzer(AnalyzerBase):
 
     name = "vulture"
     description = "Dead code detector"
+    # Unused-code detection needs the whole project, so no per-file caching
+    per_file = False
+    inprocess_module = "vulture"
 
-    def is_available(self) -> bool:
-        try:
-            result = run_python_module("vulture", ["--version"])
-            return result.returncode == 0
-        except Exception:
-            return False
+    MIN_CONFIDENCE = 80
 
     def run(self, paths: Optional[list[str]] = None) -> AnalyzerResult:
+        timer = _Stopwatch()
         if not self.is_available():
             return AnalyzerResult(
                 tool=self.name,
@@ -244,24 +362,43 @@ class VultureAnalyzer(AnalyzerBase):
                 error="Vulture is not installed. Run: pip install vulture",
             )
 
+        timer.lap("probe")
         target = paths if paths else [str(self.project_path)]
 
         try:
+            if self.use_inprocess():
+                issues = self._run_inprocess(target)
+                timer.lap("run")
+                return AnalyzerResult(
+                    tool=self.name,
+                    success=True,
+                    issues=issues,
+                    summary={
+                        **self.summarize(issues),
+                        "backend": "inprocess",
+                        "timing_ms": timer.as_dict(),
+                    },
+                )
+
             result = run_python_module(
                 "vulture",
-                ["--min-confidence", "80"] + target,
+                ["--min-confidence", str(self.MIN_CONFIDENCE)] + target,
                 cwd=str(self.project_path),
             )
+            timer.lap("run")
 
             issues = self.parse_output(result.stdout)
+            timer.lap("parse")
 
             return AnalyzerResult(
                 tool=self.name,
                 success=True,
                 issues=issues,
-                raw_output=result.stdout,
+                raw_output=result.stdout if self.keep_raw_output else "",
                 summary={
-                    "total_unused": len(issues),
+                    **self.summarize(issues),
+                    "backend": "subprocess",
+                    "timing_ms": timer.as_dict(),
                 },
             )
         except Exception as e:
@@ -271,6 +408,36 @@ class VultureAnalyzer(AnalyzerBase):
                 error=str(e),
             )
 
+    def _run_inprocess(self, target: list[str]) -> list[Issue]:
+        """Run vulture through its library API, honouring only the project's pyproject.toml."""
+        from vulture.config import make_config
+        from vulture.core import Vulture
+
+        # The CLI runs with cwd=project_path; resolve relative targets the same way
+        argv = ["--min-confidence", str(self.MIN_CONFIDENCE)]
+        argv += [str(self.project_path / t) for t in target]
+        # Always name the project's file: vulture otherwise reads pyproject.toml
+        # from our cwd, and it skips a --config that does not exist
+        argv += ["--config", str(self.project_path / "pyproject.toml")]
+        config = make_config(argv)
+
+        vulture = Vulture(
+            verbose=False,
+            ignore_names=config["ignore_names"],
+            ignore_decorators=config["ignore_decorators"],
+        )
+        vulture.scavenge(config["paths"], exclude=config["exclude"])
+        return [
+            self._make_issue(str(item.filename), item.first_lineno, item.message, item.confidence)
+            for item in vulture.get_unused_code(
+                min_confidence=config["min_confidence"],
+                sort_by_size=config["sort_by_size"],
+            )
+        ]
+
+    def summarize(self, issues: list[Issue]) -> dict:
+        return {"total_unused": len(issues)}
+
     def parse_output(self, output: str) -> list[Issue]:
         issues = []
         # Vulture output format: file.py:line: message (confidence%)
@@ -283,19 +450,24 @@ class VultureAnalyzer(AnalyzerBase):
             match = re.match(pattern, line)
             if match:
                 issues.append(
-                    Issue(
-                        file=match.group(1),
-                        line=int(match.group(2)),
-                        column=0,
-                        code="DEAD",
-                        message=f"{match.group(3)} ({match.group(4)}% confidence)",
-                        severity=Severity.WARNING,
-                        tool=self.name,
+                    self._make_issue(
+                        match.group(1), int(match.group(2)), match.group(3), match.group(4)
                     )
                 )
 
         return issues
 
+    def _make_issue(self, filename: str, line: int, message: str, confidence) -> Issue:
+        return Issue(
+            file=filename,
+            line=line,
+            column=0,
+            code="DEAD",
+            message=f"{message} ({confidence}% confidence)",
+            severity=Severity.WARNING,
+            tool=self.name,
+        )
+
 
 class RadonAnalyzer(AnalyzerBase):
     """
@@ -309,6 +481,7 @@ class RadonAnalyzer(AnalyzerBase):
 
     name = "radon"
     description = "Cyclomatic complexity analyzer"
+    inprocess_module = "radon"
 
     # Complexity thresholds
     COMPLEXITY_GRADES = {
@@ -320,14 +493,8 @@ class RadonAnalyzer(AnalyzerBase):
         "F": "Complex (41+)",
     }
 
-    def is_available(self) -> bool:
-        try:
-            result = run_python_module("radon", ["--version"])
-            return result.returncode == 0
-        except Exception:
-            return False
-
     def run(self, paths: Optional[list[str]] = None) -> AnalyzerResult:
+        timer = _Stopwatch()
         if not self.is_available():
             return AnalyzerResult(
                 tool=self.name,
@@ -335,28 +502,44 @@ class RadonAnalyzer(AnalyzerBase):
                 error="Radon is not installed. Run: pip install radon",
             )
 
+        timer.lap("probe")
         target = paths if paths else [str(self.project_path)]
 
         try:
+            if self.use_inprocess():
+                issues = self._issues_from_results(self._run_inprocess(target))
+                timer.lap("run")
+                return AnalyzerResult(
+                    tool=self.name,
+                    success=True,
+                    issues=issues,
+                    summary={
+                        **self.summarize(issues),
+                        "backend": "inprocess",
+                        "timing_ms": timer.as_dict(),
+                    },
+                )
+
             # Run radon cc (cyclomatic complexity) with JSON output
             result = run_python_module(
                 "radon",
                 ["cc", "-j", "-a"] + target,
                 cwd=str(self.project_path),
             )
+            timer.lap("run")
 
             issues = self.parse_output(result.stdout)
+            timer.lap("parse")
 
             return AnalyzerResult(
                 tool=self.name,
                 success=True,
                 issues=issues,
-                raw_output=result.stdout,
+                raw_output=result.stdout if self.keep_raw_output else "",
                 summary={
-                    "total_functions": len(issues),
-                    "complex_functions": sum(
-                        1 for i in issues if i.code in ("D", "E", "F")
-                    ),
+                    **self.summarize(issues),
+                    "backend": "subprocess",
+                    "timing_ms": timer.as_dict(),
                 },
             )
         except Exception as e:
@@ -366,6 +549,77 @@ class RadonAnalyzer(AnalyzerBase):
                 error=str(e),
             )
 
+    def summarize(self, issues: list[Issue]) -> dict:
+        return {
+            "total_functions": len(issues),
+            "complex_functions": sum(1 for i in issues if i.code in ("D", "E", "F")),
+        }
+
+    def discover_files(self, paths: Optional[list[str]] = None) -> list[Path]:
+        # radon cc walks directories in os.walk order (not sorted), skipping
+        # the excluded and ignored paths from its config
+        from radon.cli.tools import iter_filenames
+
+        config = self._cc_config()
+        target = paths if paths else [str(self.project_path)]
+        return [
+            Path(f)
+            for f in iter_filenames([str(self.project_path / t) for t in target], config.exclude, config.ignore)
+        ]
+
+    def _cc_config(self):
+        """
+        The ``radon cc`` options from the project's config files.
+
+        The CLI reads radon.cfg (or $RADONCFG), ``[tool.radon]`` in
+        pyproject.toml, ``[radon]`` in setup.cfg and ~/.radon.cfg from its
+        working directory, which for the subprocess backend is project_path.
+        """
+        import configparser
+
+        import radon.cli as radon_cli
+        import radon.complexity as cc_mod
+
+        parser = configparser.ConfigParser()
+        for name in (os.getenv("RADONCFG"), "radon.cfg"):
+            if name is not None and (self.project_path / name).exists():
+                with open(self.project_path / name, encoding="utf-8") as handle:
+                    parser.read_file(handle)
+        if radon_cli.TOMLLIB_PRESENT:
+            try:
+                with open(self.project_path / "pyproject.toml", "rb") as handle:
+                    parser.read_dict(radon_cli.tomllib.load(handle).get("tool", {}))
+            except OSError:
+                pass
+        parser.read([self.project_path / "setup.cfg", os.path.expanduser("~/.radon.cfg")])
+
+        def value(key: str, default):
+            if not parser.has_option("radon", key):
+                return default
+            if isinstance(default, bool):
+                return parser.getboolean("radon", key)
+            return parser.get("radon", key)
+
+        return radon_cli.Config(
+            min=value("cc_min", "A").upper(),
+            max=value("cc_max", "F").upper(),
+            exclude=value("exclude", None),
+            ignore=value("ignore", None),
+            order=getattr(cc_mod, value("order", "SCORE").upper(), cc_mod.SCORE),
+            no_assert=value("no_assert", False),
+            show_closures=value("show_closures", False),
+            include_ipynb=value("include_ipynb", False),
+            ipynb_cells=value("ipynb_cells", False),
+        )
+
+    def _run_inprocess(self, target: list[str]) -> dict[str, list[dict]]:
+        """Compute the per-file block dicts of ``radon cc -j`` (same config), without the JSON."""
+        from radon.cli.harvest import CCHarvester
+
+        # The harvester behind radon cc, with the options the CLI reads from config
+        harvester = CCHarvester([str(self.project_path / t) for t in target], self._cc_config())
+        return harvester._to_dicts()
+
     def parse_output(self, output: str) -> list[Issue]:
         if not output.strip():
             return []
@@ -375,9 +629,13 @@ class RadonAnalyzer(AnalyzerBase):
         except json.JSONDecodeError:
             return []
 
+        return self._issues_from_results(data)
+
+    def _issues_from_results(self, data: dict) -> list[Issue]:
         issues = []
         for filename, functions in data.items():
-            if filename == "error":
+            # Files radon failed to parse map to {"error": ...}
+            if filename == "error" or not isinstance(functions, list):
                 continue
 
             for func in functions:
@@ -465,29 +723,160 @@ class CodeAnalyzer:
         analyzer = CodeAnalyzer("/path/to/project")
         result = analyzer.run_all()
         print(result.format_report())
+
+    run_all launches the tools concurrently (at most ``max_workers`` at a
+    time, default one per tool up to the CPU count), so its wall time is
+    close to the slowest tool instead of the sum of all of them.
+
+    ``backend`` picks how radon and vulture run: "auto" (default) calls their
+    library APIs in-process when importable, "subprocess" always shells out,
+    "inprocess" requires the libraries.
+
+    With ``shards`` > 1, each per-file tool runs on that many size-balanced
+    slices of the file list in parallel, one process per slice. The merged
+    result has the same issues and summary as a single run, ordered by file.
+
+    ``keep_raw_output=False`` drops each tool's stdout once it is parsed, so
+    only the Issue objects stay in memory.
+
+    With ``baseline`` set to a baseline file (see ``write_baseline``), every
+    run returns only issues that are not in the baseline.
+
+    With ``cache_dir`` set, per-file tools (ruff, bandit, radon) only run on
+    files whose content, tool version or tool configuration changed since
+    the last run; issues for the other files come from the cache.
     """
 
-    def __init__(self, project_path: str):
+    # Above this many changed files, run the tool on the original targets
+    # instead of passing every file on the command line
+    MAX_EXPLICIT_FILES = 200
+
+    # Smallest number of files worth giving their own shard
+    MIN_SHARD_FILES = 20
+
+    # Tools that report per function/symbol; run_changed keeps only the
+    # findings whose definition overlaps a changed line
+    LINE_SCOPED_TOOLS = ("radon", "vulture")
+
+    def __init__(
+        self,
+        project_path: str,
+        max_workers: Optional[int] = None,
+        cache_dir: Optional[str] = None,
+        backend: str = "auto",
+        shards: Optional[int] = None,
+        keep_raw_output: bool = True,
+        baseline: Optional[str] = None,
+    ):
         self.project_path = Path(project_path)
+        # Tools run as subprocesses, so threads are enough to run them side by side
+        self.max_workers = max_workers
+        self.shards = shards or 1
+        self.cache = AnalysisCache(cache_dir) if cache_dir else None
+        self.baseline_path = baseline
+        self._baseline: Optional[tuple[float, Baseline]] = None
         self.analyzers = {
-            "ruff": RuffAnalyzer(project_path),
-            "bandit": BanditAnalyzer(project_path),
-            "vulture": VultureAnalyzer(project_path),
-            "radon": RadonAnalyzer(project_path),
+            "ruff": RuffAnalyzer(project_path, backend, keep_raw_output),
+            "bandit": BanditAnalyzer(project_path, backend, keep_raw_output),
+            "vulture": VultureAnalyzer(project_path, backend, keep_raw_output),
+            "radon": RadonAnalyzer(project_path, backend, keep_raw_output),
         }
 
     def check_tools(self) -> dict[str, bool]:
         """Check which tools are available."""
         return {name: analyzer.is_available() for name, analyzer in self.analyzers.items()}
 
+    def iter_all(
+        self, paths: Optional[list[str]] = None
+    ) -> Iterator[tuple[str, AnalyzerResult]]:
+        """Run all analyzers concurrently, yielding (name, result) as each one finishes."""
+        return self._iter_concurrently(lambda analyzer: self._run(analyzer, paths))
+
+    def _iter_concurrently(
+        self, task: Callable[[AnalyzerBase], AnalyzerResult]
+    ) -> Iterator[tuple[str, AnalyzerResult]]:
+        workers = self.max_workers or min(len(self.analyzers), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="analyzer") as pool:
+            futures = {
+                pool.submit(task, analyzer): name
+                for name, analyzer in self.analyzers.items()
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
     def run_all(self, paths: Optional[list[str]] = None) -> dict[str, AnalyzerResult]:
         """Run all available analyzers."""
-        results = {}
-
-        for name, analyzer in self.analyzers.items():
-            results[name] = analyzer.run(paths)
-
-        return results
+        results = dict(self.iter_all(paths))
+        return {name: results[name] for name in self.analyzers}
+
+    def run_changed(self, base_ref: str = "HEAD") -> dict[str, AnalyzerResult]:
+        """
+        Run all analyzers on the Python files changed since ``base_ref``.
+
+        Ruff and bandit see only the changed files. Radon and vulture findings
+        are further limited to functions/classes that overlap a changed line.
+        Vulture still scans the whole project, since code is only unused if
+        nothing anywhere references it. Untracked files are not included.
+        """
+        files = changed_python_files(self.project_path, base_ref)
+        if not files:
+            return {
+                name: AnalyzerResult(tool=name, success=True, summary=analyzer.summarize([]))
+                for name, analyzer in self.analyzers.items()
+            }
+
+        ranges = changed_line_ranges(self.project_path, base_ref)
+        paths = [str(f) for f in files]
+
+        def task(analyzer: AnalyzerBase) -> AnalyzerResult:
+            result = self._run(analyzer, paths if analyzer.per_file else None)
+            if analyzer.name in self.LINE_SCOPED_TOOLS and result.success:
+                result = self._limit_to_changes(analyzer, result, ranges)
+            return result
+
+        results = dict(self._iter_concurrently(task))
+        return {name: results[name] for name in self.analyzers}
+
+    def _limit_to_changes(
+        self,
+        analyzer: AnalyzerBase,
+        result: AnalyzerResult,
+        ranges: dict[Path, list[tuple[int, int]]],
+    ) -> AnalyzerResult:
+        """Keep the issues whose enclosing definition overlaps a changed line range."""
+        definitions: dict[Path, dict[int, int]] = {}
+        issues = []
+        for issue in result.issues:
+            path = self._issue_path(issue)
+            changed = ranges.get(path)
+            if not changed:
+                continue
+            if path not in definitions:
+                definitions[path] = definition_ranges(path)
+            end = definitions[path].get(issue.line, issue.line)
+            if any(start <= end and issue.line <= stop for start, stop in changed):
+                issues.append(issue)
+
+        summary = {**result.summary, **analyzer.summarize(issues)}
+        return AnalyzerResult(
+            tool=result.tool,
+            success=True,
+            issues=issues,
+            summary=summary,
+            raw_output=self._filtered_raw_output(result, issues),
+        )
+
+    @staticmethod
+    def _filtered_raw_output(result: AnalyzerResult, issues: list[Issue]) -> str:
+        """``result.raw_output``, or "" once filtering removed issues it still lists."""
+        return result.raw_output if len(issues) == len(result.issues) else ""
+
+    def _issue_path(self, issue: Issue) -> Path:
+        """Resolved path of an issue's file (tools report paths relative to project_path)."""
+        path = Path(issue.file)
+        if not path.is_absolute():
+            path = self.project_path / path
+        return path.resolve()
 
     def run_single(
         self, tool: str, paths: Optional[list[str]] = None
@@ -500,4 +889,156 @@ class CodeAnalyzer:
                 error=f"Unknown tool: {tool}. Available: {list(self.analyzers.keys())}",
             )
 
-        return self.analyzers[tool].run(paths)
+        return self._run(self.analyzers[tool], paths)
+
+    def write_baseline(self, path: Optional[str] = None, paths: Optional[list[str]] = None) -> int:
+        """Record every current issue in a baseline file and return the issue count."""
+        path = path or self.baseline_path
+        if not path:
+            raise ValueError("No baseline path given")
+        results = self._iter_concurrently(lambda analyzer: self._run_unfiltered(analyzer, paths))
+        baseline = Baseline.from_results(str(self.project_path), (result for _, result in results))
+        baseline.save(path)
+        return len(baseline)
+
+    def load_baseline(self) -> Optional[Baseline]:
+        """The configured baseline, reloaded when the file changes on disk."""
+        if not self.baseline_path:
+            return None
+        try:
+            mtime = os.stat(self.baseline_path).st_mtime_ns
+        except FileNotFoundError:
+            # No baseline written yet: everything is new
+            return None
+        if self._baseline is None or self._baseline[0] != mtime:
+            self._baseline = (mtime, Baseline.load(str(self.project_path), self.baseline_path))
+        return self._baseline[1]
+
+    def _run(self, analyzer: AnalyzerBase, paths: Optional[list[str]]) -> AnalyzerResult:
+        result = self._run_unfiltered(analyzer, paths)
+        baseline = self.load_baseline()
+        if baseline is None or not result.success:
+            return result
+
+        issues = baseline.new_issues(result.issues)
+        return AnalyzerResult(
+            tool=result.tool,
+            success=True,
+            issues=issues,
+            raw_output=self._filtered_raw_output(result, issues),
+            summary={
+                **result.summary,
+                **analyzer.summarize(issues),
+                "baseline": {"suppressed": len(result.issues) - len(issues)},
+            },
+        )
+
+    def _run_unfiltered(self, analyzer: AnalyzerBase, paths: Optional[list[str]]) -> AnalyzerResult:
+        if not analyzer.per_file:
+            return analyzer.run(paths)
+        if self.cache is not None:
+            return self._run_incremental(analyzer, paths)
+        return self._run_files(analyzer, paths)
+
+    def _run_files(self, analyzer: AnalyzerBase, paths: Optional[list[str]]) -> AnalyzerResult:
+        """Run a per-file analyzer, sharded when configured and worthwhile."""
+        if self.shards < 2 or not analyzer.is_available():
+            return analyzer.run(paths)
+
+        timer = _Stopwatch()
+        files = analyzer.discover_files(paths)
+        shards = shard_files(files, min(self.shards, len(files) // self.MIN_SHARD_FILES))
+        if len(shards) < 2:
+            return analyzer.run(paths)
+        timer.lap("shard")
+
+        # Shards only run in parallel as separate processes
+        worker = analyzer
+        if analyzer.use_inprocess():
+            worker = type(analyzer)(
+                str(self.project_path), backend="subprocess", keep_raw_output=analyzer.keep_raw_output
+            )
+        with ThreadPoolExecutor(max_workers=len(shards), thread_name_prefix="shard") as pool:
+            results = list(pool.map(lambda shard: worker.run([str(f) for f in shard]), shards))
+        timer.lap("run")
+
+        for result in results:
+            if not result.success:
+                return result
+
+        # Stable sort by the unsharded run's file order keeps each tool's own order within a file
+        position = {f.resolve(): n for n, f in enumerate(files)}
+        issues = sorted(
+            (issue for result in results for issue in result.issues),
+            key=lambda issue: position.get(self._issue_path(issue), len(position)),
+        )
+        timer.lap("merge")
+        return AnalyzerResult(
+            tool=analyzer.name,
+            success=True,
+            issues=issues,
+            # One raw document per shard
+            raw_output="\n".join(result.raw_output for result in results),
+            summary={
+                **analyzer.summarize(issues),
+                "shards": len(shards),
+                "timing_ms": timer.as_dict(),
+            },
+        )
+
+    def _run_incremental(
+        self, analyzer: AnalyzerBase, paths: Optional[list[str]]
+    ) -> AnalyzerResult:
+        """Run ``analyzer`` only on files missing from the cache and merge the results."""
+        timer = _Stopwatch()
+        if not analyzer.is_available():
+            return analyzer.run(paths)
+
+        # Resolved path -> the path the tool is given, in full-run report order
+        files = {f.resolve(): f for f in analyzer.discover_files(paths)}
+        config = self.cache.config_hash(self.project_path)
+        version = analyzer.tool_version
+        keys = {
+            f: self.cache.key(analyzer.name, version, config, str(path), self.cache.file_hash(f))
+            for f, path in files.items()
+        }
+        cached = {f: self.cache.get(analyzer.name, key) for f, key in keys.items()}
+        changed = [f for f in files if cached[f] is None]
+        timer.lap("cache")
+
+        raw_output = ""
+        if changed:
+            if len(changed) > self.MAX_EXPLICIT_FILES:
+                fresh = self._run_files(analyzer, paths)
+            else:
+                fresh = self._run_files(analyzer, [str(files[f]) for f in changed])
+            if not fresh.success:
+                return fresh
+            raw_output = fresh.raw_output
+            timer.lap("run")
+
+            by_file: dict[Path, list[dict]] = {}
+            for issue in fresh.issues:
+                # Keep the file as the tool reported it, so hits match a fresh run
+                by_file.setdefault(self._issue_path(issue), []).append(issue.to_dict())
+            for f in changed:
+                cached[f] = by_file.get(f, [])
+                self.cache.put(analyzer.name, keys[f], cached[f])
+
+        if not paths:
+            self.cache.prune(analyzer.name)
+        self.cache.save()
+
+        issues = [Issue.from_dict(data) for f in files for data in cached[f]]
+        timer.lap("merge")
+        return AnalyzerResult(
+            tool=analyzer.name,
+            success=True,
+            issues=issues,
+            raw_output=raw_output,
+            summary={
+                **analyzer.summarize(issues),
+                "cache": {"hits": len(files) - len(changed), "misses": len(changed)},
+                "timing_ms": timer.as_dict(),
+            },
+        )
@@ -0,0 +1,91 @@
+"""
+Git diff helpers for diff-scoped analysis.
+
+Paths come back resolved, relative to the directory git runs in
+(``--relative``), so they line up with the files the analyzers report.
+Git runs with ``core.quotePath=false`` so non-ASCII names come back as-is.
+"""
+
+import ast
+import codecs
+import re
+import subprocess
+from pathlib import Path
+
+# "@@ -12,3 +14,5 @@" -> new-side start line and (optional) line count
+_HUNK_HEADER = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@", re.MULTILINE)
+
+
+def _git(project_path: Path, args: list[str]) -> str:
+    result = subprocess.run(
+        ["git", "-c", "core.quotePath=false", *args],
+        capture_output=True,
+        encoding="utf-8",
+        errors="surrogateescape",
+        cwd=str(project_path),
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"git {args[0]} failed: {result.stderr.strip()}")
+    return result.stdout
+
+
+def changed_python_files(project_path: Path, base_ref: str) -> list[Path]:
+    """Python files added or modified since ``base_ref`` (deleted files are skipped)."""
+    output = _git(
+        project_path,
+        ["diff", "--name-only", "-z", "--relative", "--diff-filter=d", base_ref, "--", "*.py"],
+    )
+    return sorted((project_path / name).resolve() for name in output.split("\0") if name)
+
+
+def _header_path(name: str) -> str:
+    """
+    The path in a ``+++`` diff header.
+
+    Git ends the header with a tab when the name contains a space, and
+    still C-quotes names with quotes, backslashes or control characters.
+    """
+    name = name.rstrip("\t")
+    if name.startswith('"') and name.endswith('"'):
+        name = codecs.escape_decode(name[1:-1].encode("utf-8", "surrogateescape"))[0].decode(
+            "utf-8", "surrogateescape"
+        )
+    return name
+
+
+def changed_line_ranges(project_path: Path, base_ref: str) -> dict[Path, list[tuple[int, int]]]:
+    """Changed line ranges (inclusive, new-file numbering) per Python file."""
+    output = _git(
+        project_path,
+        [
+            "diff", "-U0", "--relative", "--diff-filter=d",
+            "--src-prefix=a/", "--dst-prefix=b/", base_ref, "--", "*.py",
+        ],
+    )
+    ranges: dict[Path, list[tuple[int, int]]] = {}
+    current = None
+    for line in output.splitlines():
+        if line.startswith("+++ "):
+            name = _header_path(line[4:])
+            current = None if name == "/dev/null" else (project_path / name[2:]).resolve()
+            continue
+        match = _HUNK_HEADER.match(line)
+        if match and current is not None:
+            start = int(match.group(1))
+            count = int(match.group(2)) if match.group(2) is not None else 1
+            # A pure deletion has count 0; treat the line it happened at as touched
+            ranges.setdefault(current, []).append((max(start, 1), start + max(count, 1) - 1))
+    return ranges
+
+
+def definition_ranges(path: Path) -> dict[int, int]:
+    """Map each function/class start line in ``path`` to its last line."""
+    try:
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+    except (OSError, SyntaxError, UnicodeDecodeError):
+        return {}
+    return {
+        node.lineno: node.end_lineno
+        for node in ast.walk(tree)
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+    }
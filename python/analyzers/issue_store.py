@@ -0,0 +1,162 @@
+"""
+Columnar storage for analyzer issues.
+
+A run over a large tree can report 100k+ issues that mostly repeat the same
+few files, codes, tools and messages. ``IssueStore`` keeps one compact array
+per Issue field and interns the strings in lookup tables, so each issue costs
+a handful of bytes. Counting and grouping run over the integer columns, and
+``Issue`` objects are only built for the rows a caller actually reads.
+"""
+
+from array import array
+from collections import Counter
+from collections.abc import Sequence
+from typing import Iterable, Optional, Union
+
+from .analyzer_base import Issue, Severity
+
+_SEVERITIES = list(Severity)
+_SEVERITY_IDS = {severity: i for i, severity in enumerate(_SEVERITIES)}
+
+
+class _Interner:
+    """Two-way table between strings and small integer ids."""
+
+    __slots__ = ("ids", "values")
+
+    def __init__(self):
+        self.ids: dict[str, int] = {}
+        self.values: list[str] = []
+
+    def intern(self, value: str) -> int:
+        index = self.ids.get(value)
+        if index is None:
+            index = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return index
+
+
+class IssueStore(Sequence):
+    """
+    Read-only sequence of issues stored column-wise.
+
+    Behaves like a list of ``Issue`` (len, iteration, indexing, slicing), so it
+    can stand in for ``AnalyzerResult.issues``.
+    """
+
+    def __init__(self, issues: Iterable[Issue] = ()):
+        self._files = _Interner()
+        self._codes = _Interner()
+        self._tools = _Interner()
+        self._messages = _Interner()
+        self._file_ids = array("I")
+        self._lines = array("I")
+        self._columns = array("I")
+        self._code_ids = array("I")
+        self._severity_ids = array("B")
+        self._tool_ids = array("H")
+        self._message_ids = array("I")
+        self._fixable = array("B")
+        # Fix descriptions are rare, so they live in a sparse row -> text map
+        self._fix_descriptions: dict[int, str] = {}
+        for issue in issues:
+            self.append(issue)
+
+    def append(self, issue: Issue) -> None:
+        row = len(self._lines)
+        self._file_ids.append(self._files.intern(issue.file))
+        # Unsigned columns: a missing (None) or negative position is stored as 0
+        self._lines.append(max(issue.line or 0, 0))
+        self._columns.append(max(issue.column or 0, 0))
+        self._code_ids.append(self._codes.intern(issue.code))
+        self._severity_ids.append(_SEVERITY_IDS[issue.severity])
+        self._tool_ids.append(self._tools.intern(issue.tool))
+        self._message_ids.append(self._messages.intern(issue.message))
+        self._fixable.append(issue.fix_available)
+        if issue.fix_description is not None:
+            self._fix_descriptions[row] = issue.fix_description
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Issue, list[Issue]]:
+        if isinstance(index, slice):
+            return [self._issue(row) for row in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("IssueStore index out of range")
+        return self._issue(index)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (IssueStore, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def _issue(self, row: int) -> Issue:
+        return Issue(
+            file=self._files.values[self._file_ids[row]],
+            line=self._lines[row],
+            column=self._columns[row],
+            code=self._codes.values[self._code_ids[row]],
+            message=self._messages.values[self._message_ids[row]],
+            severity=_SEVERITIES[self._severity_ids[row]],
+            tool=self._tools.values[self._tool_ids[row]],
+            fix_available=bool(self._fixable[row]),
+            fix_description=self._fix_descriptions.get(row),
+        )
+
+    # Queries
+
+    def count_by_severity(self) -> dict[str, int]:
+        """Issue count per severity value (severities with no issues are left out)."""
+        counts = {}
+        for severity, index in _SEVERITY_IDS.items():
+            count = self._severity_ids.count(index)
+            if count:
+                counts[severity.value] = count
+        return counts
+
+    def has_severity(self, severity: Severity) -> bool:
+        return _SEVERITY_IDS[severity] in self._severity_ids
+
+    def count_by_file(self) -> dict[str, int]:
+        files = self._files.values
+        return {files[file_id]: count for file_id, count in Counter(self._file_ids).items()}
+
+    def group_by_file(self) -> dict[str, list[int]]:
+        """Row numbers per file, in file order of first appearance."""
+        groups: dict[int, list[int]] = {}
+        for row, file_id in enumerate(self._file_ids):
+            groups.setdefault(file_id, []).append(row)
+        return {self._files.values[file_id]: rows for file_id, rows in groups.items()}
+
+    def group_by_severity(self) -> dict[str, list[int]]:
+        """Row numbers per severity value."""
+        groups: dict[int, list[int]] = {}
+        for row, severity_id in enumerate(self._severity_ids):
+            groups.setdefault(severity_id, []).append(row)
+        return {_SEVERITIES[index].value: rows for index, rows in sorted(groups.items())}
+
+    def head(self, n: int, severity: Optional[Severity] = None) -> list[Issue]:
+        """The first ``n`` issues, optionally only of one severity."""
+        if severity is None:
+            return self[:n]
+        wanted = _SEVERITY_IDS[severity]
+        rows = []
+        for row, severity_id in enumerate(self._severity_ids):
+            if severity_id == wanted:
+                rows.append(row)
+                if len(rows) == n:
+                    break
+        return [self._issue(row) for row in rows]
+
+    def top_files(self, n: int) -> list[tuple[str, int]]:
+        """The ``n`` files with the most issues."""
+        files = self._files.values
+        return [(files[file_id], count) for file_id, count in Counter(self._file_ids).most_common(n)]
+
+    def top_codes(self, n: int) -> list[tuple[str, int]]:
+        """The ``n`` most frequent issue codes."""
+        codes = self._codes.values
+        return [(codes[code_id], count) for code_id, count in Counter(self._code_ids).most_common(n)]
@@ -0,0 +1,131 @@
+"""
+Incremental JSON array reader for analyzer output.
+
+Ruff and bandit print one JSON document with a (possibly huge) array of
+findings. ``iter_array`` reads the document from a stream in chunks and
+yields the array items one by one, so only the current item and a small
+read buffer are held in memory instead of the whole stdout plus its
+parsed tree.
+"""
+
+import json
+from typing import Any, Iterator, Optional, TextIO
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\r\n"
+_DELIMITERS = _WHITESPACE + ",]}"
+
+
+class _Buffer:
+    """Read-ahead buffer over a text stream that drops consumed input."""
+
+    def __init__(self, stream: TextIO, chunk_size: int):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, size: Optional[int] = None) -> bool:
+        """Append at least one more chunk; False at end of stream."""
+        if self.eof:
+            return False
+        chunk = self.stream.read(max(size or 0, self.chunk_size))
+        if not chunk:
+            self.eof = True
+            return False
+        self.text = self.text[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character ("" at end of stream), without consuming it."""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise json.JSONDecodeError(f"Expected {char!r}, found {found!r}", self.text, self.pos)
+        self.pos += 1
+
+    def skip_to(self, char: str) -> bool:
+        """Discard input up to (not including) ``char``; False if it never appears."""
+        while True:
+            index = self.text.find(char, self.pos)
+            if index >= 0:
+                self.pos = index
+                return True
+            self.pos = len(self.text)
+            if not self.fill():
+                return False
+
+    def decode(self) -> Any:
+        """Decode the next complete JSON value, reading more input as needed."""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                # Incomplete value: grow the buffer geometrically so a large
+                # value is re-scanned only O(log n) times
+                if not self.fill(len(self.text) - self.pos):
+                    raise
+                continue
+            # A number is only complete once a delimiter follows it
+            # ("-1" may be the start of "-1.5e10")
+            if (
+                isinstance(value, (int, float))
+                and (end == len(self.text) or self.text[end] not in _DELIMITERS)
+                and self.fill()
+            ):
+                continue
+            self.pos = end
+            return value
+
+
+def iter_array(
+    stream: TextIO,
+    key: Optional[str] = None,
+    chunk_size: int = 1 << 16,
+) -> Iterator[Any]:
+    """
+    Yield the items of a JSON array read incrementally from ``stream``.
+
+    Without ``key`` the document must be an array. With ``key`` it must be an
+    object, and the items of its ``key`` array are yielded (other members are
+    decoded and dropped one at a time). Text before the document, such as a
+    progress line, is skipped. Empty input yields nothing.
+    """
+    buffer = _Buffer(stream, chunk_size)
+    if not buffer.skip_to("[" if key is None else "{"):
+        return
+
+    if key is not None:
+        buffer.expect("{")
+        while buffer.peek() != "}":
+            name = buffer.decode()
+            buffer.expect(":")
+            if name == key and buffer.peek() == "[":
+                break
+            buffer.decode()
+            if buffer.peek() == ",":
+                buffer.pos += 1
+        else:
+            return
+
+    buffer.expect("[")
+    if buffer.peek() == "]":
+        return
+    while True:
+        yield buffer.decode()
+        if buffer.peek() == ",":
+            buffer.pos += 1
+            continue
+        buffer.expect("]")
+        return
@@ -0,0 +1,155 @@
+"""
+On-disk cache of per-file analyzer results.
+
+Issues for a file are stored under a key built from the tool name, the
+tool version, a hash of the project's tool configuration, the file's path
+and a hash of the file content. The path is part of the key because cached
+issues keep the file name the tool reported. A run only needs to invoke a tool on files whose key is not
+in the cache; everything else is served from disk.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+# Bump when the parsed Issue format or the tool arguments change
+CACHE_VERSION = 2
+
+# Project files that can change what a tool reports
+CONFIG_FILES = (
+    "pyproject.toml",
+    "setup.cfg",
+    "tox.ini",
+    "ruff.toml",
+    ".ruff.toml",
+    ".bandit",
+    "radon.cfg",
+)
+
+
+def _write_json(path: Path, data) -> None:
+    """Write JSON atomically so a crashed run never leaves a torn cache file."""
+    tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _read_json(path: Path) -> Optional[dict]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+class AnalysisCache:
+    """
+    Per-file issue cache kept in ``cache_dir``.
+
+    Each tool has its own table file, so analyzers running in parallel never
+    write the same file. Content hashes are memoized by (mtime, size), so
+    unchanged files are not re-read on every run.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._tables: dict[str, dict[str, list[dict]]] = {}
+        self._used: dict[str, set[str]] = {}
+        self._dirty: set[str] = set()
+        self._hashes: Optional[dict[str, list]] = None
+        self._hashes_dirty = False
+
+    # Keys
+
+    def file_hash(self, path: Path) -> str:
+        """Content hash of ``path``, reusing the last hash while mtime and size match."""
+        stat = path.stat()
+        name = str(path)
+        with self._lock:
+            if self._hashes is None:
+                stored = _read_json(self.cache_dir / "files.json") or {}
+                self._hashes = stored.get("files", {}) if stored.get("version") == CACHE_VERSION else {}
+            known = self._hashes.get(name)
+        if known and known[0] == stat.st_mtime_ns and known[1] == stat.st_size:
+            return known[2]
+
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        with self._lock:
+            self._hashes[name] = [stat.st_mtime_ns, stat.st_size, digest]
+            self._hashes_dirty = True
+        return digest
+
+    @staticmethod
+    def config_hash(project_path: Path, extra: str = "") -> str:
+        """Hash of the project's tool configuration files."""
+        digest = hashlib.sha256(extra.encode())
+        for name in CONFIG_FILES:
+            try:
+                content = (project_path / name).read_bytes()
+            except OSError:
+                continue
+            digest.update(name.encode())
+            digest.update(hashlib.sha256(content).digest())
+        return digest.hexdigest()
+
+    @staticmethod
+    def key(tool: str, version: Optional[str], config_hash: str, path: str, content_hash: str) -> str:
+        return hashlib.sha256(
+            f"{CACHE_VERSION}\0{tool}\0{version}\0{config_hash}\0{path}\0{content_hash}".encode()
+        ).hexdigest()
+
+    # Entries
+
+    def _table(self, tool: str) -> dict[str, list[dict]]:
+        table = self._tables.get(tool)
+        if table is None:
+            stored = _read_json(self.cache_dir / f"{tool}.json") or {}
+            table = stored.get("entries", {}) if stored.get("version") == CACHE_VERSION else {}
+            self._tables[tool] = table
+            self._used[tool] = set()
+        return table
+
+    def get(self, tool: str, key: str) -> Optional[list[dict]]:
+        """Cached issue dicts for a key, or None."""
+        with self._lock:
+            entry = self._table(tool).get(key)
+            if entry is not None:
+                self._used[tool].add(key)
+            return entry
+
+    def put(self, tool: str, key: str, issues: list[dict]) -> None:
+        with self._lock:
+            self._table(tool)[key] = issues
+            self._used[tool].add(key)
+            self._dirty.add(tool)
+
+    def prune(self, tool: str) -> int:
+        """Drop entries not read or written since the cache was opened."""
+        with self._lock:
+            table = self._table(tool)
+            stale = [key for key in table if key not in self._used[tool]]
+            for key in stale:
+                del table[key]
+            if stale:
+                self._dirty.add(tool)
+            return len(stale)
+
+    def save(self) -> None:
+        """Write changed tables and the file hash index to disk."""
+        with self._lock:
+            for tool in self._dirty:
+                _write_json(
+                    self.cache_dir / f"{tool}.json",
+                    {"version": CACHE_VERSION, "entries": self._tables[tool]},
+                )
+            self._dirty.clear()
+            if self._hashes_dirty:
+                _write_json(
+                    self.cache_dir / "files.json",
+                    {"version": CACHE_VERSION, "files": self._hashes},
+                )
+                self._hashes_dirty = False
@@ -7,36 +7,217 @@ via subprocess with JSON-based communication.
 
 Usage:
     echo '{"method": "analyzers.check_tools", "params": {}}' | python bridge.py
+
+Batch (many calls in one round trip, one envelope per item):
+    {"method": "batch", "params": {"requests": [
+        {"id": "a", "method": "datetime.slack_to_date", "params": {"ts": "1700000000.0"}},
+        {"id": "b", "method": "privacy.redact", "params": {"text": "..."}}
+    ]}}
+
+Daemon mode (one JSON request per line, one JSON response per line):
+    python bridge.py --serve
+    {"id": 1, "method": "privacy.redact", "params": {"text": "..."}}
+
+In daemon mode requests run concurrently and responses are written as each
+one finishes, so callers must match them by ``id`` rather than by order.
+Methods in STREAM_HANDLERS accept ``"stream": true`` and send partial frames
+(``"partial": true``) before their final response.
+
+Import cost per handler (and the one-shot cold start) can be measured with:
+    python bridge.py --import-profile
 """
 
+# Startup is on the critical path of every one-shot call: only cheap modules
+# are imported here. argparse, traceback, pathlib, multiprocessing and
+# concurrent.futures are imported where they are used.
+import contextvars
 import json
+import os
 import sys
+import threading
 import time
-import traceback
-from pathlib import Path
-from typing import Any, Dict
+from collections import defaultdict, deque
+from typing import Any, Callable, Dict, Iterator, Optional
 
 # Add current directory to path for local imports
-BRIDGE_ROOT = Path(__file__).parent.resolve()
-sys.path.insert(0, str(BRIDGE_ROOT))
+BRIDGE_ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BRIDGE_ROOT)
 
 # Also add SpineHUB root if available (for development)
 # Configurable via SPINEHUB_ROOT env var, falls back to default location
-import os
-_spinehub_root = os.environ.get("SPINEHUB_ROOT", str(Path.home() / "SpineHUB"))
-SPINEHUB_ROOT = Path(_spinehub_root)
-if SPINEHUB_ROOT.exists():
-    sys.path.insert(0, str(SPINEHUB_ROOT))
-    sys.path.insert(0, str(SPINEHUB_ROOT / "src"))
-    sys.path.insert(0, str(SPINEHUB_ROOT / "modules"))
+SPINEHUB_ROOT = os.environ.get("SPINEHUB_ROOT", os.path.join(os.path.expanduser("~"), "SpineHUB"))
+if os.path.isdir(SPINEHUB_ROOT):
+    sys.path.insert(0, SPINEHUB_ROOT)
+    sys.path.insert(0, os.path.join(SPINEHUB_ROOT, "src"))
+    sys.path.insert(0, os.path.join(SPINEHUB_ROOT, "modules"))
+
+
+def _freeze(value: Any) -> Any:
+    """Turn constructor arguments into a hashable registry key."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, os.PathLike):
+        return os.fspath(value)
+    return value
+
+
+class InstanceRegistry:
+    """
+    Reuses handler objects across bridge calls.
+
+    Instances are keyed by their class and constructor arguments, so repeated
+    calls skip setup (such as re-reading .env) and keep whatever the object
+    has cached. Objects that keep per-call state are requested with
+    ``per_thread=True`` and get one instance per worker thread. Entries idle
+    for longer than ``idle_ttl`` seconds (measured with ``clock``) are dropped
+    on the next lookup.
+    """
+
+    def __init__(self, idle_ttl: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        self.idle_ttl = idle_ttl
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._entries: Dict[tuple, list] = {}  # key -> [instance, last_used]
+
+    def get(self, factory, *args, per_thread: bool = False, **kwargs) -> Any:
+        """Return the cached instance for these arguments, creating it if needed."""
+        key = (factory.__module__, factory.__qualname__, _freeze(args), _freeze(kwargs))
+        if per_thread:
+            key += (threading.get_ident(),)
+
+        now = self.clock()
+        with self._lock:
+            self._evict_idle(now)
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry[1] = now
+                return entry[0]
+
+        instance = factory(*args, **kwargs)
+        with self._lock:
+            return self._entries.setdefault(key, [instance, now])[0]
+
+    def invalidate(self, factory) -> None:
+        """Drop every cached instance of ``factory``."""
+        with self._lock:
+            for key in [k for k in self._entries if k[:2] == (factory.__module__, factory.__qualname__)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict_idle(self, now: float) -> None:
+        if self.idle_ttl is None:
+            return
+        for key in [k for k, (_, used) in self._entries.items() if now - used > self.idle_ttl]:
+            del self._entries[key]
+
+
+# Handler objects shared by every call in this process
+_INSTANCES = InstanceRegistry()
+
+# Set while handling a request that asked for a compact response
+_COMPACT = contextvars.ContextVar("compact", default=False)
+
+# Methods whose result depends only on their params. The value is a TTL in
+# seconds for methods that also read the clock, or None for no expiry.
+CACHEABLE_METHODS = {
+    "linear.list_templates": None,
+    "linear.get_template": None,
+    "linear.apply_template": 60,  # fills {{date}} with today's date
+    "datetime.slack_to_date": None,
+    "datetime.default_range": 60,
+    "datetime.parse_range": 60,  # open ends default to today
+    "privacy.redact": None,
+    "quality.validate": None,
+}
 
 
-def handle_analyzers(method: str, params: Dict[str, Any]) -> Any:
-    """Handle analyzer-related calls."""
+class ResultCache:
+    """
+    LRU cache of handler results keyed by ``(method, canonicalized params)``.
+
+    Only CACHEABLE_METHODS are stored. Entries expire after their method's TTL
+    (measured with ``clock``) and the least recently used entry is dropped
+    once ``max_size`` is reached.
+    """
+
+    def __init__(self, max_size: int = 1024, clock: Callable[[], float] = time.monotonic):
+        from collections import OrderedDict
+
+        self.max_size = max_size
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (expires_at, result)
+
+    @staticmethod
+    def key(method: str, params: Dict[str, Any]) -> tuple:
+        return method, json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+
+    def get(self, key: tuple) -> tuple:
+        """Return ``(found, result)`` and count the lookup as a hit or miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry[0] is None or entry[0] > self.clock()):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key: tuple, result: Any) -> None:
+        ttl = CACHEABLE_METHODS[key[0]]
+        expires_at = None if ttl is None else self.clock() + ttl
+        with self._lock:
+            self._entries[key] = (expires_at, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def stats(self, hit: Optional[bool] = None) -> Dict[str, Any]:
+        stats = {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+        if hit is not None:
+            stats["hit"] = hit
+        return stats
+
+
+# Opt-in result cache (enabled by serve(cache_size=...) / --cache-size)
+_RESULT_CACHE: Optional[ResultCache] = None
+
+# Methods already called in this process; a method's first call is "cold"
+_WARM_METHODS = set()
+
+
+def _code_analyzer(params: Dict[str, Any]):
+    """Shared CodeAnalyzer for a project and its run options."""
     from analyzers.code_analyzer import CodeAnalyzer
 
-    project_path = params.get("project_path", ".")
-    analyzer = CodeAnalyzer(Path(project_path))
+    return _INSTANCES.get(
+        CodeAnalyzer,
+        params.get("project_path", "."),
+        max_workers=params.get("max_workers"),
+        cache_dir=params.get("cache_dir"),
+        backend=params.get("backend", "auto"),
+        shards=params.get("shards"),
+        # Compact responses drop raw_output anyway, so don't keep it in memory
+        keep_raw_output=not _COMPACT.get(),
+        baseline=params.get("baseline"),
+    )
+
+
+def handle_analyzers(method: str, params: Dict[str, Any]) -> Any:
+    """Handle analyzer-related calls."""
+    analyzer = _code_analyzer(params)
 
     if method == "analyzers.check_tools":
         return analyzer.check_tools()
@@ -46,15 +227,7 @@ def handle_analyzers(method: str, params: Dict[str, Any]) -> Any:
         result = analyzer.run_all(paths)
         return {
             "results": {k: _serialize_analyzer_result(v) for k, v in result.items()},
-            "total_issues": sum(len(r.issues) for r in result.values()),
-            "has_errors": any(
-                any(i.severity.value == "error" for i in r.issues)
-                for r in result.values()
-            ),
-            "has_security_issues": any(
-                any(i.severity.value == "security" for i in r.issues)
-                for r in result.values()
-            ),
+            **_summarize_analyzer_results(result),
         }
 
     elif method == "analyzers.run_single":
@@ -63,18 +236,62 @@ def handle_analyzers(method: str, params: Dict[str, Any]) -> Any:
         result = analyzer.run_single(tool, paths)
         return _serialize_analyzer_result(result)
 
+    elif method == "analyzers.write_baseline":
+        path = params.get("baseline")
+        return {"baseline": path, "issues": analyzer.write_baseline(path, params.get("paths"))}
+
+    elif method == "analyzers.run_changed":
+        result = analyzer.run_changed(params.get("base_ref", "HEAD"))
+        return {
+            "results": {k: _serialize_analyzer_result(v) for k, v in result.items()},
+            **_summarize_analyzer_results(result),
+        }
+
     raise ValueError(f"Unknown analyzer method: {method}")
 
 
+def stream_analyzers_run_all(params: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Streamed analyzers.run_all: yield one frame per finished analyzer.
+
+    With ``chunk_size``, a tool's issues are split over several frames and
+    only the last one (``"done": true``) carries its summary and status. The
+    generator returns the run summary used for the final response.
+    """
+    analyzer = _code_analyzer(params)
+    chunk_size = params.get("chunk_size")
+    results = {}
+
+    for name, result in analyzer.iter_all(params.get("paths")):
+        results[name] = result
+        data = _serialize_analyzer_result(result)
+        issues = data.pop("issues")
+
+        if chunk_size:
+            chunks = [issues[i:i + chunk_size] for i in range(0, len(issues), chunk_size)] or [[]]
+            for chunk in chunks[:-1]:
+                yield {"tool": name, "issues": chunk, "done": False}
+            issues = chunks[-1]
+
+        yield {**data, "issues": issues, "done": True}
+
+    return {"tools": list(results), **_summarize_analyzer_results(results)}
+
+
 def handle_quality(method: str, params: Dict[str, Any]) -> Any:
     """Handle quality validation calls."""
     from spinehub.benchmark import QualityValidator
 
-    validator = QualityValidator()
+    # QualityValidator keeps the last run's results, so each thread gets its own
+    validator = _INSTANCES.get(QualityValidator, per_thread=True)
 
     if method == "quality.validate":
         content = params["content"]
-        passed, report = validator.validate(content)
+        if params.get("incremental"):
+            # Per-thread validator, so its section cache follows the caller's edits
+            passed, report = validator.validate_incremental(content)
+        else:
+            passed, report = validator.validate(content)
         return {
             "passed": passed,
             "score": report.score,
@@ -86,9 +303,11 @@ def handle_quality(method: str, params: Dict[str, Any]) -> Any:
         }
 
     elif method == "quality.validate_file":
+        from pathlib import Path
+
         file_path = Path(params["file_path"])
-        content = file_path.read_text(encoding="utf-8")
-        passed, report = validator.validate(content)
+        # Reads the file in chunks, so large reports are never loaded whole
+        passed, report = validator.validate_stream(file_path)
         return {
             "passed": passed,
             "score": report.score,
@@ -100,14 +319,48 @@ def handle_quality(method: str, params: Dict[str, Any]) -> Any:
             "file": str(file_path),
         }
 
+    elif method == "quality.validate_batch":
+        stream = stream_quality_validate_batch(params)
+        reports = []
+        while True:
+            try:
+                reports.append(next(stream))
+            except StopIteration as done:
+                return {"reports": reports, "scorecard": done.value}
+
     raise ValueError(f"Unknown quality method: {method}")
 
 
+def stream_quality_validate_batch(params: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Streamed quality.validate_batch: yield one frame per document, in input order.
+
+    ``paths`` are worklog files and ``texts`` inline documents; they are
+    validated across a process pool of ``processes`` workers. The generator
+    returns the batch scorecard used for the final response.
+    """
+    from pathlib import Path
+
+    from spinehub.benchmark import QualityValidator, Scorecard
+
+    validator = _INSTANCES.get(QualityValidator, per_thread=True)
+    items = [Path(p) for p in params.get("paths", [])] + list(params.get("texts", []))
+    scorecard = Scorecard()
+
+    for item in validator.validate_many(items, processes=params.get("processes")):
+        scorecard.add(item)
+        yield _serialize_batch_item(item)
+
+    return scorecard.to_dict(params.get("top", 5))
+
+
 def handle_credentials(method: str, params: Dict[str, Any]) -> Any:
     """Handle credentials management calls."""
     from credentials.manager import CredentialsManager
 
-    cm = CredentialsManager()
+    if params.get("reload"):
+        _INSTANCES.invalidate(CredentialsManager)
+    cm = _INSTANCES.get(CredentialsManager)
 
     if method == "credentials.status":
         return cm.get_all_status()
@@ -116,6 +369,8 @@ def handle_credentials(method: str, params: Dict[str, Any]) -> Any:
         return cm.get_mcp_status()
 
     elif method == "credentials.copy":
+        from pathlib import Path
+
         target = Path(params["target"])
         services = params.get("services")
         return cm.copy_to_project(target, services)
@@ -161,12 +416,12 @@ def handle_linear(method: str, params: Dict[str, Any]) -> Any:
 
 def handle_privacy(method: str, params: Dict[str, Any]) -> Any:
     """Handle privacy/PII redaction calls."""
-    from utils.privacy import redact_pii, RedactionConfig
+    from utils.privacy import get_redactor, RedactionConfig
 
     if method == "privacy.redact":
         config_dict = params.get("config", {})
         config = RedactionConfig(**config_dict)
-        result = redact_pii(params["text"], config)
+        result = get_redactor(config).redact(params["text"])
         return {
             "text": result.text,
             "redacted_count": result.redacted_count,
@@ -175,10 +430,10 @@ def handle_privacy(method: str, params: Dict[str, Any]) -> Any:
 
     elif method == "privacy.redact_batch":
         config_dict = params.get("config", {})
-        config = RedactionConfig(**config_dict)
+        redactor = get_redactor(RedactionConfig(**config_dict))
         results = []
         for text in params["texts"]:
-            result = redact_pii(text, config)
+            result = redactor.redact(text)
             results.append({
                 "text": result.text,
                 "redacted_count": result.redacted_count,
@@ -244,7 +499,8 @@ def handle_slack(method: str, params: Dict[str, Any]) -> Any:
     """Handle Slack channel mapper calls."""
     from utils.slack_channels import SlackChannelMapper, ChannelInfo
 
-    mapper = SlackChannelMapper(
+    mapper = _INSTANCES.get(
+        SlackChannelMapper,
         token=params.get("token"),
         company_domain=params.get("company_domain", "@testbox.com"),
         channel_prefixes=params.get("channel_prefixes")
@@ -283,10 +539,66 @@ def handle_slack(method: str, params: Dict[str, Any]) -> Any:
     raise ValueError(f"Unknown slack method: {method}")
 
 
+def handle_batch(method: str, params: Dict[str, Any]) -> Any:
+    """
+    Handle a batch of calls in one round trip.
+
+    Each item is ``{"id", "method", "params"}`` and is answered with its own
+    response envelope, so one failing item does not fail the batch.
+    """
+    if method != "batch":
+        raise ValueError(f"Unknown batch method: {method}")
+
+    requests = params.get("requests")
+    if not isinstance(requests, list):
+        raise ValueError("batch requires a 'requests' list")
+
+    results = []
+    for item in requests:
+        if isinstance(item, dict) and item.get("method") == "batch":
+            # Rejected before running anything, so there is no traceback to report
+            response = {
+                "success": False,
+                "error": "Nested batch requests are not supported",
+                "execution_time_ms": 0,
+            }
+        else:
+            response = handle_request(item)
+        response["id"] = item.get("id") if isinstance(item, dict) else None
+        results.append(response)
+
+    return results
+
+
+def handle_bridge(method: str, params: Dict[str, Any]) -> Any:
+    """Handle calls about the bridge process itself."""
+    if method == "bridge.stats":
+        # Only report redactors once utils.privacy is loaded; the module may
+        # still be importing in another thread, so REDACTORS can be missing
+        redactors = getattr(sys.modules.get("utils.privacy"), "REDACTORS", None)
+        return {
+            **_METRICS.snapshot(),
+            "cache": _RESULT_CACHE.stats() if _RESULT_CACHE is not None else None,
+            "instances": len(_INSTANCES),
+            "redactors": redactors.stats() if redactors is not None else None,
+        }
+
+    raise ValueError(f"Unknown bridge method: {method}")
+
+
 # Serialization helpers
+def _summarize_analyzer_results(results) -> Dict[str, Any]:
+    """Totals across a dict of AnalyzerResult."""
+    return {
+        "total_issues": sum(len(r.issues) for r in results.values()),
+        "has_errors": any(r.has_errors for r in results.values()),
+        "has_security_issues": any(r.has_security_issues for r in results.values()),
+    }
+
+
 def _serialize_analyzer_result(result) -> Dict[str, Any]:
     """Serialize AnalyzerResult to dict."""
-    return {
+    data = {
         "tool": result.tool,
         "success": result.success,
         "issues": [_serialize_issue(i) for i in result.issues],
@@ -294,6 +606,10 @@ def _serialize_analyzer_result(result) -> Dict[str, Any]:
         "raw_output": result.raw_output,
         "error": result.error,
     }
+    # Compact responses skip the tool's full stdout, which dominates payload size
+    if _COMPACT.get():
+        del data["raw_output"]
+    return data
 
 
 def _serialize_issue(issue) -> Dict[str, Any]:
@@ -311,6 +627,25 @@ def _serialize_issue(issue) -> Dict[str, Any]:
     }
 
 
+def _serialize_batch_item(item) -> Dict[str, Any]:
+    """Convert a quality BatchResult to a JSON-serializable dict."""
+    data: Dict[str, Any] = {"index": item.index}
+    if item.source is not None:
+        data["file"] = item.source
+    if item.report is None:
+        data["error"] = item.error
+        return data
+    data.update({
+        "passed": item.passed,
+        "score": item.report.score,
+        "status": item.report.status,
+        "errors": item.report.errors,
+        "warnings": item.report.warnings,
+        "info": item.report.info,
+    })
+    return data
+
+
 def _serialize_template(template) -> Dict[str, Any]:
     """Serialize IssueTemplate to dict."""
     return {
@@ -335,20 +670,53 @@ HANDLERS = {
     "privacy": handle_privacy,
     "datetime": handle_datetime,
     "slack": handle_slack,
+    "batch": handle_batch,
+    "bridge": handle_bridge,
 }
 
+# Methods that can send partial results when called with "stream": true
+STREAM_HANDLERS = {
+    "analyzers.run_all": stream_analyzers_run_all,
+    "quality.validate_batch": stream_quality_validate_batch,
+}
 
-def main():
-    """Main entry point for bridge."""
+
+def _error_response(
+    error: Exception, start_time: float, compact: Optional[bool] = None
+) -> Dict[str, Any]:
+    """Build the failure envelope for an exception."""
+    response = {
+        "success": False,
+        "error": str(error),
+        "execution_time_ms": int((time.time() - start_time) * 1000)
+    }
+    if not (_COMPACT.get() if compact is None else compact):
+        import traceback
+
+        response["traceback"] = traceback.format_exc()
+    return response
+
+
+def handle_request(request: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Route a decoded request to its handler and wrap the result in the response envelope.
+
+    A request with ``"compact": true`` gets an envelope without ``traceback``
+    and analyzer results without ``raw_output``. Batch items inherit the
+    setting of their batch.
+
+    When the result cache is enabled, CACHEABLE_METHODS are answered from it
+    and their envelope carries a ``cache`` entry with hit/miss counters. A
+    request with ``"cache": false`` bypasses the cache. The first call of a
+    method in this process is marked ``"cold": true``.
+    """
     start_time = time.time()
+    compact = request.get("compact", _COMPACT.get()) if isinstance(request, dict) else _COMPACT.get()
+    token = _COMPACT.set(bool(compact))
 
     try:
-        # Read input from stdin
-        input_data = sys.stdin.read()
-        if not input_data.strip():
-            raise ValueError("No input provided")
-
-        request = json.loads(input_data)
+        if not isinstance(request, dict):
+            raise ValueError("Request must be a JSON object")
 
         method = request.get("method")
         params = request.get("params", {})
@@ -363,22 +731,734 @@ def main():
         if not handler:
             raise ValueError(f"Unknown module: {module}. Available: {list(HANDLERS.keys())}")
 
-        result = handler(method, params)
+        cold = method not in _WARM_METHODS
+        _WARM_METHODS.add(method)
 
-        response = {
+        cache = _RESULT_CACHE
+        if cache is None or method not in CACHEABLE_METHODS or request.get("cache") is False:
+            response = {
+                "success": True,
+                "data": handler(method, params),
+                "execution_time_ms": int((time.time() - start_time) * 1000)
+            }
+        else:
+            key = cache.key(method, params)
+            hit, result = cache.get(key)
+            if not hit:
+                result = handler(method, params)
+                cache.put(key, result)
+
+            response = {
+                "success": True,
+                "data": result,
+                "execution_time_ms": int((time.time() - start_time) * 1000),
+                "cache": cache.stats(hit),
+            }
+
+        if cold:
+            response["cold"] = True
+        return response
+
+    except Exception as e:
+        return _error_response(e, start_time)
+
+    finally:
+        _COMPACT.reset(token)
+
+
+def handle_stream_request(request: Dict[str, Any], emit) -> Dict[str, Any]:
+    """
+    Run a streamed request, passing each partial result to ``emit``.
+
+    Partial frames look like ``{"success": true, "partial": true, "data": ...}``.
+    The returned final envelope carries the stream's summary as ``data``.
+    """
+    start_time = time.time()
+    token = _COMPACT.set(bool(request.get("compact", _COMPACT.get())))
+
+    try:
+        stream = STREAM_HANDLERS[request["method"]](request.get("params", {}))
+        while True:
+            try:
+                partial = next(stream)
+            except StopIteration as done:
+                result = done.value
+                break
+            emit({"success": True, "partial": True, "data": partial})
+
+        return {
             "success": True,
             "data": result,
             "execution_time_ms": int((time.time() - start_time) * 1000)
         }
 
     except Exception as e:
-        response = {
-            "success": False,
-            "error": str(e),
-            "traceback": traceback.format_exc(),
-            "execution_time_ms": int((time.time() - start_time) * 1000)
+        return _error_response(e, start_time)
+
+    finally:
+        _COMPACT.reset(token)
+
+
+class JsonLinesTransport:
+    """Newline-delimited JSON frames on text streams (the default wire format)."""
+
+    def __init__(self, stdin=None, stdout=None):
+        self.stdin = stdin or sys.stdin
+        self.stdout = stdout or sys.stdout
+
+    def frames(self) -> Iterator[str]:
+        for line in iter(self.stdin.readline, ""):
+            if line.strip():
+                yield line
+
+    def decode(self, frame: str) -> Any:
+        return json.loads(frame)
+
+    def frame_size(self, frame: str) -> int:
+        """Bytes the frame took on the wire (``write`` counts the same way)."""
+        return len(frame.encode("utf-8", "surrogateescape"))
+
+    def write(self, message: Dict[str, Any]) -> int:
+        line = json.dumps(message, default=str, ensure_ascii=False) + "\n"
+        self.stdout.write(line)
+        self.stdout.flush()
+        return len(line.encode("utf-8"))
+
+
+class MsgpackTransport:
+    """
+    Length-prefixed MessagePack frames on binary streams.
+
+    Each frame is a 4-byte big-endian length followed by that many bytes of
+    MessagePack. Requires the optional ``msgpack`` package.
+    """
+
+    # Longer frames are rejected before their body is read into memory
+    MAX_FRAME_BYTES = 256 * 1024 * 1024
+
+    def __init__(self, stdin=None, stdout=None):
+        import struct
+
+        try:
+            import msgpack
+        except ImportError:
+            raise RuntimeError("MessagePack framing requires msgpack. Run: pip install msgpack")
+
+        self.HEADER = struct.Struct(">I")
+        self._msgpack = msgpack
+        self.stdin = stdin or sys.stdin.buffer
+        self.stdout = stdout or sys.stdout.buffer
+
+    def frames(self) -> Iterator[bytes]:
+        while True:
+            header = self._read_exact(self.HEADER.size)
+            if not header:
+                return
+            (length,) = self.HEADER.unpack(header)
+            if length > self.MAX_FRAME_BYTES:
+                raise ValueError(
+                    f"MessagePack frame of {length} bytes exceeds the {self.MAX_FRAME_BYTES} byte limit"
+                )
+            yield self._read_exact(length)
+
+    def decode(self, frame: bytes) -> Any:
+        return self._msgpack.unpackb(frame, raw=False)
+
+    def frame_size(self, frame: bytes) -> int:
+        """Bytes the frame took on the wire, header included (as ``write`` counts)."""
+        return self.HEADER.size + len(frame)
+
+    def write(self, message: Dict[str, Any]) -> int:
+        payload = self._msgpack.packb(message, default=str, use_bin_type=True)
+        self.stdout.write(self.HEADER.pack(len(payload)) + payload)
+        self.stdout.flush()
+        return self.HEADER.size + len(payload)
+
+    def _read_exact(self, size: int) -> bytes:
+        chunks = []
+        remaining = size
+        while remaining:
+            chunk = self.stdin.read(remaining)
+            if not chunk:
+                if chunks:
+                    raise EOFError("Truncated MessagePack frame")
+                return b""
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b"".join(chunks)
+
+
+TRANSPORTS = {
+    "json": JsonLinesTransport,
+    "msgpack": MsgpackTransport,
+}
+
+
+# Methods that run in the process pool; everything else runs in the thread pool
+HEAVY_METHODS = {
+    "analyzers.run_all",
+    "analyzers.run_single",
+    "analyzers.run_changed",
+    "analyzers.write_baseline",
+    "privacy.redact_batch",
+    "quality.validate_file",
+}
+
+# Maximum number of in-flight calls per method (unlisted methods are unbounded)
+METHOD_LIMITS = {
+    "analyzers.run_all": 1,
+    "analyzers.run_single": 2,
+    "analyzers.run_changed": 1,
+    "analyzers.write_baseline": 1,
+    # Fans out over its own process pool, so batches don't run side by side
+    "quality.validate_batch": 1,
+}
+
+
+def _init_worker(idle_ttl: Optional[float]) -> None:
+    """Apply the daemon's registry settings inside a process-pool worker."""
+    _INSTANCES.idle_ttl = idle_ttl
+
+
+def _is_heavy(request: Dict[str, Any]) -> bool:
+    """Whether a request (or any item of a batch) belongs in the process pool."""
+    if request.get("method") == "batch":
+        items = (request.get("params") or {}).get("requests") or []
+        return any(isinstance(i, dict) and i.get("method") in HEAVY_METHODS for i in items)
+    return request.get("method") in HEAVY_METHODS
+
+
+class BridgeMetrics:
+    """
+    Per-method call statistics for the daemon.
+
+    Keeps counters, a latency histogram with fixed buckets, and a window of
+    recent latency and queue-wait samples for p50/p95/p99.
+    """
+
+    LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+    SAMPLE_WINDOW = 1024
+
+    def __init__(self):
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        self._methods: Dict[str, Dict[str, Any]] = {}
+
+    def record(
+        self,
+        method: str,
+        latency_ms: float,
+        queue_ms: float,
+        success: bool,
+        cold: bool,
+        bytes_in: int,
+        bytes_out: int,
+    ) -> None:
+        with self._lock:
+            stats = self._methods.get(method)
+            if stats is None:
+                stats = self._methods[method] = {
+                    "calls": 0,
+                    "errors": 0,
+                    "cold_calls": 0,
+                    "bytes_in": 0,
+                    "bytes_out": 0,
+                    "histogram": [0] * (len(self.LATENCY_BUCKETS_MS) + 1),
+                    "latency": deque(maxlen=self.SAMPLE_WINDOW),
+                    "queue_wait": deque(maxlen=self.SAMPLE_WINDOW),
+                }
+            stats["calls"] += 1
+            stats["errors"] += 0 if success else 1
+            stats["cold_calls"] += 1 if cold else 0
+            stats["bytes_in"] += bytes_in
+            stats["bytes_out"] += bytes_out
+            stats["histogram"][self._bucket(latency_ms)] += 1
+            stats["latency"].append(latency_ms)
+            stats["queue_wait"].append(queue_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current statistics as plain JSON-serializable data."""
+        labels = [f"<={b}ms" for b in self.LATENCY_BUCKETS_MS] + [f">{self.LATENCY_BUCKETS_MS[-1]}ms"]
+        with self._lock:
+            methods = {
+                method: {
+                    "calls": stats["calls"],
+                    "errors": stats["errors"],
+                    "cold_calls": stats["cold_calls"],
+                    "warm_calls": stats["calls"] - stats["cold_calls"],
+                    "bytes_in": stats["bytes_in"],
+                    "bytes_out": stats["bytes_out"],
+                    "latency_ms": self._percentiles(stats["latency"]),
+                    "queue_wait_ms": self._percentiles(stats["queue_wait"]),
+                    "histogram": {label: n for label, n in zip(labels, stats["histogram"]) if n},
+                }
+                for method, stats in sorted(self._methods.items())
+            }
+        return {
+            "uptime_s": round(time.time() - self.started_at, 1),
+            "calls": sum(m["calls"] for m in methods.values()),
+            "methods": methods,
         }
 
+    def _bucket(self, latency_ms: float) -> int:
+        for i, bound in enumerate(self.LATENCY_BUCKETS_MS):
+            if latency_ms <= bound:
+                return i
+        return len(self.LATENCY_BUCKETS_MS)
+
+    @staticmethod
+    def _percentiles(samples) -> Dict[str, float]:
+        if not samples:
+            return {}
+        ordered = sorted(samples)
+
+        def rank(p: float) -> float:
+            return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+        return {
+            "p50": rank(0.50),
+            "p95": rank(0.95),
+            "p99": rank(0.99),
+            "max": ordered[-1],
+        }
+
+
+# Daemon statistics (reported by bridge.stats)
+_METRICS = BridgeMetrics()
+
+
+class _Call:
+    """A request in flight, with the bookkeeping needed for metrics."""
+
+    __slots__ = ("request", "received", "bytes_in", "bytes_out")
+
+    def __init__(self, request: Dict[str, Any], bytes_in: int = 0):
+        self.request = request
+        self.received = time.time()
+        self.bytes_in = bytes_in
+        self.bytes_out = 0
+
+    @property
+    def method(self) -> Optional[str]:
+        return self.request.get("method")
+
+
+class Dispatcher:
+    """
+    Runs bridge requests concurrently and writes each response when it is ready.
+
+    Light methods go to a thread pool and HEAVY_METHODS to a process pool.
+    Calls beyond a method's limit wait in a per-method queue and start as
+    earlier calls of the same method finish. Every answered call is recorded
+    in _METRICS.
+    """
+
+    def __init__(
+        self,
+        transport,
+        threads: Optional[int] = None,
+        processes: Optional[int] = None,
+        limits: Optional[Dict[str, int]] = None,
+        idle_ttl: Optional[float] = None,
+    ):
+        from concurrent.futures import ThreadPoolExecutor
+
+        self._transport = transport
+        self._processes = processes
+        self._idle_ttl = idle_ttl
+        self._limits = {**METHOD_LIMITS, **(limits or {})}
+        self._threads = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="bridge")
+        self._process_pool = None
+        self._write_lock = threading.Lock()
+        self._lock = threading.Condition()
+        self._active: Dict[str, int] = defaultdict(int)
+        self._pending: Dict[str, deque] = defaultdict(deque)
+        self._in_flight = 0
+        # Set once a write fails because nobody reads the output any more
+        self.output_closed = threading.Event()
+
+    def write(self, response: Dict[str, Any]) -> int:
+        """
+        Write a response without interleaving with other workers; returns bytes written.
+
+        A broken output stream (e.g. the parent closed its end of the pipe)
+        sets ``output_closed`` and later writes are dropped.
+        """
+        with self._write_lock:
+            if self.output_closed.is_set():
+                return 0
+            try:
+                return self._transport.write(response)
+            except OSError:
+                self.output_closed.set()
+                return 0
+
+    def submit(self, request: Dict[str, Any], bytes_in: int = 0) -> None:
+        """Schedule a request, or queue it if its method is at its limit."""
+        call = _Call(request, bytes_in)
+        limit = self._limits.get(call.method)
+
+        with self._lock:
+            self._in_flight += 1
+            if limit is not None and self._active[call.method] >= limit:
+                self._pending[call.method].append(call)
+                return
+            self._active[call.method] += 1
+
+        self._start(call)
+
+    def close(self) -> None:
+        """Wait for every submitted request to be answered, then stop the pools."""
+        with self._lock:
+            self._lock.wait_for(lambda: self._in_flight == 0)
+
+        self._threads.shutdown(wait=True)
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=True)
+
+    def _get_process_pool(self):
+        if self._process_pool is None:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            # spawn keeps workers independent of the dispatcher threads (and matches Windows)
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self._processes,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self._idle_ttl,),
+            )
+        return self._process_pool
+
+    def _start(self, call: _Call) -> None:
+        request = call.request
+        try:
+            if request.get("stream") and call.method in STREAM_HANDLERS:
+                # Partial frames are written from this process, so streams run in a thread
+                future = self._threads.submit(
+                    handle_stream_request, request, lambda frame: self._write_partial(call, frame)
+                )
+            elif _is_heavy(request):
+                future = self._get_process_pool().submit(handle_request, request)
+            else:
+                future = self._threads.submit(handle_request, request)
+        except Exception as e:
+            self._finish(call, None, error=e)
+            return
+
+        future.add_done_callback(lambda f: self._finish(call, f))
+
+    def _write_partial(self, call: _Call, frame: Dict[str, Any]) -> None:
+        frame["id"] = call.request.get("id")
+        call.bytes_out += self.write(frame)
+
+    def _finish(self, call: _Call, future, error: Optional[Exception] = None) -> None:
+        start_time = time.time()
+        try:
+            if error is not None:
+                raise error
+            response = future.result()
+        except Exception as e:
+            response = _error_response(e, start_time)
+
+        response["id"] = call.request.get("id")
+        try:
+            call.bytes_out += self.write(response)
+
+            total_ms = (time.time() - call.received) * 1000
+            _METRICS.record(
+                call.method,
+                latency_ms=response["execution_time_ms"],
+                queue_ms=max(0.0, round(total_ms - response["execution_time_ms"], 1)),
+                success=response["success"],
+                cold=response.get("cold", False),
+                bytes_in=call.bytes_in,
+                bytes_out=call.bytes_out,
+            )
+        finally:
+            # Always release the call, or close() would wait for it forever
+            next_call = None
+            with self._lock:
+                pending = self._pending[call.method]
+                if self.output_closed.is_set():
+                    # Nobody can read the answers, so queued calls are dropped
+                    self._in_flight -= len(pending)
+                    pending.clear()
+                if pending:
+                    next_call = pending.popleft()
+                else:
+                    self._active[call.method] -= 1
+                self._in_flight -= 1
+                self._lock.notify_all()
+
+            if next_call is not None:
+                self._start(next_call)
+
+
+def _dump_stats(path: str) -> None:
+    """Atomically write the current bridge statistics to ``path``."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(handle_bridge("bridge.stats", {}), f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def serve(
+    stdin=None,
+    stdout=None,
+    threads: Optional[int] = None,
+    processes: Optional[int] = None,
+    limits: Optional[Dict[str, int]] = None,
+    idle_ttl: Optional[float] = None,
+    wire_format: str = "json",
+    compact: bool = False,
+    cache_size: int = 0,
+    stats_file: Optional[str] = None,
+    stats_interval: float = 30.0,
+) -> None:
+    """
+    Run the bridge as a long-lived process.
+
+    Reads framed requests until stdin is closed and answers each one with its
+    own frame, echoing the request ``id`` so the caller can match responses to
+    requests. Frames are JSON lines by default, or length-prefixed MessagePack
+    with ``wire_format="msgpack"``. A truncated or oversized MessagePack frame
+    is answered with an error frame (``id`` null) and ends the input. With
+    ``compact=True`` every request is answered compactly unless it sets
+    ``"compact": false``. A positive ``cache_size`` enables the result cache
+    for CACHEABLE_METHODS. With ``stats_file``, bridge.stats is written there
+    every ``stats_interval`` seconds and on exit. Returns once every response
+    has been written.
+    """
+    global _RESULT_CACHE
+
+    transport = TRANSPORTS[wire_format](stdin, stdout)
+    _RESULT_CACHE = ResultCache(cache_size) if cache_size > 0 else None
+    _INSTANCES.idle_ttl = idle_ttl
+    dispatcher = Dispatcher(
+        transport, threads=threads, processes=processes, limits=limits, idle_ttl=idle_ttl
+    )
+
+    stop_dumping = threading.Event()
+    if stats_file:
+        def dump_periodically():
+            while not stop_dumping.wait(stats_interval):
+                _dump_stats(stats_file)
+
+        threading.Thread(target=dump_periodically, name="bridge-stats", daemon=True).start()
+
+    try:
+        frames = transport.frames()
+        while True:
+            try:
+                frame = next(frames, None)
+            except (EOFError, ValueError) as e:
+                # A truncated or oversized frame leaves the stream out of sync, so stop reading
+                response = _error_response(e, time.time(), compact=compact)
+                response["id"] = None
+                dispatcher.write(response)
+                break
+            if frame is None:
+                break
+            if dispatcher.output_closed.is_set():
+                # The caller stopped reading responses; treat it like end of input
+                break
+            start_time = time.time()
+            try:
+                bytes_in = transport.frame_size(frame)
+                request = transport.decode(frame)
+                if not isinstance(request, dict):
+                    raise ValueError("Request must be a JSON object")
+            except Exception as e:
+                response = _error_response(e, start_time, compact=compact)
+                response["id"] = None
+                dispatcher.write(response)
+                continue
+
+            if compact:
+                request.setdefault("compact", True)
+            dispatcher.submit(request, bytes_in=bytes_in)
+    finally:
+        dispatcher.close()
+        stop_dumping.set()
+        if stats_file:
+            _dump_stats(stats_file)
+        if dispatcher.output_closed.is_set() and stdout is None:
+            # Python flushes stdout again at exit, which would fail on the same broken pipe
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+
+
+def _parse_limit(value: str) -> tuple:
+    """Parse a ``method=N`` concurrency limit."""
+    import argparse
+
+    method, sep, limit = value.partition("=")
+    if not sep or not limit.isdigit() or int(limit) < 1:
+        raise argparse.ArgumentTypeError(f"Expected METHOD=N with N >= 1, got: {value}")
+    return method, int(limit)
+
+
+# Modules each handler imports on its first call (used by --import-profile)
+HANDLER_MODULES = {
+    "analyzers": ["analyzers.code_analyzer"],
+    "quality": ["spinehub.benchmark"],
+    "credentials": ["credentials.manager"],
+    "linear": ["linear.templates"],
+    "privacy": ["utils.privacy"],
+    "datetime": ["utils.datetime_utils"],
+    "slack": ["utils.slack_channels"],
+}
+
+# One-shot calls timed end to end by --import-profile
+COLD_START_REQUESTS = {
+    "datetime.slack_to_date": {"ts": "1700000000.000100"},
+    "privacy.redact": {"text": "Contact: someone@example.com"},
+}
+
+_IMPORT_PROFILE_SNIPPET = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+import bridge
+bridge_ms = (time.perf_counter() - start) * 1000
+before = set(sys.modules)
+start = time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+print(json.dumps({{
+    "bridge_ms": bridge_ms,
+    "import_ms": (time.perf_counter() - start) * 1000,
+    "modules_loaded": len(set(sys.modules) - before),
+}}))
+"""
+
+
+def profile_imports(repeat: int = 3) -> Dict[str, Any]:
+    """
+    Measure startup cost in fresh interpreters.
+
+    Reports the bare interpreter start, the import of this module, the import
+    cost of each handler's modules, and the wall time of complete one-shot
+    calls (``cold_start_ms``). Each number is the best of ``repeat`` runs.
+    """
+    import subprocess
+
+    def best_of(fn) -> float:
+        return round(min(fn() for _ in range(repeat)), 2)
+
+    def wall_ms(args, stdin="") -> float:
+        start = time.perf_counter()
+        subprocess.run(args, input=stdin, capture_output=True, text=True, check=True)
+        return (time.perf_counter() - start) * 1000
+
+    def measure(modules) -> Dict[str, Any]:
+        runs = []
+        for _ in range(repeat):
+            code = _IMPORT_PROFILE_SNIPPET.format(root=BRIDGE_ROOT, modules=modules)
+            out = subprocess.run(
+                [sys.executable, "-c", code], capture_output=True, text=True, check=True
+            ).stdout
+            runs.append(json.loads(out))
+        best = min(runs, key=lambda r: r["import_ms"])
+        return {
+            "import_ms": round(best["import_ms"], 2),
+            "modules_loaded": best["modules_loaded"],
+            "bridge_import_ms": round(min(r["bridge_ms"] for r in runs), 2),
+        }
+
+    bridge_path = os.path.abspath(__file__)
+    handlers = {name: measure(modules) for name, modules in HANDLER_MODULES.items()}
+
+    return {
+        "python": sys.version.split()[0],
+        "interpreter_ms": best_of(lambda: wall_ms([sys.executable, "-c", "pass"])),
+        "bridge_import_ms": min(h["bridge_import_ms"] for h in handlers.values()),
+        "handlers": {
+            name: {"import_ms": h["import_ms"], "modules_loaded": h["modules_loaded"]}
+            for name, h in handlers.items()
+        },
+        "cold_start_ms": {
+            method: best_of(lambda: wall_ms(
+                [sys.executable, bridge_path],
+                json.dumps({"method": method, "params": params}),
+            ))
+            for method, params in COLD_START_REQUESTS.items()
+        },
+    }
+
+
+def _parse_args(argv):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="SpineHUB Python bridge")
+    parser.add_argument("--serve", action="store_true",
+                        help="Answer newline-delimited JSON requests until stdin closes")
+    parser.add_argument("--threads", type=int, default=None,
+                        help="Thread pool size for light methods (daemon mode)")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="Process pool size for heavy methods (daemon mode)")
+    parser.add_argument("--limit", type=_parse_limit, action="append", default=[],
+                        metavar="METHOD=N", help="Max concurrent calls for a method (repeatable)")
+    parser.add_argument("--idle-ttl", type=float, default=None, metavar="SECONDS",
+                        help="Evict cached handler objects idle for this long (daemon mode)")
+    parser.add_argument("--format", choices=sorted(TRANSPORTS), default="json", dest="wire_format",
+                        help="Wire format for daemon mode frames (default: json)")
+    parser.add_argument("--compact", action="store_true",
+                        help="Omit traceback and analyzer raw_output from responses")
+    parser.add_argument("--cache-size", type=int, default=0, metavar="N",
+                        help="Cache up to N results of pure methods (daemon mode, default off)")
+    parser.add_argument("--stats-file", default=None, metavar="PATH",
+                        help="Periodically write bridge.stats to this JSON file (daemon mode)")
+    parser.add_argument("--stats-interval", type=float, default=30.0, metavar="SECONDS",
+                        help="Seconds between --stats-file dumps (default: 30)")
+    parser.add_argument("--import-profile", action="store_true",
+                        help="Report import cost per handler and one-shot cold start, then exit")
+    return parser.parse_args(argv)
+
+
+def main():
+    """Main entry point for bridge."""
+    # The plain one-shot call takes no flags, so it skips argparse entirely
+    args = _parse_args(sys.argv[1:]) if len(sys.argv) > 1 else None
+    compact = bool(args and args.compact)
+
+    if args and args.import_profile:
+        print(json.dumps(profile_imports(), indent=2))
+        return
+
+    if args and args.serve:
+        serve(
+            threads=args.threads,
+            processes=args.processes,
+            limits=dict(args.limit),
+            idle_ttl=args.idle_ttl,
+            wire_format=args.wire_format,
+            compact=args.compact,
+            cache_size=args.cache_size,
+            stats_file=args.stats_file,
+            stats_interval=args.stats_interval,
+        )
+        return
+
+    start_time = time.time()
+
+    try:
+        # Read input from stdin
+        input_data = sys.stdin.read()
+        if not input_data.strip():
+            raise ValueError("No input provided")
+
+        request = json.loads(input_data)
+    except Exception as e:
+        response = _error_response(e, start_time, compact=compact)
+    else:
+        if compact and isinstance(request, dict):
+            request.setdefault("compact", True)
+        response = handle_request(request)
+        # Every one-shot call is cold; the flag only means something to the daemon
+        response.pop("cold", None)
+
     # Output JSON response
     print(json.dumps(response, default=str, ensure_ascii=False))
 
@@ -1,10 +1,12 @@
 # SpineHUB Core Module
 # Ported from C:\Users\adm_r\SpineHUB\src\spinehub
 
-from .benchmark import QualityValidator, ValidationResult, validate_worklog
+from .benchmark import BatchResult, QualityValidator, Scorecard, ValidationResult, validate_worklog
 
 __all__ = [
+    "BatchResult",
     "QualityValidator",
+    "Scorecard",
     "ValidationResult",
     "validate_worklog",
 ]
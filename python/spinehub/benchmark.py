@@ -6,9 +6,14 @@ Validates worklog quality against defined rules.
 Based on RAC-14 standard from TSA_CORTEX.
 """
 
+import os
 import re
+from collections import Counter, OrderedDict
 from dataclasses import dataclass, field
-from typing import Optional, List
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, List, Union
+
+from .rule_engine import LineIndex, RuleEngine, StreamScanner
 
 
 @dataclass
@@ -47,6 +52,85 @@ class ValidationReport:
         return len(self.info)
 
 
+@dataclass
+class BatchResult:
+    """Outcome for one document of a validate_many batch."""
+    index: int
+    source: Optional[str]  # file path, or None for inline text
+    passed: bool = False
+    report: Optional[ValidationReport] = None
+    results: List[ValidationResult] = field(default_factory=list)
+    error: Optional[str] = None  # set when the file could not be read
+
+
+@dataclass
+class Scorecard:
+    """Aggregate of a validation batch."""
+    total: int = 0
+    passed: int = 0
+    unreadable: int = 0
+    score_sum: float = 0.0
+    # rule_id -> number of documents failing it
+    violations: Counter = field(default_factory=Counter)
+    rule_names: dict = field(default_factory=dict)
+
+    def add(self, item: BatchResult) -> None:
+        self.total += 1
+        if item.report is None:
+            self.unreadable += 1
+            return
+        self.passed += item.passed
+        self.score_sum += item.report.score
+        failed = {r.rule_id: r.rule_name for r in item.results if not r.passed}
+        self.violations.update(failed.keys())
+        self.rule_names.update(failed)
+
+    @property
+    def validated(self) -> int:
+        return self.total - self.unreadable
+
+    @property
+    def pass_rate(self) -> float:
+        return round(self.passed / self.validated * 100, 1) if self.validated else 0.0
+
+    @property
+    def average_score(self) -> float:
+        return round(self.score_sum / self.validated, 1) if self.validated else 0.0
+
+    def most_violated(self, n: int = 5) -> list[tuple[str, int]]:
+        """The ``n`` rules failed by the most documents."""
+        return self.violations.most_common(n)
+
+    def to_dict(self, top: int = 5) -> dict:
+        return {
+            "total": self.total,
+            "passed": self.passed,
+            "failed": self.validated - self.passed,
+            "unreadable": self.unreadable,
+            "pass_rate": self.pass_rate,
+            "average_score": self.average_score,
+            "most_violated": [
+                {"rule_id": rule_id, "rule_name": self.rule_names[rule_id], "documents": count}
+                for rule_id, count in self.most_violated(top)
+            ],
+        }
+
+
+@dataclass
+class _SectionHits:
+    """Rule hits inside one section, as cached by validate_incremental."""
+    newlines: int
+    # (rule_id, pattern index) -> (match count, line within the section, matched text),
+    # for the patterns that match
+    patterns: dict
+    headings: set
+    artifacts: Optional[str]  # body of the first Artifacts block in the section
+    artifacts_open: bool  # that block runs to the end of the section
+    # Offset of a quote the long-quote pattern tried and could not close
+    # before the end of the section, if any
+    open_quote: Optional[int]
+
+
 class QualityValidator:
     """
     Validates worklog and document quality.
@@ -132,30 +216,299 @@ class QualityValidator:
         },
     }
 
+    # Section heading forms recognized by has_section rules
+    SECTION_PATTERNS = (
+        (r"^##?\s*{section}", re.MULTILINE),  # ## Summary or # Summary
+        (r"\*\*{section}\*\*", 0),  # **Summary**
+        (r"^{section}:", re.MULTILINE),  # Summary:
+    )
+
+    ARTIFACTS_PATTERN = re.compile(
+        r"\*\*Artifacts?\*\*:?\s*(.*?)(?=\n\n|\n\*\*|\Z)", re.DOTALL | re.IGNORECASE
+    )
+    URL_PATTERN = re.compile(r"https?://|www\.|]\(http", re.IGNORECASE)
+
+    # validate_many runs batches smaller than this in-process (pool startup costs more)
+    MIN_POOL_ITEMS = 16
+
+    # validate_incremental splits documents before lines starting with "#" or "**"
+    SECTION_BOUNDARY = re.compile(r"\n(?=#|\*\*)")
+    SECTION_CACHE_SIZE = 512
+    # (rule_id, pattern index) of the long-quote pattern, the only rule pattern
+    # that can match across a section boundary
+    LONG_QUOTE = ("SLACK_001", 0)
+
+    # validate_stream reads files in line-aligned chunks of about this many
+    # characters, and keeps this much overlap between them (the longest match
+    # it is guaranteed to see whole)
+    STREAM_CHUNK_SIZE = 1 << 16
+    STREAM_MAX_OVERLAP = 4096
+
     def __init__(self):
         self.results: List[ValidationResult] = []
+        # Section text -> _SectionHits; the dict hashes the text, and equal
+        # hashes are confirmed by comparison, so collisions can't mix sections up
+        self._section_cache: OrderedDict = OrderedDict()
+        self.section_stats = {"hits": 0, "misses": 0}
+
+    @classmethod
+    def _compiled(cls) -> tuple[RuleEngine, dict]:
+        """Rule engine plus rule_id -> engine rule id, built once per class."""
+        cached = cls.__dict__.get("_engine")
+        if cached is not None:
+            return cached
+
+        engine = RuleEngine()
+        rule_ids = {
+            rule_id: engine.add_rule(rule["patterns"])
+            for rule_id, rule in cls.RULES.items()
+            if "patterns" in rule
+        }
+        engine.add_sections(
+            [rule["section"] for rule in cls.RULES.values() if rule.get("check") == "has_section"],
+            cls.SECTION_PATTERNS,
+        )
+        cls._engine = (engine, rule_ids)
+        return cls._engine
 
     def validate(self, content: str) -> tuple[bool, 'ValidationReport']:
         """
         Validate content against all quality rules.
 
+        Uses the class's precompiled rule engine, so a clean document costs
+        about one pass per rule. A rule that hits costs one more pass per
+        pattern, up to its first matching one.
+
         Args:
             content: The text content to validate
 
         Returns:
             Tuple of (passed: bool, report: ValidationReport)
         """
+        engine, rule_ids = self._compiled()
+        lines = LineIndex(content)
+        sections = engine.find_sections(content)
         self.results = []
 
         for rule_id, rule in self.RULES.items():
             if "patterns" in rule:
-                self._check_patterns(rule_id, rule, content)
+                hit = engine.first_hit(rule_ids[rule_id], content)
+                if hit is not None:
+                    _, match, count = hit
+                    hit = (count, lines.line(match.start()), match.group())
+                self._check_patterns(rule_id, rule, hit)
+            elif rule.get("check") == "has_section":
+                self._check_section(rule_id, rule, rule["section"] in sections)
+            elif rule.get("check") == "has_urls_in_artifacts":
+                match = self.ARTIFACTS_PATTERN.search(content)
+                self._check_artifact_urls(rule_id, rule, match.group(1) if match else None)
+
+        return self._build_report()
+
+    def validate_stream(self, path: Union[str, os.PathLike]) -> tuple[bool, 'ValidationReport']:
+        """
+        Validate a file without loading it whole.
+
+        The file is read in line-aligned chunks of about STREAM_CHUNK_SIZE
+        characters, and only a window of overlap (the longest rule pattern,
+        at most STREAM_MAX_OVERLAP) is kept between them. The report,
+        including line numbers, is the one ``validate`` gives for the whole
+        file, unless a single match is longer than the overlap (e.g. a quote
+        spanning more than 4 KB), which may be missed.
+
+        Returns:
+            Tuple of (passed: bool, report: ValidationReport)
+        """
+        engine, rule_ids = self._compiled()
+        overlap = engine.max_width(self.STREAM_MAX_OVERLAP) + 1  # + 1 for lookarounds like \b
+        scanner = StreamScanner(engine, overlap, first_patterns=[self.ARTIFACTS_PATTERN])
+        with open(path, encoding="utf-8") as handle:
+            while True:
+                chunk = handle.readlines(self.STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                scanner.feed("".join(chunk))
+        scanner.feed("", final=True)
+        self.results = []
+
+        for rule_id, rule in self.RULES.items():
+            if "patterns" in rule:
+                hit = scanner.first_hit(rule_ids[rule_id])
+                self._check_patterns(rule_id, rule, None if hit is None else hit[1:])
+            elif rule.get("check") == "has_section":
+                self._check_section(rule_id, rule, rule["section"] in scanner.sections)
+            elif rule.get("check") == "has_urls_in_artifacts":
+                match = scanner.first_matches[0]
+                self._check_artifact_urls(rule_id, rule, match.group(1) if match else None)
+
+        return self._build_report()
+
+    def validate_incremental(self, content: str) -> tuple[bool, 'ValidationReport']:
+        """
+        Validate content, rescanning only sections that changed since earlier calls.
+
+        The content is split before every line starting with ``#`` or ``**``.
+        Each section's rule hits are cached by its text (every section of the
+        latest call, and at least SECTION_CACHE_SIZE in total), and the hits
+        of all sections are merged into the report ``validate`` would build.
+
+        Two kinds of match can cross a section boundary: a long quote opened
+        in one section and closed in a later one, and an Artifacts block
+        running past a ``#`` heading. Each section records whether it leaves
+        one open; only then is that rule rechecked against the whole text.
+
+        Returns:
+            Tuple of (passed: bool, report: ValidationReport)
+        """
+        texts = self._split_sections(content)
+        counts: dict = {}
+        firsts: dict = {}
+        headings: set = set()
+        artifacts = None
+        spanning_quote = False
+        long_quote = self._long_quote()
+        line = 1
+        offset = 0
+        for number, text in enumerate(texts, 1):
+            hits = self._section_hits(text)
+            for key, (count, section_line, matched) in hits.patterns.items():
+                if key in counts:
+                    counts[key] += count
+                else:
+                    counts[key] = count
+                    firsts[key] = (line + section_line - 1, matched)
+            headings |= hits.headings
+            if artifacts is None and hits.artifacts is not None:
+                artifacts = hits.artifacts
+                if hits.artifacts_open and number < len(texts):
+                    # The block may go on into the next sections
+                    artifacts = self.ARTIFACTS_PATTERN.search(content, offset).group(1)
+            if hits.open_quote is not None and number < len(texts) and not spanning_quote:
+                # Sections so far leave nothing open, so the whole-text scan
+                # tries this quote too; if it closes in a later section, the
+                # per-section counts of the rule are off from here on
+                spanning_quote = long_quote.match(content, offset + hits.open_quote) is not None
+            line += hits.newlines
+            offset += len(text)
+
+        # Keep at least every section of this document for the next call
+        cache = self._section_cache
+        while len(cache) > max(self.SECTION_CACHE_SIZE, len(texts)):
+            cache.popitem(last=False)
+
+        self.results = []
+        engine, rule_ids = self._compiled()
+        for rule_id, rule in self.RULES.items():
+            if "patterns" in rule and rule_id == self.LONG_QUOTE[0] and spanning_quote:
+                hit = engine.first_hit(rule_ids[rule_id], content)
+                if hit is not None:
+                    _, match, count = hit
+                    hit = (count, LineIndex(content).line(match.start()), match.group())
+                self._check_patterns(rule_id, rule, hit)
+            elif "patterns" in rule:
+                # The rule reports its first pattern (in rule order) that matches anywhere
+                keys = ((rule_id, index) for index in range(len(rule["patterns"])))
+                key = next((k for k in keys if k in counts), None)
+                self._check_patterns(rule_id, rule, None if key is None else (counts[key], *firsts[key]))
             elif rule.get("check") == "has_section":
-                self._check_section(rule_id, rule, content)
+                self._check_section(rule_id, rule, rule["section"] in headings)
             elif rule.get("check") == "has_urls_in_artifacts":
-                self._check_artifact_urls(rule_id, rule, content)
+                self._check_artifact_urls(rule_id, rule, artifacts)
+
+        return self._build_report()
+
+    def _split_sections(self, content: str) -> list[str]:
+        bounds = [0, *(m.end() for m in self.SECTION_BOUNDARY.finditer(content)), len(content)]
+        return [content[start:end] for start, end in zip(bounds, bounds[1:])]
+
+    def _section_hits(self, text: str) -> _SectionHits:
+        """Cached rule hits of one section."""
+        cache = self._section_cache
+        hits = cache.get(text)
+        if hits is not None:
+            cache.move_to_end(text)
+            self.section_stats["hits"] += 1
+            return hits
+
+        self.section_stats["misses"] += 1
+        engine, rule_ids = self._compiled()
+        lines = LineIndex(text)
+        artifacts = self.ARTIFACTS_PATTERN.search(text)
+        hits = _SectionHits(
+            newlines=text.count("\n"),
+            patterns={
+                (rule_id, index): (count, lines.line(match.start()), match.group())
+                for rule_id, engine_rule in rule_ids.items()
+                for index, (match, count) in engine.pattern_hits(engine_rule, text).items()
+            },
+            headings=engine.find_sections(text),
+            artifacts=artifacts.group(1) if artifacts else None,
+            artifacts_open=artifacts is not None and artifacts.end() == len(text),
+            open_quote=self._open_quote(text),
+        )
+        cache[text] = hits
+        return hits
 
-        # Build report
+    def _open_quote(self, text: str) -> Optional[int]:
+        """
+        Offset of the section's last quote, unless a long quote of the section closes there.
+
+        Only the last quote can start a long quote that ends in a later
+        section: any earlier one would end at the next quote of the section.
+        """
+        quote = text.rfind('"')
+        if quote == -1:
+            return None
+        last = None
+        for last in self._long_quote().finditer(text):
+            pass
+        return None if last is not None and last.end() == quote + 1 else quote
+
+    def _long_quote(self) -> re.Pattern:
+        engine, rule_ids = self._compiled()
+        rule_id, index = self.LONG_QUOTE
+        patterns, _ = engine.rules[rule_ids[rule_id]]
+        return patterns[index]
+
+    def validate_many(
+        self,
+        items: Iterable[Union[str, os.PathLike]],
+        processes: Optional[int] = None,
+    ) -> Iterator[BatchResult]:
+        """
+        Validate many documents across a process pool, yielding results in input order.
+
+        ``Path`` (os.PathLike) items are files, read inside the workers; ``str``
+        items are document text. Small batches, or ``processes=1``, run in this
+        process. ``self.results`` is left untouched. Feed the results to a
+        ``Scorecard`` for pass rate and most-violated rules.
+        """
+        # (file path, None) or (None, text)
+        items = [(os.fspath(i), None) if isinstance(i, os.PathLike) else (None, i) for i in items]
+        workers = min(processes or os.cpu_count() or 1, len(items))
+
+        if workers <= 1 or len(items) < self.MIN_POOL_ITEMS:
+            for index, (source, content) in enumerate(items):
+                yield _validate_item(type(self), index, source, content)
+            return
+
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # spawn: callers such as the bridge daemon run this from worker threads
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            yield from pool.map(
+                _validate_item,
+                [type(self)] * len(items),
+                range(len(items)),
+                *zip(*items),
+                # A few chunks per worker keeps pickling overhead low and the pool busy
+                chunksize=max(1, len(items) // (workers * 4)),
+            )
+
+    def _build_report(self) -> tuple[bool, 'ValidationReport']:
         report = ValidationReport()
         report.total_rules = len(self.results)
         report.passed = sum(1 for r in self.results if r.passed)
@@ -175,26 +528,22 @@ class QualityValidator:
 
         return report.status == "PASS", report
 
-    def _check_patterns(self, rule_id: str, rule: dict, content: str) -> None:
-        """Check for pattern matches (violations)."""
-        for pattern in rule["patterns"]:
-            matches = list(re.finditer(pattern, content, re.IGNORECASE))
-            if matches:
-                # Find line number for first match
-                first_match = matches[0]
-                line_num = content[: first_match.start()].count("\n") + 1
-
-                self.results.append(
-                    ValidationResult(
-                        rule_id=rule_id,
-                        rule_name=rule["name"],
-                        passed=False,
-                        message=f"Found {len(matches)} violation(s): '{matches[0].group()}'",
-                        severity=rule["severity"],
-                        line=line_num,
-                    )
+    def _check_patterns(self, rule_id: str, rule: dict, hit: Optional[tuple[int, int, str]]) -> None:
+        """Check for pattern matches (violations); ``hit`` is (count, line, text) of the first one."""
+        if hit is not None:
+            # Only the first matching pattern per rule is reported
+            count, line, text = hit
+            self.results.append(
+                ValidationResult(
+                    rule_id=rule_id,
+                    rule_name=rule["name"],
+                    passed=False,
+                    message=f"Found {count} violation(s): '{text}'",
+                    severity=rule["severity"],
+                    line=line,
                 )
-                return  # Only report first pattern match per rule
+            )
+            return
 
         # No violations found
         self.results.append(
@@ -207,19 +556,9 @@ class QualityValidator:
             )
         )
 
-    def _check_section(self, rule_id: str, rule: dict, content: str) -> None:
+    def _check_section(self, rule_id: str, rule: dict, found: bool) -> None:
         """Check if required section exists."""
         section = rule["section"]
-        patterns = [
-            rf"^##?\s*{section}",  # ## Summary or # Summary
-            rf"\*\*{section}\*\*",  # **Summary**
-            rf"^{section}:",  # Summary:
-        ]
-
-        found = any(
-            re.search(p, content, re.MULTILINE | re.IGNORECASE) for p in patterns
-        )
-
         self.results.append(
             ValidationResult(
                 rule_id=rule_id,
@@ -230,16 +569,9 @@ class QualityValidator:
             )
         )
 
-    def _check_artifact_urls(self, rule_id: str, rule: dict, content: str) -> None:
+    def _check_artifact_urls(self, rule_id: str, rule: dict, section_content: Optional[str]) -> None:
         """Check if artifacts section has URLs."""
-        # Find Artifacts sections
-        artifact_section = re.search(
-            r"\*\*Artifacts?\*\*:?\s*(.*?)(?=\n\n|\n\*\*|\Z)",
-            content,
-            re.DOTALL | re.IGNORECASE,
-        )
-
-        if not artifact_section:
+        if section_content is None:
             self.results.append(
                 ValidationResult(
                     rule_id=rule_id,
@@ -251,12 +583,8 @@ class QualityValidator:
             )
             return
 
-        section_content = artifact_section.group(1)
-
         # Check for URLs or markdown links
-        has_urls = bool(
-            re.search(r"https?://|www\.|]\(http", section_content, re.IGNORECASE)
-        )
+        has_urls = bool(self.URL_PATTERN.search(section_content))
 
         self.results.append(
             ValidationResult(
@@ -333,6 +661,23 @@ class QualityValidator:
         return "\n".join(lines)
 
 
+def _validate_item(
+    validator_class: type, index: int, source: Optional[str], content: Optional[str]
+) -> BatchResult:
+    """Validate one batch item: inline ``content``, or the file at ``source``."""
+    if content is None:
+        try:
+            content = Path(source).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError) as e:
+            return BatchResult(index=index, source=source, error=str(e))
+
+    validator = validator_class()
+    passed, report = validator.validate(content)
+    return BatchResult(
+        index=index, source=source, passed=passed, report=report, results=validator.results
+    )
+
+
 def validate_worklog(content: str) -> tuple[bool, str]:
     """
     Convenience function to validate worklog content.
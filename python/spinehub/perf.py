@@ -0,0 +1,214 @@
+"""
+Performance benchmark for the quality validator.
+
+Generates synthetic RAC-14 worklogs of increasing size and times
+``QualityValidator.validate``, ``format_report`` and ``validate_worklog`` on
+each, reporting the best time per document, documents per second and MB/s.
+Results can be saved as JSON and compared against a saved baseline, so
+rule-engine changes can be checked for regressions.
+
+Usage:
+    python -m spinehub.perf [--themes 10,100,1000] [--artifacts N] [--violations N]
+                            [--repeat N] [--json] [--output PATH]
+                            [--baseline PATH] [--max-regression RATIO]
+
+The corpus is generated from a fixed seed, so the same options always time
+the same documents.
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import timeit
+
+from .benchmark import QualityValidator, validate_worklog
+
+DEFAULT_THEMES = (10, 100, 1000)
+
+WORKSTREAMS = (
+    "Billing export", "SSO rollout", "Data pipeline", "Onboarding flow",
+    "Search latency", "Mobile release", "Audit logging", "Support tooling",
+)
+ACTIONS = (
+    "reviewed the rollout plan with support",
+    "shipped the fix behind a feature flag",
+    "paired with the data team on the backfill",
+    "triaged the open customer tickets",
+    "updated the runbook after the incident review",
+    "validated the migration on the staging tenant",
+)
+OUTCOMES = (
+    "The change is live for all customers.",
+    "The backlog is down to three tickets.",
+    "The team agreed on the next milestone.",
+    "Latency is back under the SLO.",
+)
+# One snippet per RAC-14 pattern rule
+VIOLATIONS = (
+    "I did the final review of the rollout.",
+    "Reunião com o time sobre o projeto.",
+    'The customer said: "the export keeps failing on our largest accounts".',
+)
+
+
+def generate_worklog(themes: int, artifacts: int = 2, violations: int = 0, seed: int = 0) -> str:
+    """
+    A RAC-14 style worklog: metadata table, Summary, then one section per theme
+    with narrative, ``artifacts`` linked artifacts and an Outcome.
+
+    ``violations`` snippets (first person, Portuguese, Slack quotes, in turn)
+    are spread over the themes.
+    """
+    rng = random.Random(seed)
+    lines = [
+        "| Field | Value |",
+        "|-------|-------|",
+        "| Period | 2026-W10 |",
+        "| Owner | Synthetic |",
+        "",
+        "## Summary",
+        f"The team worked on {themes} themes this week.",
+        "",
+    ]
+    injected: dict[int, list[str]] = {}
+    for k in range(violations if themes else 0):
+        injected.setdefault(rng.randrange(themes), []).append(VIOLATIONS[k % len(VIOLATIONS)])
+
+    for i in range(themes):
+        name = f"{rng.choice(WORKSTREAMS)} {i + 1}"
+        lines.append(f"## {name}")
+        for _ in range(rng.randint(2, 4)):
+            lines.append(f"- The team {rng.choice(ACTIONS)}.")
+        lines.extend(f"- {snippet}" for snippet in injected.get(i, ()))
+        lines.append("")
+        lines.append("**Artifacts**:")
+        for j in range(artifacts):
+            lines.append(f"- [ENG-{i * 10 + j}](https://linear.app/synthetic/issue/ENG-{i * 10 + j})")
+        lines.append("")
+        lines.append(f"**Outcome**: {rng.choice(OUTCOMES)}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def _best_seconds(fn, repeat: int) -> float:
+    """Best time per call of ``fn`` (each sample runs long enough to be stable)."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+
+def run_benchmark(
+    themes: tuple = DEFAULT_THEMES, artifacts: int = 2, violations: int = 0, repeat: int = 5
+) -> list[dict]:
+    """Time each operation on one generated worklog per size."""
+    rows = []
+    for count in themes:
+        content = generate_worklog(count, artifacts, violations)
+        size = len(content.encode("utf-8"))
+        validator = QualityValidator()
+        _, report = validator.validate(content)
+
+        operations = {
+            "validate": lambda: validator.validate(content),
+            "format_report": lambda: validator.format_report(report),
+            "validate_worklog": lambda: validate_worklog(content),
+        }
+        for operation, fn in operations.items():
+            seconds = _best_seconds(fn, repeat)
+            rows.append({
+                "themes": count,
+                "bytes": size,
+                "operation": operation,
+                "ms_per_doc": round(seconds * 1000, 4),
+                "docs_per_s": round(1 / seconds, 1),
+                "mb_per_s": round(size / 1e6 / seconds, 2),
+            })
+    return rows
+
+
+def compare(rows: list[dict], baseline: list[dict]) -> list[dict]:
+    """Current vs baseline time per (themes, operation) present in both."""
+    previous = {(row["themes"], row["operation"]): row for row in baseline}
+    comparison = []
+    for row in rows:
+        before = previous.get((row["themes"], row["operation"]))
+        if before is None:
+            continue
+        comparison.append({
+            "themes": row["themes"],
+            "operation": row["operation"],
+            "baseline_ms": before["ms_per_doc"],
+            "current_ms": row["ms_per_doc"],
+            "ratio": round(row["ms_per_doc"] / max(before["ms_per_doc"], 1e-6), 2),
+            # A different size means the generator changed, so the times aren't comparable
+            "same_corpus": row["bytes"] == before["bytes"],
+        })
+    return comparison
+
+
+def format_table(rows: list[dict], comparison: list[dict]) -> str:
+    ratios = {
+        (c["themes"], c["operation"]): f"{c['ratio']}x" + ("" if c["same_corpus"] else " (other corpus)")
+        for c in comparison
+    }
+    lines = [
+        f"{'themes':>7}{'KB':>9}  {'operation':<18}{'ms/doc':>11}{'docs/s':>11}{'MB/s':>9}"
+        + ("  vs baseline" if comparison else ""),
+    ]
+    for row in rows:
+        ratio = ratios.get((row["themes"], row["operation"]))
+        lines.append(
+            f"{row['themes']:>7}{row['bytes'] / 1000:>9.1f}  {row['operation']:<18}"
+            f"{row['ms_per_doc']:>11}{row['docs_per_s']:>11}{row['mb_per_s']:>9}"
+            + (f"  {ratio}" if ratio is not None else "")
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the quality validator")
+    parser.add_argument(
+        "--themes", default=",".join(map(str, DEFAULT_THEMES)),
+        help="Comma-separated worklog sizes, in themes",
+    )
+    parser.add_argument("--artifacts", type=int, default=2, help="Artifacts per theme")
+    parser.add_argument("--violations", type=int, default=0, help="Rule violations per worklog")
+    parser.add_argument("--repeat", type=int, default=5, help="Samples per operation (best is kept)")
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of a table")
+    parser.add_argument("--output", help="Also write the JSON results to this file")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare against")
+    parser.add_argument(
+        "--max-regression", type=float, default=None,
+        help="Exit non-zero if any operation is this many times slower than the baseline",
+    )
+    args = parser.parse_args(argv)
+
+    themes = tuple(int(n) for n in args.themes.split(",") if n)
+    rows = run_benchmark(themes, args.artifacts, args.violations, args.repeat)
+    comparison = []
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            comparison = compare(rows, json.load(handle)["results"])
+
+    data = {
+        "python": platform.python_version(),
+        "options": {"artifacts": args.artifacts, "violations": args.violations, "repeat": args.repeat},
+        "results": rows,
+    }
+    if comparison:
+        data["comparison"] = comparison
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(data, handle, indent=2)
+
+    print(json.dumps(data, indent=2) if args.json else format_table(rows, comparison))
+    if args.max_regression is not None:
+        regressed = [c for c in comparison if c["same_corpus"] and c["ratio"] > args.max_regression]
+        return 1 if regressed else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
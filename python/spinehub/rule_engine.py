@@ -0,0 +1,292 @@
+"""
+Compiled rule engine for the QualityValidator.
+
+Rule patterns are compiled once per validator class instead of going
+through ``re``'s pattern cache on every call, and each check reads the
+content as few times as possible:
+
+- Each pattern rule also gets one alternation of all its patterns. A single
+  ``search`` with it proves a clean document clean. When it does hit, no
+  pattern can match before that position, so the per-pattern scans (which
+  produce the first match and the count in one pass each) start there.
+- Section checks run one pass per heading form for all sections together,
+  and stop as soon as every section has been seen.
+- Line numbers come from a newline offset index searched with bisect.
+
+``StreamScanner`` runs the same rules over text that arrives in pieces,
+holding only a window of it in memory.
+
+This is not a single scan over the content. A rule that hits is scanned once
+per pattern, up to its first matching pattern, because one ``finditer`` over
+an alternation cannot give the same answer:
+
+- A rule reports its first pattern *in rule order* that matches anywhere,
+  while an alternation reports the leftmost match of any pattern.
+- Overlapping patterns share text: the alternation consumes it for one
+  alternative, so the others' counts would come out lower than their own
+  ``finditer`` counts.
+
+Rules are not merged into one alternation over everything either: ``re``
+tries every alternative at every position, so a global alternation is slower
+than a few precompiled passes.
+"""
+
+import bisect
+import re
+from typing import Optional, Sequence
+
+try:
+    from re import _parser as _sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse as _sre_parse
+
+
+class LineIndex:
+    """Maps character offsets to 1-based line numbers (index built on first use)."""
+
+    def __init__(self, content: str):
+        self.content = content
+        self._newlines: Optional[list[int]] = None
+
+    def line(self, offset: int) -> int:
+        if self._newlines is None:
+            self._newlines = [m.start() for m in re.finditer("\n", self.content)]
+        return bisect.bisect_left(self._newlines, offset) + 1
+
+
+class RuleEngine:
+    """Precompiled pattern rules and section heading checks."""
+
+    def __init__(self, flags: int = re.IGNORECASE):
+        self.flags = flags
+        # Per rule: its patterns in order, and their combined alternation
+        self.rules: list[tuple[list[re.Pattern], re.Pattern]] = []
+        self.sections: list[str] = []
+        # (pattern, section names by group index) per section scan
+        self._section_scans: list[tuple[re.Pattern, list[str]]] = []
+
+    def add_rule(self, patterns: list[str]) -> int:
+        """Compile a pattern rule and return its id."""
+        compiled = [re.compile(p, self.flags) for p in patterns]
+        combined = re.compile("|".join(f"(?:{p})" for p in patterns), self.flags)
+        self.rules.append((compiled, combined))
+        return len(self.rules) - 1
+
+    def first_hit(self, rule_id: int, content: str) -> Optional[tuple[int, re.Match, int]]:
+        """
+        The first pattern of the rule (in rule order) that matches the content.
+
+        Returns ``(pattern_index, first_match, match_count)`` or None, where the
+        count equals ``len(list(pattern.finditer(content)))``. A clean document
+        costs one search with the rule's alternation. Otherwise each pattern is
+        scanned on its own, up to the first one that matches, since the
+        alternation's matches are neither in rule order nor countable per
+        pattern (see the module docstring).
+        """
+        patterns, combined = self.rules[rule_id]
+        earliest = combined.search(content)
+        if earliest is None:
+            return None
+        for index, pattern in enumerate(patterns):
+            hit = _first_and_count(pattern, content, earliest.start())
+            if hit is not None:
+                return (index, *hit)
+        return None
+
+    def pattern_hits(self, rule_id: int, content: str) -> dict[int, tuple[re.Match, int]]:
+        """
+        Pattern index -> ``(first_match, match_count)`` for each pattern of the rule that matches.
+
+        Like ``first_hit``, one scan per pattern after the alternation hits.
+        """
+        patterns, combined = self.rules[rule_id]
+        earliest = combined.search(content)
+        if earliest is None:
+            return {}
+        hits = {}
+        for index, pattern in enumerate(patterns):
+            hit = _first_and_count(pattern, content, earliest.start())
+            if hit is not None:
+                hits[index] = hit
+        return hits
+
+    def add_sections(self, names: list[str], forms: Sequence[tuple[str, int]]) -> None:
+        """
+        Register sections; a section is present if any heading form matches.
+
+        ``forms`` are ``(template, flags)`` pairs with a ``{section}`` placeholder.
+        """
+        self.sections.extend(names)
+        folded = [name.casefold() for name in self.sections]
+        # An alternation reports one name per position, so names that are
+        # prefixes of each other each get their own scans
+        if any(a != b and b.startswith(a) for a in folded for b in folded):
+            groups = [[name] for name in self.sections]
+        else:
+            groups = [self.sections]
+        self._section_scans = [
+            (
+                re.compile(
+                    template.format(section="(?:" + "|".join(f"({n})" for n in group) + ")"),
+                    self.flags | flags,
+                ),
+                group,
+            )
+            for template, flags in forms
+            for group in groups
+        ]
+
+    def max_width(self, cap: int) -> int:
+        """Longest possible match of any rule or section pattern, at most ``cap``."""
+        patterns = [p for compiled, _ in self.rules for p in compiled]
+        patterns += [p for p, _ in self._section_scans]
+        return max(
+            (min(_sre_parse.parse(p.pattern, p.flags).getwidth()[1], cap) for p in patterns),
+            default=0,
+        )
+
+    def find_sections(self, content: str) -> set[str]:
+        """Names of the registered sections present in the content."""
+        found: set[str] = set()
+        for pattern, names in self._section_scans:
+            if found.issuperset(names):
+                continue
+            # Resume one character after each hit, so a heading that overlaps
+            # another section's heading is still seen
+            match = pattern.search(content)
+            while match is not None:
+                found.add(names[match.lastindex - 1])
+                if found.issuperset(names):
+                    break
+                match = pattern.search(content, match.start() + 1)
+        return found
+
+
+def _first_and_count(pattern: re.Pattern, content: str, pos: int) -> Optional[tuple[re.Match, int]]:
+    """
+    First match and match count of ``pattern``, scanning from ``pos``.
+
+    Callers pass a ``pos`` before which nothing matches; lookarounds still see
+    the text before it, so the result equals a scan of the whole content.
+    """
+    matches = pattern.finditer(content, pos)
+    first = next(matches, None)
+    if first is None:
+        return None
+    return first, 1 + sum(1 for _ in matches)
+
+
+class StreamScanner:
+    """
+    Runs a RuleEngine over text fed in line-aligned pieces, keeping a window.
+
+    A match only counts once it starts at least ``overlap`` characters before
+    the end of the text seen so far (rounded down to a line start): a match
+    up to ``overlap`` long, with its lookarounds, then lies entirely in the
+    window. Each pattern resumes where it stopped, so counts equal one
+    ``finditer`` over the whole text. The window keeps the last ``overlap``
+    characters plus anything a deferred match still needs.
+
+    Results equal a scan of the whole text as long as no match is longer than
+    ``overlap``. ``first_patterns`` are searched for their first match only,
+    which may be any length: it is kept open until it ends before the window
+    does.
+    """
+
+    def __init__(self, engine: RuleEngine, overlap: int, first_patterns: Sequence[re.Pattern] = ()):
+        self.engine = engine
+        self.overlap = overlap
+        self.window = ""
+        self.line = 1  # line number of window[0]
+        # Per rule and pattern: resume position in the window, match count, first (line, text)
+        self._positions = [[0] * len(patterns) for patterns, _ in engine.rules]
+        self._counts = [[0] * len(patterns) for patterns, _ in engine.rules]
+        self._firsts: list[list[Optional[tuple[int, str]]]] = [
+            [None] * len(patterns) for patterns, _ in engine.rules
+        ]
+        # Patterns after a rule's first matching one can never be reported,
+        # so each rule only scans its first ``active`` patterns
+        self._active = [len(patterns) for patterns, _ in engine.rules]
+        self.sections: set[str] = set()
+        self.first_patterns = list(first_patterns)
+        self.first_matches: list[Optional[re.Match]] = [None] * len(self.first_patterns)
+        self._first_positions = [0] * len(self.first_patterns)
+
+    def feed(self, text: str, final: bool = False) -> None:
+        """Scan the next piece of text; pass ``final=True`` once the stream has ended."""
+        window = self.window + text
+        end = len(window)
+        if final:
+            limit = end
+        else:
+            limit = window.rfind("\n", 0, max(end - self.overlap, 0)) + 1
+        keep = limit
+
+        for rule_id, (patterns, combined) in enumerate(self.engine.rules):
+            positions = self._positions[rule_id]
+            active = self._active[rule_id]
+            earliest = combined.search(window, min(positions[:active]))
+            if earliest is None or earliest.start() >= limit:
+                # No pattern of the rule starts a match before ``limit``
+                positions[:active] = [max(pos, limit) for pos in positions[:active]]
+                continue
+            for index in range(active):
+                pos = self._scan(rule_id, index, patterns[index], window, positions[index], limit, final)
+                positions[index] = pos
+                keep = min(keep, pos)
+                if self._counts[rule_id][index]:
+                    self._active[rule_id] = index + 1
+                    break
+
+        for index, pattern in enumerate(self.first_patterns):
+            if self.first_matches[index] is not None:
+                continue
+            match = pattern.search(window, self._first_positions[index])
+            if match is None:
+                self._first_positions[index] = max(self._first_positions[index], limit)
+            elif match.start() < limit and (final or match.end() < end - 1):
+                self.first_matches[index] = match
+            else:
+                # Starts too late, or may grow with more text
+                self._first_positions[index] = match.start()
+                keep = min(keep, match.start())
+
+        if len(self.sections) < len(self.engine.sections):
+            self.sections |= self.engine.find_sections(window)
+
+        # The next window starts at a line start, like the text it stands for,
+        # so "^" and "\b" see the same context there
+        keep = window.rfind("\n", 0, keep) + 1
+        self.line += window.count("\n", 0, keep)
+        self.window = window[keep:]
+        for rule_id, positions in enumerate(self._positions):
+            active = self._active[rule_id]
+            positions[:active] = [pos - keep for pos in positions[:active]]
+        self._first_positions = [pos - keep for pos in self._first_positions]
+
+    def _scan(
+        self, rule_id: int, index: int, pattern: re.Pattern, window: str, pos: int, limit: int, final: bool
+    ) -> int:
+        """Count the pattern's final matches from ``pos``; returns where to resume."""
+        for match in pattern.finditer(window, pos):
+            if match.start() >= limit or (not final and match.end() >= len(window) - 1):
+                return match.start()
+            if self._counts[rule_id][index] == 0:
+                self._firsts[rule_id][index] = (
+                    self.line + window.count("\n", 0, match.start()),
+                    match.group(),
+                )
+            self._counts[rule_id][index] += 1
+            pos = match.end() if match.end() > match.start() else match.end() + 1
+        return max(pos, limit)
+
+    def first_hit(self, rule_id: int) -> Optional[tuple[int, int, int, str]]:
+        """
+        Like ``RuleEngine.first_hit`` over everything fed so far.
+
+        Returns ``(pattern_index, match_count, line, matched_text)`` or None.
+        """
+        for index, count in enumerate(self._counts[rule_id]):
+            if count:
+                return (index, count, *self._firsts[rule_id][index])
+        return None
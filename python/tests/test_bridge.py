@@ -0,0 +1,556 @@
+"""Tests for the SpineHUB Python bridge (python/bridge.py).
+
+Covers:
+  - the one-shot startup path: privacy.* and datetime.* must not import
+    unrelated handler modules or the daemon-only machinery
+  - the cold-start budget: a one-shot call must stay within a fixed overhead
+    over a bare interpreter start
+  - bridge.stats: per-method counters, with bytes in and out measured on
+    the wire for both frame formats
+  - batch requests: per-item envelopes, nested and empty batches
+  - daemon mode (--serve): responses tagged with their request id, shutdown
+    at end of input, exiting instead of hanging when the caller stops
+    reading responses, per-method concurrency limits, and heavy methods
+    running in the process pool
+  - the MessagePack transport: round trips, frames split across reads, and
+    truncated or oversized frames
+  - the result cache: LRU eviction, TTL expiry and bypassing it
+  - the instance registry: one shared instance per set of constructor
+    arguments, and idle eviction
+  - streamed requests: partial frames come before the final response and
+    carry its id, and a chunked analyzers.run_all reassembles into the
+    plain response
+
+Every startup measurement runs in a fresh interpreter, the way the
+TypeScript side spawns the bridge.
+"""
+
+import importlib.util
+import io
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import types
+import unittest
+from unittest import mock
+
+PYTHON_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+BRIDGE_PATH = os.path.join(PYTHON_DIR, 'bridge.py')
+sys.path.insert(0, PYTHON_DIR)
+
+import bridge  # noqa: E402
+from analyzers.analyzer_base import AnalyzerBase, AnalyzerResult, Issue, Severity  # noqa: E402
+from analyzers.code_analyzer import CodeAnalyzer  # noqa: E402
+
+# Allowed one-shot overhead over `python -c pass` (best of COLD_START_RUNS)
+COLD_START_BUDGET_MS = 250
+COLD_START_RUNS = 5
+
+# Modules the one-shot privacy/datetime path must never pull in
+DAEMON_ONLY_MODULES = {'argparse', 'multiprocessing', 'concurrent.futures', 'traceback'}
+UNRELATED_HANDLER_MODULES = {
+    'analyzers', 'analyzers.code_analyzer', 'spinehub', 'spinehub.benchmark',
+    'credentials', 'credentials.manager', 'linear', 'linear.templates',
+    'utils.slack_channels',
+}
+
+_LOADED_MODULES_SNIPPET = """
+import json, sys
+sys.path.insert(0, {root!r})
+import bridge
+response = bridge.handle_request({request!r})
+assert response["success"], response
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def _loaded_modules(request):
+    code = _LOADED_MODULES_SNIPPET.format(root=PYTHON_DIR, request=request)
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return set(json.loads(out.stdout))
+
+
+def _json_lines(*requests):
+    return b''.join(json.dumps(request).encode() + b'\n' for request in requests)
+
+
+class TrickleReader:
+    """Binary stream that returns at most ``size`` bytes per read, like a slow pipe."""
+
+    def __init__(self, data, size):
+        self._data = io.BytesIO(data)
+        self.size = size
+
+    def read(self, n):
+        return self._data.read(min(n, self.size))
+
+
+def _msgpack_frames(*messages):
+    out = io.BytesIO()
+    transport = bridge.MsgpackTransport(stdout=out)
+    for message in messages:
+        transport.write(message)
+    return out.getvalue()
+
+
+def _serve_msgpack(data):
+    out = io.BytesIO()
+    bridge.serve(stdin=TrickleReader(data, 5), stdout=out, wire_format='msgpack')
+    reader = bridge.MsgpackTransport(stdin=io.BytesIO(out.getvalue()))
+    return [reader.decode(frame) for frame in reader.frames()]
+
+
+def _best_wall_ms(args, stdin=''):
+    best = None
+    for _ in range(COLD_START_RUNS):
+        start = time.perf_counter()
+        subprocess.run(args, input=stdin, capture_output=True, text=True, check=True)
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+class TestFastPath(unittest.TestCase):
+
+    def test_privacy_skips_unrelated_modules(self):
+        loaded = _loaded_modules({'method': 'privacy.redact', 'params': {'text': 'a@b.com'}})
+        self.assertIn('utils.privacy', loaded)
+        self.assertNotIn('utils.datetime_utils', loaded)
+        self.assertNotIn('zoneinfo', loaded)
+        self.assertFalse(loaded & UNRELATED_HANDLER_MODULES)
+        self.assertFalse(loaded & DAEMON_ONLY_MODULES)
+
+    def test_datetime_skips_unrelated_modules(self):
+        loaded = _loaded_modules({'method': 'datetime.slack_to_date', 'params': {'ts': '1700000000.0'}})
+        self.assertIn('utils.datetime_utils', loaded)
+        self.assertNotIn('utils.privacy', loaded)
+        self.assertFalse(loaded & UNRELATED_HANDLER_MODULES)
+        self.assertFalse(loaded & DAEMON_ONLY_MODULES)
+
+
+class TestColdStart(unittest.TestCase):
+
+    def test_one_shot_overhead_within_budget(self):
+        interpreter_ms = _best_wall_ms([sys.executable, '-c', 'pass'])
+        request = json.dumps({'method': 'datetime.slack_to_date', 'params': {'ts': '1700000000.0'}})
+        cold_start_ms = _best_wall_ms([sys.executable, BRIDGE_PATH], request)
+
+        overhead_ms = cold_start_ms - interpreter_ms
+        self.assertLess(
+            overhead_ms, COLD_START_BUDGET_MS,
+            f'one-shot cold start {cold_start_ms:.1f}ms is {overhead_ms:.1f}ms over '
+            f'a bare interpreter ({interpreter_ms:.1f}ms); budget {COLD_START_BUDGET_MS}ms',
+        )
+
+
+class TestBridgeStats(unittest.TestCase):
+
+    def test_redactors_while_privacy_is_still_importing(self):
+        # What another thread's in-progress `import utils.privacy` looks like
+        half_imported = types.ModuleType('utils.privacy')
+        with mock.patch.dict(sys.modules, {'utils.privacy': half_imported}):
+            self.assertIsNone(bridge.handle_bridge('bridge.stats', {})['redactors'])
+
+    def test_redactors_after_a_privacy_call(self):
+        bridge.handle_privacy('privacy.redact', {'text': 'a@b.com'})
+        stats = bridge.handle_bridge('bridge.stats', {})['redactors']
+        self.assertGreaterEqual(stats['misses'] + stats['hits'], 1)
+
+
+class TestMetrics(unittest.TestCase):
+
+    REQUEST = {'id': 1, 'method': 'privacy.redact', 'params': {'text': 'olá, ligue para ana@example.com'}}
+
+    def setUp(self):
+        patcher = mock.patch.object(bridge, '_METRICS', bridge.BridgeMetrics())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _method_stats(self):
+        response = bridge.handle_request({'method': 'bridge.stats'})
+        self.assertEqual(response['data']['calls'], 2)
+        return response['data']['methods']['privacy.redact']
+
+    def test_json_lines_bytes_are_encoded_sizes(self):
+        line = json.dumps(self.REQUEST, ensure_ascii=False) + '\n'
+        stdout = io.StringIO()
+        bridge.serve(stdin=io.StringIO(line * 2), stdout=stdout)
+
+        stats = self._method_stats()
+        self.assertEqual((stats['calls'], stats['errors']), (2, 0))
+        self.assertEqual(stats['cold_calls'] + stats['warm_calls'], 2)
+        self.assertEqual(sum(stats['histogram'].values()), 2)
+        self.assertEqual(set(stats['latency_ms']), {'p50', 'p95', 'p99', 'max'})
+        self.assertEqual(stats['bytes_in'], 2 * len(line.encode('utf-8')))
+        self.assertGreater(stats['bytes_in'], 2 * len(line))
+        self.assertEqual(stats['bytes_out'], len(stdout.getvalue().encode('utf-8')))
+
+    @unittest.skipUnless(importlib.util.find_spec('msgpack'), 'msgpack is not installed')
+    def test_msgpack_bytes_include_frame_headers(self):
+        data = _msgpack_frames(self.REQUEST, self.REQUEST)
+        stdout = io.BytesIO()
+        bridge.serve(stdin=io.BytesIO(data), stdout=stdout, wire_format='msgpack')
+
+        stats = self._method_stats()
+        self.assertEqual(stats['bytes_in'], len(data))
+        self.assertEqual(stats['bytes_out'], len(stdout.getvalue()))
+
+
+class TestBatch(unittest.TestCase):
+
+    def test_nested_batch_item_is_rejected(self):
+        response = bridge.handle_request({"method": "batch", "params": {"requests": [
+            {"id": "a", "method": "datetime.slack_to_date", "params": {"ts": "1700000000.000100"}},
+            {"id": "b", "method": "batch", "params": {"requests": []}},
+        ]}})
+        self.assertTrue(response["success"])
+        first, nested = response["data"]
+        self.assertEqual((first["id"], first["success"]), ("a", True))
+        self.assertEqual(nested, {
+            "success": False,
+            "error": "Nested batch requests are not supported",
+            "execution_time_ms": 0,
+            "id": "b",
+        })
+
+    def test_empty_batch(self):
+        response = bridge.handle_request({"method": "batch", "params": {"requests": []}})
+        self.assertTrue(response["success"])
+        self.assertEqual(response["data"], [])
+
+
+class TestDaemon(unittest.TestCase):
+
+    def _start(self, *args):
+        daemon = subprocess.Popen(
+            [sys.executable, BRIDGE_PATH, '--serve', *args],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        )
+
+        def stop():
+            if daemon.poll() is None:
+                daemon.kill()
+                daemon.wait()
+            daemon.stdin.close()
+            daemon.stdout.close()
+
+        self.addCleanup(stop)
+        return daemon
+
+    def test_responses_carry_request_ids(self):
+        daemon = self._start()
+        out, _ = daemon.communicate(_json_lines(
+            {'id': 1, 'method': 'datetime.slack_to_date', 'params': {'ts': '1700000000.000100'}},
+            {'id': 'two', 'method': 'privacy.redact', 'params': {'text': 'mail ana@example.com'}},
+            {'id': 3, 'method': 'nope.nothing'},
+        ), timeout=60)
+        self.assertEqual(daemon.returncode, 0)
+
+        responses = {r['id']: r for r in map(json.loads, out.splitlines())}
+        self.assertEqual(sorted(responses, key=str), [1, 3, 'two'])
+        self.assertTrue(responses[1]['success'])
+        self.assertEqual(responses['two']['data']['text'], 'mail [EMAIL_REDACTED]')
+        self.assertFalse(responses[3]['success'])
+        self.assertIn('Unknown module: nope', responses[3]['error'])
+
+    def test_exits_at_end_of_input(self):
+        daemon = self._start()
+        out, _ = daemon.communicate(b'', timeout=60)
+        self.assertEqual((daemon.returncode, out), (0, b''))
+
+    def test_exits_when_the_output_pipe_is_closed(self):
+        daemon = self._start()
+        daemon.stdout.close()
+        request = {'method': 'datetime.slack_to_date', 'params': {'ts': '1700000000.0'}}
+        daemon.stdin.write(_json_lines(*({**request, 'id': n} for n in range(20))))
+        daemon.stdin.close()
+        # Used to hang once writing a response raised BrokenPipeError
+        self.assertEqual(daemon.wait(timeout=60), 0)
+
+    def _serve_in_process(self, *requests, **options):
+        with mock.patch.object(bridge, '_METRICS', bridge.BridgeMetrics()):
+            stdout = io.StringIO()
+            bridge.serve(stdin=io.StringIO(_json_lines(*requests).decode()), stdout=stdout, **options)
+        return {r['id']: r for r in map(json.loads, stdout.getvalue().splitlines())}
+
+    def test_method_limit_caps_concurrent_calls(self):
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def handle_probe(method, params):
+            with lock:
+                running.append(params['n'])
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(params['n'])
+            return params['n']
+
+        requests = [{'id': n, 'method': 'probe.slow', 'params': {'n': n}} for n in range(8)]
+        with mock.patch.dict(bridge.HANDLERS, {'probe': handle_probe}), \
+                mock.patch.dict(bridge.METHOD_LIMITS, {'probe.slow': 2}):
+            responses = self._serve_in_process(*requests, threads=8)
+
+        self.assertEqual({n: r['data'] for n, r in responses.items()}, {n: n for n in range(8)})
+        # Eight free threads, but never more than the limit at once
+        self.assertEqual(max(peak), 2)
+
+    def test_heavy_method_runs_in_the_process_pool(self):
+        from concurrent.futures import ProcessPoolExecutor
+
+        submit = ProcessPoolExecutor.submit
+        request = {'id': 1, 'method': 'privacy.redact_batch',
+                   'params': {'texts': ['mail ana@example.com', 'nothing here']}}
+        self.assertIn(request['method'], bridge.HEAVY_METHODS)
+
+        with mock.patch.object(ProcessPoolExecutor, 'submit', autospec=True, side_effect=submit) as spy:
+            responses = self._serve_in_process(request, processes=1)
+
+        spy.assert_called_once_with(mock.ANY, bridge.handle_request, request)
+        self.assertTrue(responses[1]['success'], responses[1])
+        self.assertEqual([item['text'] for item in responses[1]['data']],
+                         ['mail [EMAIL_REDACTED]', 'nothing here'])
+
+
+@unittest.skipUnless(importlib.util.find_spec('msgpack'), 'msgpack is not installed')
+class TestMsgpackTransport(unittest.TestCase):
+
+    REQUEST = {'id': 1, 'method': 'datetime.slack_to_date', 'params': {'ts': '1700000000.000100'}}
+
+    def test_round_trip_with_frames_split_across_reads(self):
+        messages = [{'id': 1, 'text': 'olá', 'blob': b'\x00\xff'}, {'id': 2, 'items': list(range(1000))}]
+        out = io.BytesIO()
+        writer = bridge.MsgpackTransport(stdout=out)
+        self.assertEqual(sum(writer.write(m) for m in messages), len(out.getvalue()))
+
+        reader = bridge.MsgpackTransport(stdin=TrickleReader(out.getvalue(), 3))
+        self.assertEqual([reader.decode(frame) for frame in reader.frames()], messages)
+
+    def test_serve_answers_split_frames(self):
+        responses = _serve_msgpack(_msgpack_frames(self.REQUEST, {**self.REQUEST, 'id': 2}))
+        self.assertEqual(sorted(r['id'] for r in responses), [1, 2])
+        self.assertTrue(all(r['success'] for r in responses))
+
+    def test_truncated_frame_ends_the_input(self):
+        data = _msgpack_frames(self.REQUEST) + bridge.MsgpackTransport().HEADER.pack(100) + b'x' * 10
+        responses = sorted(_serve_msgpack(data), key=lambda r: r['id'] is None)
+        self.assertEqual([(r['id'], r['success']) for r in responses], [(1, True), (None, False)])
+        self.assertEqual(responses[1]['error'], 'Truncated MessagePack frame')
+
+    def test_oversized_frame_is_rejected_before_reading_it(self):
+        header = bridge.MsgpackTransport().HEADER.pack(bridge.MsgpackTransport.MAX_FRAME_BYTES + 1)
+        responses = sorted(_serve_msgpack(_msgpack_frames(self.REQUEST) + header), key=lambda r: r['id'] is None)
+        self.assertEqual([(r['id'], r['success']) for r in responses], [(1, True), (None, False)])
+        self.assertIn('exceeds the', responses[1]['error'])
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestResultCache(unittest.TestCase):
+
+    def _key(self, ts):
+        return bridge.ResultCache.key('datetime.slack_to_date', {'ts': ts})
+
+    def test_least_recently_used_is_evicted(self):
+        cache = bridge.ResultCache(max_size=2)
+        cache.put(self._key('1'), 'one')
+        cache.put(self._key('2'), 'two')
+        self.assertEqual(cache.get(self._key('1')), (True, 'one'))
+        cache.put(self._key('3'), 'three')
+
+        self.assertEqual(cache.get(self._key('2')), (False, None))
+        self.assertEqual(cache.get(self._key('1')), (True, 'one'))
+        self.assertEqual(cache.get(self._key('3')), (True, 'three'))
+        self.assertEqual(cache.stats(), {'hits': 3, 'misses': 1, 'size': 2})
+
+    def test_entries_expire_after_their_ttl(self):
+        clock = FakeClock()
+        cache = bridge.ResultCache(clock=clock)
+        expiring = bridge.ResultCache.key('datetime.default_range', {})
+        cache.put(expiring, 'range')
+        cache.put(self._key('1'), 'one')
+
+        clock.now = bridge.CACHEABLE_METHODS['datetime.default_range'] - 1
+        self.assertEqual(cache.get(expiring), (True, 'range'))
+        clock.now += 2
+        self.assertEqual(cache.get(expiring), (False, None))
+        # Methods without a TTL never expire
+        clock.now = 10 ** 9
+        self.assertEqual(cache.get(self._key('1')), (True, 'one'))
+        self.assertEqual(cache.stats()['size'], 1)
+
+    def test_uncacheable_and_opted_out_requests_bypass_the_cache(self):
+        cache = bridge.ResultCache()
+        request = {'method': 'datetime.slack_to_date', 'params': {'ts': '1700000000.000100'}}
+        with mock.patch.object(bridge, '_RESULT_CACHE', cache):
+            self.assertNotIn('cache', bridge.handle_request({'method': 'bridge.stats'}))
+            self.assertNotIn('cache', bridge.handle_request({**request, 'cache': False}))
+            self.assertEqual(cache.stats(), {'hits': 0, 'misses': 0, 'size': 0})
+
+            first, second = bridge.handle_request(request), bridge.handle_request(request)
+        self.assertEqual(first['cache'], {'hits': 0, 'misses': 1, 'size': 1, 'hit': False})
+        self.assertEqual(second['cache'], {'hits': 1, 'misses': 1, 'size': 1, 'hit': True})
+
+
+class Widget:
+
+    def __init__(self, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+
+
+class TestInstanceRegistry(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.object(bridge, '_INSTANCES', bridge.InstanceRegistry())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _code_analyzer(self, compact=False, **params):
+        token = bridge._COMPACT.set(compact)
+        try:
+            return bridge._code_analyzer({'project_path': PYTHON_DIR, **params})
+        finally:
+            bridge._COMPACT.reset(token)
+
+    def test_same_params_share_an_instance(self):
+        first = self._code_analyzer(shards=2)
+        self.assertIs(self._code_analyzer(shards=2), first)
+        self.assertEqual(len(bridge._INSTANCES), 1)
+
+    def test_different_params_get_their_own_instance(self):
+        first = self._code_analyzer()
+        self.assertIsNot(self._code_analyzer(shards=2), first)
+        self.assertIsNot(self._code_analyzer(backend='subprocess'), first)
+        # A compact call must not reuse an analyzer that keeps raw output, or vice versa
+        compact = self._code_analyzer(compact=True)
+        self.assertIsNot(compact, first)
+        self.assertFalse(compact.analyzers['ruff'].keep_raw_output)
+        self.assertTrue(first.analyzers['ruff'].keep_raw_output)
+        self.assertEqual(len(bridge._INSTANCES), 4)
+
+    def test_idle_entries_are_evicted(self):
+        clock = FakeClock()
+        registry = bridge.InstanceRegistry(idle_ttl=10, clock=clock)
+        kept = registry.get(Widget, 'kept')
+        idle = registry.get(Widget, 'idle')
+
+        clock.now += 6
+        self.assertIs(registry.get(Widget, 'kept'), kept)
+        clock.now += 6
+        # 'kept' was used 6s ago; 'idle' 12s ago, past the TTL
+        self.assertIs(registry.get(Widget, 'kept'), kept)
+        self.assertEqual(len(registry), 1)
+        self.assertIsNot(registry.get(Widget, 'idle'), idle)
+
+    def test_without_idle_ttl_entries_are_kept(self):
+        clock = FakeClock()
+        registry = bridge.InstanceRegistry(clock=clock)
+        widget = registry.get(Widget)
+        clock.now = 10 ** 9
+        self.assertIs(registry.get(Widget), widget)
+
+
+class CannedAnalyzer(AnalyzerBase):
+    """Reports ``count`` fixed issues, so streamed and plain runs can be compared."""
+
+    per_file = False
+
+    def __init__(self, project_path, name, count):
+        super().__init__(project_path)
+        self.name = name
+        self.count = count
+
+    def is_available(self):
+        return True
+
+    def run(self, paths=None):
+        issues = [
+            Issue(file=f'{self.name}.py', line=n, column=0, code=f'{self.name.upper()}{n}',
+                  message=f'{self.name} finding {n}', severity=Severity.WARNING, tool=self.name)
+            for n in range(1, self.count + 1)
+        ]
+        return AnalyzerResult(tool=self.name, success=True, issues=issues,
+                              raw_output=f'{self.count} findings\n', summary=self.summarize(issues))
+
+    def parse_output(self, output):
+        return []
+
+
+class TestStreaming(unittest.TestCase):
+
+    def test_partial_frames_precede_the_final_response(self):
+        texts = {'a': ['# Week 1', '# Week 2', '# Week 3'], 'b': ['# Week 4', '# Week 5']}
+        requests = [
+            {'id': key, 'method': 'quality.validate_batch', 'stream': True,
+             'params': {'texts': docs, 'processes': 1}}
+            for key, docs in texts.items()
+        ]
+        requests.append({'id': 'plain', 'method': 'datetime.slack_to_date', 'params': {'ts': '1700000000.0'}})
+        stdin = io.StringIO(''.join(json.dumps(r) + '\n' for r in requests))
+        stdout = io.StringIO()
+        bridge.serve(stdin=stdin, stdout=stdout)
+
+        frames = {}
+        for line in stdout.getvalue().splitlines():
+            frame = json.loads(line)
+            frames.setdefault(frame['id'], []).append(frame)
+        self.assertEqual(sorted(frames), ['a', 'b', 'plain'])
+
+        for key, docs in texts.items():
+            *partials, final = frames[key]
+            self.assertEqual([f.get('partial') for f in partials], [True] * len(docs))
+            self.assertEqual([f['data']['index'] for f in partials], list(range(len(docs))))
+            self.assertNotIn('partial', final)
+            self.assertTrue(final['success'])
+            self.assertEqual(final['data']['total'], len(docs))
+        self.assertEqual(len(frames['plain']), 1)
+
+    def test_run_all_streams_each_tool_in_chunks(self):
+        counts = {'ruff': 5, 'bandit': 0, 'vulture': 3, 'radon': 4}
+        analyzer = CodeAnalyzer('.', max_workers=1)
+        analyzer.analyzers = {name: CannedAnalyzer('.', name, n) for name, n in counts.items()}
+        params = {'project_path': '.', 'chunk_size': 2}
+
+        with mock.patch.object(bridge, '_code_analyzer', return_value=analyzer):
+            plain = bridge.handle_request({'method': 'analyzers.run_all', 'params': params})
+            stdout = io.StringIO()
+            request = {'id': 7, 'method': 'analyzers.run_all', 'stream': True, 'params': params}
+            bridge.serve(stdin=io.StringIO(json.dumps(request) + '\n'), stdout=stdout)
+
+        *partials, final = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertTrue(partials)
+        self.assertTrue(all(f['partial'] and f['id'] == 7 for f in partials))
+        self.assertNotIn('partial', final)
+        self.assertEqual((final['id'], final['success']), (7, True))
+
+        # Reassemble each tool from its chunks; only the last one is "done"
+        chunks, results = {}, {}
+        for frame in partials:
+            data = frame['data']
+            tool = data['tool']
+            self.assertNotIn(tool, results)
+            self.assertLessEqual(len(data['issues']), 2)
+            chunks.setdefault(tool, []).extend(data.pop('issues'))
+            if data.pop('done'):
+                results[tool] = {**data, 'issues': chunks[tool]}
+            else:
+                self.assertEqual(data, {'tool': tool})
+
+        self.assertEqual(sorted(final['data'].pop('tools')), sorted(counts))
+        self.assertEqual({'results': results, **final['data']}, plain['data'])
+
+
+if __name__ == '__main__':
+    unittest.main()
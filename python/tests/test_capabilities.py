@@ -0,0 +1,101 @@
+"""Tests for the tool capability cache (python/analyzers/capabilities.py).
+
+A stub stands in for the ``python -m <tool> --version`` probe, and
+site-packages is pointed at a temporary directory, so these tests neither
+start interpreters nor depend on which tools are installed.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from analyzers import analyzer_base  # noqa: E402
+from analyzers.capabilities import ToolCapability, ToolCapabilityCache  # noqa: E402
+from analyzers.code_analyzer import BanditAnalyzer, RuffAnalyzer  # noqa: E402
+
+
+class TestToolCapabilityCache(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.site_packages = self._tmp.name
+        self._touch(1)
+        for patcher in (
+            mock.patch('site.getsitepackages', return_value=[self.site_packages]),
+            mock.patch('site.getusersitepackages', return_value=os.path.join(self.site_packages, 'missing')),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.cache = ToolCapabilityCache()
+        self.checks = []
+        self.cache._check = self._check
+
+    def _check(self, tool):
+        self.checks.append(tool)
+        return ToolCapability(tool=tool, available=tool != 'absent', version=f'{len(self.checks)}.0')
+
+    def _touch(self, seconds):
+        # What installing or removing a package does to site-packages
+        os.utime(self.site_packages, ns=(seconds * 10 ** 9, seconds * 10 ** 9))
+
+    def test_first_probe_misses_and_later_probes_hit(self):
+        first = self.cache.probe('ruff')
+        self.assertIs(self.cache.probe('ruff'), first)
+        self.assertEqual(self.checks, ['ruff'])
+
+    def test_each_tool_is_checked_once(self):
+        self.cache.probe('ruff')
+        self.assertFalse(self.cache.probe('absent').available)
+        self.cache.probe('ruff')
+        self.cache.probe('absent')
+        self.assertEqual(self.checks, ['ruff', 'absent'])
+
+    def test_invalidate_one_tool(self):
+        self.cache.probe('ruff')
+        self.cache.probe('bandit')
+        self.cache.invalidate('ruff')
+        self.assertEqual(self.cache.probe('ruff').version, '3.0')
+        self.cache.probe('bandit')
+        self.assertEqual(self.checks, ['ruff', 'bandit', 'ruff'])
+
+    def test_invalidate_every_tool(self):
+        self.cache.probe('ruff')
+        self.cache.probe('bandit')
+        self.cache.invalidate()
+        self.cache.probe('ruff')
+        self.cache.probe('bandit')
+        self.assertEqual(self.checks, ['ruff', 'bandit', 'ruff', 'bandit'])
+
+    def test_package_change_drops_every_entry(self):
+        self.cache.probe('ruff')
+        self.cache.probe('bandit')
+        self._touch(2)
+        self.assertEqual(self.cache.probe('ruff').version, '3.0')
+        self.cache.probe('bandit')
+        self.assertEqual(self.checks, ['ruff', 'bandit', 'ruff', 'bandit'])
+
+    def test_interpreter_change_drops_every_entry(self):
+        self.cache.probe('ruff')
+        with mock.patch.object(sys, 'executable', '/other/venv/bin/python'):
+            self.assertEqual(self.cache.probe('ruff').version, '2.0')
+            self.cache.probe('ruff')
+        self.assertEqual(self.checks, ['ruff', 'ruff'])
+
+    def test_analyzers_share_the_cache(self):
+        with mock.patch.object(analyzer_base, 'TOOL_CAPABILITIES', self.cache):
+            first, second = RuffAnalyzer('.'), RuffAnalyzer('.')
+            self.assertTrue(first.is_available())
+            self.assertTrue(second.is_available())
+            self.assertEqual(first.tool_version, '1.0')
+            self.assertTrue(BanditAnalyzer('.').is_available())
+        self.assertEqual(self.checks, ['ruff', 'bandit'])
+
+
+if __name__ == '__main__':
+    unittest.main()
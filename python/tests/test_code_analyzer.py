@@ -0,0 +1,523 @@
+"""Tests for the code analyzer orchestration (python/analyzers/code_analyzer.py).
+
+Covers:
+  - run_all: tools run side by side up to max_workers, and each result
+    keeps its own tool's timing
+  - the incremental result cache: unchanged files are served from disk,
+    changed files are re-analyzed, and merged results match a full run
+  - run_changed: only files changed since a git ref are analyzed, and
+    line-scoped tools keep only definitions touching changed lines
+  - sharded runs: size-balanced shards cover every file once, and the
+    merged result is identical to an unsharded run
+  - baselines: known issues stay suppressed when lines move, and only new
+    occurrences are reported
+  - sharded and cached runs of the real tools keep each tool's own file
+    selection (build/, configured excludes, .bandit)
+  - tools whose output is not a complete JSON report: no issues, like
+    parsing the whole output
+  - the in-process radon/vulture backends report the same issues as the
+    subprocess backends, with the same config files (skipped when the tools
+    are not installed)
+
+A fake per-file analyzer stands in for the real tools, so these tests do
+not need ruff/bandit/radon installed.
+"""
+
+import importlib.util
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from analyzers.analyzer_base import AnalyzerBase, AnalyzerResult, Issue, Severity  # noqa: E402
+from analyzers.code_analyzer import (  # noqa: E402
+    BanditAnalyzer, CodeAnalyzer, RadonAnalyzer, RuffAnalyzer, VultureAnalyzer, shard_files,
+)
+from analyzers.git_diff import changed_line_ranges, changed_python_files  # noqa: E402
+
+
+class LineCountAnalyzer(AnalyzerBase):
+    """Reports one issue per line containing 'TODO' and records the files it ran on."""
+
+    name = "todo"
+    tool_version = "1.0"
+
+    def __init__(self, project_path):
+        super().__init__(project_path)
+        self.calls = []
+
+    def is_available(self):
+        return True
+
+    def run(self, paths=None):
+        files = self.get_python_files(paths)
+        self.calls.append(sorted(f.name for f in files))
+        issues = [
+            Issue(
+                file=str(f), line=n, column=0, code="T001", message="todo",
+                severity=Severity.INFO, tool=self.name,
+            )
+            for f in files
+            for n, line in enumerate(f.read_text().splitlines(), 1)
+            if "TODO" in line
+        ]
+        return self._result(issues)
+
+    def _result(self, issues):
+        raw_output = "".join(f"{i.file}:{i.line}: {i.message}\n" for i in issues)
+        return AnalyzerResult(tool=self.name, success=True, issues=issues,
+                              raw_output=raw_output, summary=self.summarize(issues))
+
+    def parse_output(self, output):
+        return []
+
+
+class DefinitionAnalyzer(LineCountAnalyzer):
+    """Reports every function definition, like radon does for complex functions."""
+
+    name = "radon"
+
+    def run(self, paths=None):
+        files = self.get_python_files(paths)
+        self.calls.append(sorted(f.name for f in files))
+        issues = [
+            Issue(
+                file=str(f), line=n, column=0, code="C", message=line.strip(),
+                severity=Severity.INFO, tool=self.name,
+            )
+            for f in files
+            for n, line in enumerate(f.read_text().splitlines(), 1)
+            if line.startswith("def ")
+        ]
+        return self._result(issues)
+
+
+class SleepingAnalyzer(AnalyzerBase):
+    """Project-wide tool that takes ``delay`` seconds and reports its own run time."""
+
+    per_file = False
+
+    def __init__(self, project_path, name, delay):
+        super().__init__(project_path)
+        self.name = name
+        self.delay = delay
+
+    def is_available(self):
+        return True
+
+    def run(self, paths=None):
+        start = time.perf_counter()
+        time.sleep(self.delay)
+        total = round((time.perf_counter() - start) * 1000, 1)
+        return AnalyzerResult(tool=self.name, success=True,
+                              summary={**self.summarize([]), "timing_ms": {"total": total}})
+
+    def parse_output(self, output):
+        return []
+
+
+def make_analyzer(project, cache_dir=None):
+    analyzer = CodeAnalyzer(project, max_workers=1, cache_dir=cache_dir)
+    analyzer.analyzers = {"todo": LineCountAnalyzer(project)}
+    return analyzer
+
+
+class TestRunAll(unittest.TestCase):
+
+    DELAYS = {"ruff": 0.3, "bandit": 0.15, "vulture": 0.6, "radon": 0.45}
+
+    def _run_all(self, max_workers):
+        analyzer = CodeAnalyzer(".", max_workers=max_workers)
+        analyzer.analyzers = {
+            name: SleepingAnalyzer(".", name, delay) for name, delay in self.DELAYS.items()
+        }
+        start = time.perf_counter()
+        results = analyzer.run_all()
+        return results, time.perf_counter() - start
+
+    def test_tools_run_concurrently(self):
+        # Explicit, since the default is capped at the CPU count
+        results, wall = self._run_all(max_workers=len(self.DELAYS))
+        self.assertLess(wall, sum(self.DELAYS.values()))
+        self.assertGreaterEqual(wall, max(self.DELAYS.values()))
+        # Same dict, in the analyzers' order, whatever order they finished in
+        self.assertEqual(list(results), list(self.DELAYS))
+
+        for name, delay in self.DELAYS.items():
+            self.assertEqual(results[name].tool, name)
+            # Each summary has its own tool's time, not the wall time of the whole run
+            total = results[name].summary["timing_ms"]["total"]
+            self.assertGreaterEqual(total, delay * 1000)
+            self.assertLess(total, (delay + 0.15) * 1000)
+
+    def test_max_workers_limits_concurrency(self):
+        _, wall = self._run_all(max_workers=1)
+        self.assertGreaterEqual(wall, sum(self.DELAYS.values()))
+
+
+class TestIncrementalCache(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.project = self.root / "project"
+        self.project.mkdir()
+        for i in range(5):
+            (self.project / f"m{i}.py").write_text("x = 1  # TODO\n" * (i + 1))
+        self.cache_dir = str(self.root / "cache")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _issues(self, result):
+        return [(Path(i.file).name, i.line, i.code) for i in result.issues]
+
+    def test_rerun_is_served_from_cache(self):
+        analyzer = make_analyzer(str(self.project), self.cache_dir)
+        first = analyzer.run_single("todo")
+        self.assertEqual(first.summary["cache"], {"hits": 0, "misses": 5})
+
+        tool = analyzer.analyzers["todo"]
+        tool.calls.clear()
+        second = analyzer.run_single("todo")
+        self.assertEqual(tool.calls, [])
+        self.assertEqual(second.summary["cache"], {"hits": 5, "misses": 0})
+        self.assertEqual(self._issues(second), self._issues(first))
+
+    def test_only_changed_files_are_reanalyzed(self):
+        make_analyzer(str(self.project), self.cache_dir).run_single("todo")
+        (self.project / "m2.py").write_text("y = 2\n# TODO\n# TODO later\n# TODO now\n")
+
+        # A new CodeAnalyzer re-reads the cache from disk
+        analyzer = make_analyzer(str(self.project), self.cache_dir)
+        result = analyzer.run_single("todo")
+        self.assertEqual(analyzer.analyzers["todo"].calls, [["m2.py"]])
+        self.assertEqual(result.summary["cache"], {"hits": 4, "misses": 1})
+
+        full = make_analyzer(str(self.project)).run_single("todo")
+        self.assertEqual(self._issues(result), self._issues(full))
+        self.assertEqual(result.summary["total_issues"], full.summary["total_issues"])
+
+    def test_cached_issues_keep_the_reported_paths(self):
+        # Through a symlink, resolved paths differ from the ones the tool reports
+        link = self.root / "link"
+        link.symlink_to(self.project)
+        # Same content as m0.py, but its issues must name copy.py
+        (self.project / "copy.py").write_text((self.project / "m0.py").read_text())
+        full = make_analyzer(str(link)).run_single("todo")
+        cold = make_analyzer(str(link), self.cache_dir).run_single("todo")
+        warm = make_analyzer(str(link), self.cache_dir).run_single("todo")
+        self.assertEqual(warm.summary["cache"], {"hits": 6, "misses": 0})
+        self.assertEqual(cold.issues, full.issues)
+        self.assertEqual(warm.issues, cold.issues)
+
+
+@unittest.skipUnless(shutil.which("git"), "git is not installed")
+class TestRunChanged(unittest.TestCase):
+
+    SOURCE = "def first():\n    return 1\n\n\ndef second():\n    return 2  # TODO\n"
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.project = Path(self._tmp.name)
+        for name in ("changed.py", "untouched.py"):
+            (self.project / name).write_text(self.SOURCE)
+        self._git("init", "-q")
+        self._git("add", ".")
+        self._git("-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "init")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _git(self, *args):
+        subprocess.run(["git", *args], cwd=self.project, check=True, capture_output=True)
+
+    def test_scopes_to_changed_files_and_definitions(self):
+        (self.project / "changed.py").write_text(self.SOURCE.replace("return 2", "return 3"))
+        analyzer = CodeAnalyzer(str(self.project), max_workers=1)
+        analyzer.analyzers = {
+            "todo": LineCountAnalyzer(str(self.project)),
+            "radon": DefinitionAnalyzer(str(self.project)),
+        }
+        results = analyzer.run_changed("HEAD")
+
+        self.assertEqual(analyzer.analyzers["todo"].calls, [["changed.py"]])
+        self.assertEqual([(Path(i.file).name, i.line) for i in results["todo"].issues],
+                         [("changed.py", 6)])
+        # Only second() overlaps the edited line
+        self.assertEqual([i.message for i in results["radon"].issues], ["def second():"])
+        self.assertEqual(results["radon"].summary["total_issues"], 1)
+        # The raw tool output still lists first(), so it is dropped
+        self.assertEqual(results["radon"].raw_output, "")
+        self.assertIn("changed.py:6", results["todo"].raw_output)
+
+    def test_names_with_spaces_and_non_ascii(self):
+        names = ["a b.py", "é.py"]
+        for name in names:
+            (self.project / name).write_text(self.SOURCE)
+        self._git("add", ".")
+        self._git("-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "more")
+        for name in names:
+            (self.project / name).write_text(self.SOURCE.replace("return 2", "return 3"))
+
+        paths = [(self.project / name).resolve() for name in names]
+        self.assertEqual(changed_python_files(self.project, "HEAD"), paths)
+        self.assertEqual(changed_line_ranges(self.project, "HEAD"), {path: [(6, 6)] for path in paths})
+
+        analyzer = CodeAnalyzer(str(self.project), max_workers=1)
+        analyzer.analyzers = {"radon": DefinitionAnalyzer(str(self.project))}
+        results = analyzer.run_changed("HEAD")
+        self.assertEqual(sorted(Path(i.file).name for i in results["radon"].issues), sorted(names))
+
+    def test_no_changes_runs_nothing(self):
+        analyzer = make_analyzer(str(self.project))
+        results = analyzer.run_changed("HEAD")
+        self.assertEqual(analyzer.analyzers["todo"].calls, [])
+        self.assertTrue(results["todo"].success)
+        self.assertEqual(results["todo"].issues, [])
+
+
+
+class TestSharding(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.project = Path(self._tmp.name)
+        for i in range(12):
+            sub = self.project / f"pkg{i % 3}"
+            sub.mkdir(exist_ok=True)
+            (sub / f"m{i}.py").write_text("x = 1  # TODO\n" * (i * 7 % 11 + 1))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_shards_are_balanced_and_cover_every_file(self):
+        files = sorted(self.project.rglob("*.py"))
+        shards = shard_files(files, 3)
+        self.assertEqual(len(shards), 3)
+        self.assertEqual(sorted(f for shard in shards for f in shard), files)
+        totals = [sum(f.stat().st_size for f in shard) for shard in shards]
+        largest = max(f.stat().st_size for f in files)
+        self.assertLessEqual(max(totals) - min(totals), largest)
+
+    def test_sharded_run_matches_unsharded_run(self):
+        plain = make_analyzer(str(self.project)).run_single("todo")
+
+        analyzer = make_analyzer(str(self.project))
+        analyzer.shards = 3
+        analyzer.MIN_SHARD_FILES = 1
+        sharded = analyzer.run_single("todo")
+
+        calls = analyzer.analyzers["todo"].calls
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(sorted(name for call in calls for name in call),
+                         sorted(f"m{i}.py" for i in range(12)))
+        self.assertEqual(sharded.summary.pop("shards"), 3)
+        sharded.summary.pop("timing_ms")
+        self.assertEqual(sharded.issues, plain.issues)
+        self.assertEqual(sharded.summary, plain.summary)
+
+    def test_sharded_radon_keeps_the_unsharded_order(self):
+        if importlib.util.find_spec("radon") is None:
+            self.skipTest("radon is not installed")
+        for i in range(12):
+            (self.project / f"pkg{i % 3}" / f"branchy{i}.py").write_text(BRANCHY_SOURCE * (i % 4 + 1))
+
+        for backend in ("subprocess", "inprocess"):
+            found = {}
+            for shards in (1, 3):
+                analyzer = CodeAnalyzer(str(self.project), max_workers=1)
+                analyzer.analyzers = {"radon": RadonAnalyzer(str(self.project), backend=backend)}
+                analyzer.shards = shards
+                analyzer.MIN_SHARD_FILES = 1
+                found[shards] = analyzer.run_single("radon").issues
+            self.assertEqual(len(found[1]), 30)
+            self.assertEqual(found[3], found[1])
+
+
+class TestBaseline(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.project = Path(self._tmp.name)
+        self.source = self.project / "mod.py"
+        self.source.write_text("def f():\n    return 1  # TODO\n\n\ndef g():\n    pass  # TODO\n")
+        self.baseline = str(self.project / "baseline.json")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_only_new_issues_are_reported(self):
+        analyzer = make_analyzer(str(self.project))
+        analyzer.baseline_path = self.baseline
+        self.assertEqual(analyzer.write_baseline(), 2)
+        self.assertEqual(analyzer.run_single("todo").issues, [])
+
+        # Shift everything down and add a second TODO inside f()
+        self.source.write_text(
+            "import os\n\n\ndef f():\n    x = 1  # TODO\n    return x  # TODO\n\n\ndef g():\n    pass  # TODO\n"
+        )
+        result = analyzer.run_single("todo")
+        self.assertEqual(len(result.issues), 1)
+        self.assertEqual(result.summary["baseline"], {"suppressed": 2})
+        self.assertEqual(result.summary["total_issues"], 1)
+        self.assertEqual(result.raw_output, "")
+
+    def test_missing_baseline_file_reports_everything(self):
+        analyzer = make_analyzer(str(self.project))
+        analyzer.baseline_path = self.baseline
+        result = analyzer.run_single("todo")
+        self.assertEqual(len(result.issues), 2)
+        self.assertEqual(len(result.raw_output.splitlines()), 2)
+
+
+BRANCHY_SOURCE = "import os\n\n\ndef branchy(x):\n" + "".join(
+    f"    if x == {i}:\n        return {i}\n" for i in range(12)
+) + "    return None\n"
+
+
+EXCLUSION_SOURCE = "import os, sys\nimport subprocess\n\n\n" + BRANCHY_SOURCE.split("\n\n\n", 1)[1] + (
+    "\n\ndef shell(cmd):\n    subprocess.call(cmd, shell=True)\n    return eval(cmd)\n"
+)
+
+
+class TestToolExclusions(unittest.TestCase):
+    """Sharded and cached runs must keep each real tool's own file selection."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.project = Path(self._tmp.name)
+        # build/ is scanned by every tool; legacy/ is excluded by ruff and radon config
+        for directory in ("src", "build", "legacy"):
+            (self.project / directory).mkdir()
+            for i in range(2):
+                (self.project / directory / f"m{i}.py").write_text(EXCLUSION_SOURCE)
+        (self.project / "pyproject.toml").write_text('[tool.ruff]\nextend-exclude = ["legacy"]\n')
+        (self.project / "setup.cfg").write_text("[radon]\nignore = legacy\n")
+        (self.project / ".bandit").write_text("[bandit]\nskips = B404\n")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _run(self, tool, **options):
+        if importlib.util.find_spec(tool) is None:
+            self.skipTest(f"{tool} is not installed")
+        analyzer = CodeAnalyzer(str(self.project), max_workers=1, **options)
+        analyzer.MIN_SHARD_FILES = 1
+        result = analyzer.run_single(tool)
+        self.assertTrue(result.success, result.error)
+        return result.issues
+
+    def _assert_config_applied(self, tool, issues):
+        dirs = {Path(i.file).parent.name for i in issues}
+        self.assertIn("build", dirs)
+        if tool == "bandit":
+            self.assertNotIn("B404", {i.code for i in issues})
+        else:
+            self.assertNotIn("legacy", dirs)
+
+    def test_sharded_runs_match_unsharded_runs(self):
+        for tool in ("ruff", "bandit", "radon"):
+            with self.subTest(tool=tool):
+                full = self._run(tool)
+                self._assert_config_applied(tool, full)
+                self.assertEqual(self._run(tool, shards=3), full)
+
+    def test_cached_runs_match_full_runs(self):
+        for tool in ("ruff", "bandit", "radon"):
+            with self.subTest(tool=tool):
+                cache_dir = tempfile.mkdtemp()
+                self.addCleanup(shutil.rmtree, cache_dir)
+                full = self._run(tool)
+                self._assert_config_applied(tool, full)
+                self.assertEqual(self._run(tool, cache_dir=cache_dir), full)
+                self.assertEqual(self._run(tool, cache_dir=cache_dir), full)
+
+
+class TestStreamedReports(unittest.TestCase):
+
+    def _run(self, analyzer_class, output):
+        def fake_tool(module, args, cwd=None):
+            return subprocess.Popen([sys.executable, "-c", f"print({output!r}, end='')"],
+                                    stdout=subprocess.PIPE, text=True)
+
+        analyzer = analyzer_class(".")
+        with mock.patch.object(analyzer_class, "is_available", return_value=True), \
+                mock.patch("analyzers.code_analyzer.stream_python_module", fake_tool):
+            return analyzer, analyzer.run()
+
+    def test_output_that_is_not_a_json_report_has_no_issues(self):
+        for analyzer_class, output in (
+            (RuffAnalyzer, "error: ruff crashed [internal]"),
+            (RuffAnalyzer, '[{"code": "F401", "filename": "a.py", "loc'),
+            (BanditAnalyzer, 'Run started\n{"errors": [], "results": [{"filename": "a.py",'),
+        ):
+            with self.subTest(tool=analyzer_class.name, output=output):
+                analyzer, result = self._run(analyzer_class, output)
+                # Same as parse_output on the whole text
+                self.assertEqual(analyzer.parse_output(output), [])
+                self.assertTrue(result.success, result.error)
+                self.assertEqual(list(result.issues), [])
+                self.assertEqual(result.raw_output, output)
+
+
+class TestInprocessBackends(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.project = Path(self._tmp.name)
+        (self.project / "pkg").mkdir()
+        (self.project / "pkg" / "branchy.py").write_text(BRANCHY_SOURCE)
+        (self.project / "broken.py").write_text("def broken(:\n")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _assert_same_issues(self, analyzer_cls):
+        if importlib.util.find_spec(analyzer_cls.inprocess_module) is None:
+            self.skipTest(f"{analyzer_cls.name} is not installed")
+        found = {}
+        for backend in ("subprocess", "inprocess"):
+            result = analyzer_cls(str(self.project), backend=backend).run()
+            self.assertTrue(result.success, result.error)
+            self.assertEqual(result.summary["backend"], backend)
+            found[backend] = sorted(
+                (Path(i.file).parent.name, Path(i.file).name, i.line, i.code, i.message)
+                for i in result.issues
+            )
+        self.assertTrue(found["inprocess"])
+        self.assertEqual(found["inprocess"], found["subprocess"])
+        return found["inprocess"]
+
+    def test_radon_backends_match(self):
+        self._assert_same_issues(RadonAnalyzer)
+
+    def test_vulture_backends_match(self):
+        self._assert_same_issues(VultureAnalyzer)
+
+    def test_radon_backends_read_the_project_config(self):
+        (self.project / "other").mkdir()
+        (self.project / "other" / "branchy.py").write_text(BRANCHY_SOURCE)
+        (self.project / "setup.cfg").write_text("[radon]\nignore = pkg\n")
+        found = self._assert_same_issues(RadonAnalyzer)
+        self.assertEqual({directory for directory, *_ in found}, {"other"})
+
+    def test_vulture_ignores_the_callers_pyproject(self):
+        # The project has no pyproject.toml, but the caller's cwd does
+        cwd = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cwd)
+        Path(cwd, "pyproject.toml").write_text('[tool.vulture]\nexclude = ["branchy.py"]\n')
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(cwd)
+        self._assert_same_issues(VultureAnalyzer)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+"""Tests for the columnar issue store (python/analyzers/issue_store.py)."""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from analyzers.analyzer_base import AnalyzerResult, Issue, Severity  # noqa: E402
+from analyzers.issue_store import IssueStore  # noqa: E402
+
+
+def make_issues():
+    issues = []
+    for i in range(30):
+        code = ("E501", "F401", "B105")[i % 3]
+        issues.append(Issue(
+            file=f"pkg/m{i % 4}.py",
+            line=i + 1,
+            column=i % 7,
+            code=code,
+            message=f"problem {code}",
+            severity=(Severity.ERROR, Severity.INFO, Severity.SECURITY)[i % 3],
+            tool="ruff",
+            fix_available=code == "F401",
+            fix_description="Remove import" if code == "F401" else None,
+        ))
+    return issues
+
+
+class TestIssueStore(unittest.TestCase):
+
+    def setUp(self):
+        self.issues = make_issues()
+        self.store = IssueStore(self.issues)
+
+    def test_behaves_like_the_issue_list(self):
+        self.assertEqual(len(self.store), len(self.issues))
+        self.assertEqual(list(self.store), self.issues)
+        self.assertEqual(self.store, self.issues)
+        self.assertEqual(self.store[-1], self.issues[-1])
+        self.assertEqual(self.store[3:9:2], self.issues[3:9:2])
+        with self.assertRaises(IndexError):
+            self.store[30]
+
+    def test_missing_positions_are_stored_as_zero(self):
+        store = IssueStore([
+            Issue(file="setup.cfg", line=None, column=None, code="E902", message="unreadable",
+                  severity=Severity.ERROR, tool="ruff"),
+            Issue(file="a.py", line=-1, column=-3, code="E999", message="syntax",
+                  severity=Severity.ERROR, tool="ruff"),
+        ])
+        self.assertEqual([(i.line, i.column) for i in store], [(0, 0), (0, 0)])
+        self.assertEqual(store[0].file, "setup.cfg")
+
+    def test_grouping_and_counts(self):
+        self.assertEqual(self.store.count_by_severity(), {"error": 10, "info": 10, "security": 10})
+        self.assertEqual(self.store.count_by_file()["pkg/m0.py"], 8)
+        by_file = self.store.group_by_file()
+        self.assertEqual(list(by_file), [f"pkg/m{i}.py" for i in range(4)])
+        self.assertEqual(by_file["pkg/m1.py"], [1, 5, 9, 13, 17, 21, 25, 29])
+        self.assertEqual(self.store.group_by_severity()["security"], list(range(2, 30, 3)))
+        self.assertTrue(self.store.has_severity(Severity.SECURITY))
+        self.assertFalse(self.store.has_severity(Severity.WARNING))
+
+    def test_top_n(self):
+        self.assertEqual(self.store.head(2), self.issues[:2])
+        self.assertEqual([i.line for i in self.store.head(3, Severity.SECURITY)], [3, 6, 9])
+        self.assertEqual(self.store.top_files(2), [("pkg/m0.py", 8), ("pkg/m1.py", 8)])
+        self.assertEqual(self.store.top_codes(1), [("E501", 10)])
+
+    def test_result_summary_matches_list_backed_result(self):
+        from_list = AnalyzerResult(tool="ruff", success=True, issues=self.issues)
+        from_store = AnalyzerResult(tool="ruff", success=True, issues=self.store)
+        self.assertEqual(from_store.format_summary(), from_list.format_summary())
+        self.assertEqual(from_store.has_errors, from_list.has_errors)
+        self.assertEqual(from_store.has_security_issues, from_list.has_security_issues)
+
+
+if __name__ == '__main__':
+    unittest.main()
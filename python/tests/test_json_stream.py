@@ -0,0 +1,68 @@
+"""Tests for the incremental JSON array reader (python/analyzers/json_stream.py).
+
+Every case is decoded with a range of tiny chunk sizes, so values and
+separators are split across reads at every possible position.
+"""
+
+import io
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from analyzers.json_stream import iter_array  # noqa: E402
+
+CHUNK_SIZES = (1, 2, 3, 7, 64, 1 << 16)
+
+RUFF_ITEMS = [
+    {"code": "F401", "filename": "/p/a.py", "location": {"row": 1, "column": 8},
+     "message": "`os` imported but unused", "fix": {"message": "Remove unused import"}},
+    {"code": None, "filename": "/p/b é.py", "location": {"row": 12345, "column": 1},
+     "message": "SyntaxError: unexpected \"]\" [here]", "fix": None},
+]
+
+
+def decode(text, key=None, chunk_size=1 << 16):
+    return list(iter_array(io.StringIO(text), key=key, chunk_size=chunk_size))
+
+
+class TestIterArray(unittest.TestCase):
+
+    def test_top_level_array(self):
+        text = json.dumps(RUFF_ITEMS, indent=2)
+        for size in CHUNK_SIZES:
+            self.assertEqual(decode(text, chunk_size=size), RUFF_ITEMS)
+
+    def test_scalars_split_across_chunks(self):
+        items = [123456789, -1.5e10, True, None, "x", [], {}]
+        text = json.dumps(items)
+        for size in CHUNK_SIZES:
+            self.assertEqual(decode(text, chunk_size=size), items)
+
+    def test_keyed_array_skips_other_members_and_progress_prefix(self):
+        report = {
+            "errors": [],
+            "metrics": {"/p/results.py": {"loc": 3}, "_totals": {"loc": 3}},
+            "results": RUFF_ITEMS,
+            "generated_at": "2024-01-01T00:00:00Z",
+        }
+        text = "Working... 100% 0:00:01\n" + json.dumps(report, indent=2)
+        for size in CHUNK_SIZES:
+            self.assertEqual(decode(text, key="results", chunk_size=size), RUFF_ITEMS)
+
+    def test_empty_inputs(self):
+        self.assertEqual(decode(""), [])
+        self.assertEqual(decode("[]"), [])
+        self.assertEqual(decode("  [ \n ]  "), [])
+        self.assertEqual(decode('{"errors": []}', key="results"), [])
+
+    def test_truncated_document_raises(self):
+        text = json.dumps(RUFF_ITEMS)[:-10]
+        with self.assertRaises(json.JSONDecodeError):
+            decode(text, chunk_size=3)
+
+
+if __name__ == '__main__':
+    unittest.main()
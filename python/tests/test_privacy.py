@@ -0,0 +1,98 @@
+"""Tests for PII redaction (python/utils/privacy.py)."""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.privacy import (  # noqa: E402
+    FrozenRedactionConfig, RedactionConfig, Redactor, RedactorCache, get_redactor, redact_pii,
+)
+
+
+class TestRedactor(unittest.TestCase):
+
+    def test_redacts_each_type_once(self):
+        result = redact_pii(
+            "Mail ana@example.com or call +55 11 98765-4321. "
+            "SSN 123-45-6789, CPF 123.456.789-09, CNPJ 12.345.678/0001-95."
+        )
+        self.assertEqual(
+            result.text,
+            "Mail [EMAIL_REDACTED] or call [PHONE_REDACTED]. "
+            "SSN [SSN_REDACTED], CPF [CPF_REDACTED], CNPJ [CNPJ_REDACTED].",
+        )
+        self.assertEqual(result.redacted_count, 5)
+        self.assertEqual(result.types, ["email", "phone", "ssn", "cpf", "cnpj"])
+
+    def test_disabled_types_are_kept(self):
+        config = RedactionConfig(redact_phone_numbers=False, redact_ip_addresses=True)
+        result = Redactor(config).redact("call 11 98765-4321 from 10.0.0.1")
+        self.assertEqual(result.text, "call 11 98765-4321 from [IP_REDACTED]")
+        self.assertEqual(result.types, ["ip_address"])
+
+    def test_earlier_type_wins_over_an_earlier_match(self):
+        # A phone starts first, but emails are redacted before phones
+        result = redact_pii("id 12 98765-4321@corp.com")
+        self.assertEqual((result.text, result.types), ("id 12 [EMAIL_REDACTED]", ["email"]))
+
+    def test_replacement_creates_a_word_boundary(self):
+        # The SSN only starts at a word boundary once the email is redacted
+        result = redact_pii("user@x.com123-45-6789")
+        self.assertEqual(result.text, "[EMAIL_REDACTED][SSN_REDACTED]")
+        self.assertEqual(result.redacted_count, 2)
+
+    def test_custom_patterns_run_on_redacted_text(self):
+        redactor = Redactor(RedactionConfig(custom_patterns=["EMAIL", "[unclosed", r"TICKET-\d+"]))
+        result = redactor.redact("ana@example.com on TICKET-42")
+        self.assertEqual(result.text, "[[REDACTED]_REDACTED] on [REDACTED]")
+        self.assertEqual((result.redacted_count, result.types), (3, ["email", "custom"]))
+        self.assertEqual(len(redactor.custom_patterns), 2)
+
+    def test_nothing_enabled(self):
+        config = RedactionConfig(
+            redact_emails=False, redact_phone_numbers=False, redact_ssn=False,
+            redact_credit_cards=False, redact_cpf_cnpj=False,
+        )
+        result = redact_pii("ana@example.com 123-45-6789", config)
+        self.assertEqual((result.text, result.redacted_count, result.types), ("ana@example.com 123-45-6789", 0, []))
+
+
+class TestRedactorCache(unittest.TestCase):
+
+    def test_frozen_config_is_hashable(self):
+        frozen = RedactionConfig(custom_patterns=["x+"]).freeze()
+        self.assertEqual(frozen, FrozenRedactionConfig(custom_patterns=("x+",)))
+        self.assertEqual(hash(frozen), hash(RedactionConfig(custom_patterns=["x+"]).freeze()))
+        self.assertNotEqual(frozen, RedactionConfig().freeze())
+
+    def test_equal_configs_share_a_redactor(self):
+        cache = RedactorCache()
+        redactor = cache.get(RedactionConfig(custom_patterns=["x+"]))
+        self.assertIs(cache.get(RedactionConfig(custom_patterns=["x+"])), redactor)
+        self.assertIs(cache.get(FrozenRedactionConfig(custom_patterns=("x+",))), redactor)
+        self.assertIsNot(cache.get(), redactor)
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["size"]), (2, 2, 2))
+        self.assertGreater(stats["compile_ms"], 0)
+
+    def test_least_recently_used_is_dropped(self):
+        cache = RedactorCache(max_size=2)
+        first = cache.get(RedactionConfig(redact_ssn=False))
+        cache.get(RedactionConfig(redact_emails=False))
+        cache.get(RedactionConfig(redact_ssn=False))
+        cache.get()
+        self.assertIs(cache.get(RedactionConfig(redact_ssn=False)), first)
+        self.assertEqual(cache.stats()["misses"], 3)
+        cache.get(RedactionConfig(redact_emails=False))
+        self.assertEqual(cache.stats(), dict(cache.stats(), misses=4, size=2))
+
+    def test_redact_pii_reuses_the_shared_cache(self):
+        redactor = get_redactor(RedactionConfig(redact_ip_addresses=True))
+        self.assertIs(get_redactor(RedactionConfig(redact_ip_addresses=True)), redactor)
+        self.assertEqual(redact_pii("at 10.0.0.1", RedactionConfig(redact_ip_addresses=True)).text, "at [IP_REDACTED]")
+
+
+if __name__ == '__main__':
+    unittest.main()
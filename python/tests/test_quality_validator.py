@@ -0,0 +1,216 @@
+"""Tests for the QualityValidator and its compiled rule engine (python/spinehub)."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from spinehub.benchmark import QualityValidator, Scorecard  # noqa: E402
+from spinehub.perf import compare, generate_worklog  # noqa: E402
+from spinehub.rule_engine import LineIndex, RuleEngine  # noqa: E402
+
+GOOD_WORKLOG = """## Summary
+The team shipped the billing export.
+
+**Artifacts**: [PR](https://github.com/org/repo/pull/1)
+
+**Outcome** Export is live.
+"""
+
+
+def result(validator, rule_id):
+    return next(r for r in validator.results if r.rule_id == rule_id)
+
+
+class TestQualityValidator(unittest.TestCase):
+
+    def test_clean_worklog_passes(self):
+        validator = QualityValidator()
+        passed, report = validator.validate(GOOD_WORKLOG)
+        self.assertTrue(passed)
+        self.assertEqual(report.score, 100.0)
+        self.assertEqual(report.total_rules, len(QualityValidator.RULES))
+
+    def test_violation_reports_first_pattern_count_and_line(self):
+        content = "intro\n\nThe team met.\nWe worked on it. I did the export.\nI did more.\n"
+        validator = QualityValidator()
+        passed, report = validator.validate(content)
+        self.assertFalse(passed)
+        pers = result(validator, "PERS_001")
+        # The first pattern in rule order wins, even though "We worked" comes earlier
+        self.assertEqual(pers.message, "Found 2 violation(s): 'I did'")
+        self.assertEqual(pers.line, 4)
+        self.assertIn("[PERS_001] Third Person: Found 2 violation(s): 'I did'", report.errors)
+
+    def test_sections_and_artifact_urls(self):
+        validator = QualityValidator()
+        validator.validate("Summary: x\n**Outcome**Artifacts\n**Artifacts**: see the doc\n")
+        self.assertTrue(result(validator, "STRUCT_001").passed)
+        self.assertTrue(result(validator, "STRUCT_002").passed)
+        self.assertTrue(result(validator, "STRUCT_003").passed)
+        self.assertEqual(result(validator, "LINK_001").message, "Artifacts missing URLs")
+
+        validator.validate("# Outcome\n")
+        self.assertFalse(result(validator, "STRUCT_001").passed)
+        self.assertTrue(result(validator, "STRUCT_003").passed)
+
+    def test_overlapping_section_headings(self):
+        engine = RuleEngine()
+        engine.add_sections(["Summary", "Outcome"], QualityValidator.SECTION_PATTERNS)
+        self.assertEqual(engine.find_sections("**Summary**Outcome**"), {"Summary", "Outcome"})
+
+    def test_section_names_sharing_a_prefix(self):
+        engine = RuleEngine()
+        engine.add_sections(["Sum", "Summary"], QualityValidator.SECTION_PATTERNS)
+        self.assertEqual(engine.find_sections("## Summary\n"), {"Sum", "Summary"})
+        self.assertEqual(engine.find_sections("## Sum\n"), {"Sum"})
+
+    def test_rule_order_and_counts_per_pattern(self):
+        engine = RuleEngine()
+        rule = engine.add_rule([r"token", r"api[_ ]token", r"\w+"])
+        content = "api token, then token"
+        # The first pattern in rule order wins, not the leftmost match ("api")
+        index, match, count = engine.first_hit(rule, content)
+        self.assertEqual((index, match.start(), count), (0, 4, 2))
+        # Overlapping patterns each keep their own finditer count
+        hits = engine.pattern_hits(rule, content)
+        self.assertEqual({i: n for i, (_, n) in hits.items()}, {0: 2, 1: 1, 2: 4})
+
+    def test_line_index(self):
+        lines = LineIndex("a\nbb\n\nc")
+        self.assertEqual([lines.line(i) for i in range(7)], [1, 1, 2, 2, 2, 3, 4])
+
+
+class TestValidateIncremental(unittest.TestCase):
+
+    def test_matches_full_validation(self):
+        content = GOOD_WORKLOG + "\n## Notes\nWe worked late.\nI did the review.\n\n## More\nI did QA.\n"
+        full, incremental = QualityValidator(), QualityValidator()
+        self.assertEqual(incremental.validate_incremental(content), full.validate(content))
+        self.assertEqual(incremental.results, full.results)
+        self.assertEqual(result(incremental, "PERS_001").line, 10)
+
+    def test_rescans_only_changed_sections(self):
+        validator = QualityValidator()
+        validator.validate_incremental(GOOD_WORKLOG)
+        misses = validator.section_stats["misses"]
+        passed, _ = validator.validate_incremental(GOOD_WORKLOG.replace("Export is live.", "I did it."))
+        self.assertFalse(passed)
+        self.assertEqual(validator.section_stats["misses"], misses + 1)
+        self.assertEqual(result(validator, "PERS_001").line, 6)
+
+    def assert_matches_full(self, validator, content):
+        full = QualityValidator()
+        self.assertEqual(validator.validate_incremental(content), full.validate(content))
+        self.assertEqual(validator.results, full.results)
+
+    def test_matches_spanning_sections(self):
+        for content in (
+            'Intro "the start of a quote\n## Notes\nthat ends here" done.\n',
+            # The spanning quote takes the opening quote of the next section
+            'A "short" one and "\n## Notes\nthis is a long quoted bit" and "x"\n',
+            "## Summary\n**Artifacts**:\n# Links\nhttps://example.com\n\n**Outcome** ok\n",
+        ):
+            with self.subTest(content=content):
+                self.assert_matches_full(QualityValidator(), content)
+
+    def test_edit_that_opens_a_quote_before_cached_sections(self):
+        validator = QualityValidator()
+        notes = '## Notes\nThe team agreed.\n\n## More\nThe "dashboards" were "updated by the platform group".\n'
+        self.assert_matches_full(validator, "Intro.\n" + notes)
+        # Only the first section changes, but its quote now closes in a later one
+        self.assert_matches_full(validator, 'Intro "\n' + notes)
+        self.assertEqual(result(validator, "SLACK_001").message,
+                         "Found 2 violation(s): '\"\n## Notes\nThe team agreed.\n\n## More\nThe \"'")
+
+
+class SmallChunkValidator(QualityValidator):
+    STREAM_CHUNK_SIZE = 16
+    STREAM_MAX_OVERLAP = 48
+
+
+class TestValidateStream(unittest.TestCase):
+
+    def validate_both(self, content):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp, "report.md")
+            path.write_text(content, encoding="utf-8")
+            streamed = SmallChunkValidator()
+            report = streamed.validate_stream(path)
+        full = QualityValidator()
+        self.assertEqual(report, full.validate(content))
+        self.assertEqual(streamed.results, full.results)
+        return streamed
+
+    def test_matches_full_validation_across_chunks(self):
+        filler = "The team reviewed the plan.\n" * 20
+        content = filler + GOOD_WORKLOG + filler + 'We worked on "a quote long enough to count".\nI did it.\n' + filler
+        streamed = self.validate_both(content * 3)
+        self.assertEqual(result(streamed, "PERS_001").line, 48)
+        self.assertEqual(result(streamed, "SLACK_001").message, "Found 3 violation(s): '\"a quote long enough to count\"'")
+
+    def test_artifacts_block_longer_than_the_overlap(self):
+        links = "".join(f"- item {i}\n" for i in range(30))
+        self.validate_both(f"## Summary\n**Artifacts**:\n{links}- https://example.com\n\nDone.\n")
+        self.validate_both(f"## Summary\n**Artifacts**:\n{links}\n- https://example.com\n")
+
+
+class TestValidateMany(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.paths = []
+        for i in range(QualityValidator.MIN_POOL_ITEMS):
+            path = Path(self.tmp.name, f"week{i}.md")
+            path.write_text(GOOD_WORKLOG if i % 2 else "I did the export.\n", encoding="utf-8")
+            self.paths.append(path)
+
+    def test_pool_matches_serial_in_input_order(self):
+        validator = QualityValidator()
+        serial = list(validator.validate_many(self.paths, processes=1))
+        pooled = list(validator.validate_many(self.paths, processes=2))
+        self.assertEqual([r.index for r in pooled], list(range(len(self.paths))))
+        self.assertEqual(pooled, serial)
+        self.assertEqual(serial[1].source, str(self.paths[1]))
+        self.assertEqual(validator.results, [])
+
+    def test_scorecard(self):
+        scorecard = Scorecard()
+        items = self.paths[:4] + ["We worked on it.", Path(self.tmp.name, "missing.md")]
+        for item in QualityValidator().validate_many(items):
+            scorecard.add(item)
+        summary = scorecard.to_dict(top=1)
+        self.assertEqual((summary["total"], summary["passed"], summary["unreadable"]), (6, 2, 1))
+        self.assertEqual(summary["pass_rate"], 40.0)
+        self.assertEqual(
+            summary["most_violated"],
+            [{"rule_id": "PERS_001", "rule_name": "Third Person", "documents": 3}],
+        )
+
+
+class TestPerfCorpus(unittest.TestCase):
+
+    def test_generated_worklogs(self):
+        validator = QualityValidator()
+        passed, report = validator.validate(generate_worklog(20))
+        self.assertTrue(passed)
+        self.assertEqual(report.warnings, [])
+        self.assertEqual(generate_worklog(20), generate_worklog(20))
+
+        validator.validate(generate_worklog(20, violations=3))
+        failed = {r.rule_id for r in validator.results if not r.passed}
+        self.assertTrue({"LANG_001", "PERS_001", "SLACK_001"} <= failed)
+
+    def test_compare_with_baseline(self):
+        row = {"themes": 10, "bytes": 100, "operation": "validate", "ms_per_doc": 2.0}
+        baseline = [dict(row, ms_per_doc=1.0), dict(row, operation="format_report")]
+        [comparison] = compare([row], baseline)
+        self.assertEqual((comparison["ratio"], comparison["same_corpus"]), (2.0, True))
+
+
+if __name__ == '__main__':
+    unittest.main()
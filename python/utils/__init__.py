@@ -1,29 +1,40 @@
 # SpineHUB Utils Module
 # Ported from C:\Users\adm_r\SpineHUB\modules\utils
 
-from .privacy import redact_pii, RedactionConfig, RedactionResult, mask_email, mask_phone, truncate_text
-from .datetime_utils import (
-    DateRange,
-    get_default_date_range,
-    parse_date_range,
-    format_display,
-    format_local_time,
-    slack_ts_to_date,
-    now_brasil,
-)
-
-__all__ = [
-    "redact_pii",
-    "RedactionConfig",
-    "RedactionResult",
-    "mask_email",
-    "mask_phone",
-    "truncate_text",
-    "DateRange",
-    "get_default_date_range",
-    "parse_date_range",
-    "format_display",
-    "format_local_time",
-    "slack_ts_to_date",
-    "now_brasil",
-]
+# Submodules load on first attribute access, so a caller that only needs
+# privacy (e.g. the bridge privacy.* fast path) does not import zoneinfo.
+_EXPORTS = {
+    "redact_pii": "privacy",
+    "Redactor": "privacy",
+    "get_redactor": "privacy",
+    "RedactionConfig": "privacy",
+    "FrozenRedactionConfig": "privacy",
+    "RedactionResult": "privacy",
+    "mask_email": "privacy",
+    "mask_phone": "privacy",
+    "truncate_text": "privacy",
+    "DateRange": "datetime_utils",
+    "get_default_date_range": "datetime_utils",
+    "parse_date_range": "datetime_utils",
+    "format_display": "datetime_utils",
+    "format_local_time": "datetime_utils",
+    "slack_ts_to_date": "datetime_utils",
+    "now_brasil": "datetime_utils",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -7,8 +7,16 @@ Supports US and Brazilian document formats.
 """
 
 import re
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+try:
+    from re import _parser as _sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse as _sre_parse
 
 
 # Common PII patterns
@@ -24,6 +32,34 @@ PATTERNS = {
     "ip_address": re.compile(r"\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b"),
 }
 
+# Replacement per pattern, in redaction order: each pattern sees the text
+# as already redacted by the ones before it
+REPLACEMENTS = {
+    "email": "[EMAIL_REDACTED]",
+    "phone": "[PHONE_REDACTED]",
+    "ssn": "[SSN_REDACTED]",
+    "credit_card": "[CC_REDACTED]",
+    "cpf": "[CPF_REDACTED]",
+    "cnpj": "[CNPJ_REDACTED]",
+    "ip_address": "[IP_REDACTED]",
+}
+
+# What a match must start with, tested first at each position so the
+# combined pattern skips text none of the patterns can match
+_STARTS = {
+    "email": r"[a-zA-Z0-9._%+-]+@",
+    "phone": r"[+(0-9]",
+    "ssn": r"\d",
+    "credit_card": r"\d",
+    "cpf": r"\d",
+    "cnpj": r"\d",
+    "ip_address": r"\d",
+}
+
+# An email local part running up to an "@"
+_LOCAL_PART = re.compile(r"[a-zA-Z0-9._%+-]*@")
+_LOCAL_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._%+-")
+
 
 @dataclass
 class RedactionConfig:
@@ -36,6 +72,30 @@ class RedactionConfig:
     redact_ip_addresses: bool = False
     custom_patterns: List[str] = field(default_factory=list)
 
+    def freeze(self) -> "FrozenRedactionConfig":
+        """Hashable copy of this config."""
+        return FrozenRedactionConfig(
+            self.redact_emails,
+            self.redact_phone_numbers,
+            self.redact_ssn,
+            self.redact_credit_cards,
+            self.redact_cpf_cnpj,
+            self.redact_ip_addresses,
+            tuple(self.custom_patterns),
+        )
+
+
+@dataclass(frozen=True)
+class FrozenRedactionConfig:
+    """Hashable RedactionConfig, used to look up compiled redactors."""
+    redact_emails: bool = True
+    redact_phone_numbers: bool = True
+    redact_ssn: bool = True
+    redact_credit_cards: bool = True
+    redact_cpf_cnpj: bool = True
+    redact_ip_addresses: bool = False
+    custom_patterns: Tuple[str, ...] = ()
+
 
 @dataclass
 class RedactionResult:
@@ -45,6 +105,217 @@ class RedactionResult:
     types: List[str]
 
 
+def _max_width(patterns: List[str]) -> int:
+    return max((_sre_parse.parse(p).getwidth()[1] for p in patterns), default=0)
+
+
+class Redactor:
+    """
+    A RedactionConfig compiled once, for redacting many texts.
+
+    The enabled built-in patterns are combined into one alternation, in
+    redaction order, and a single ``sub`` replaces, counts and collects types.
+
+    Applying the patterns one after another (what ``redact_pii`` always did)
+    differs from one leftmost-first scan in two rare cases: a later pattern
+    matching earlier in the text over an earlier pattern's match, and a
+    replacement turning a neighbouring ``\\b`` into a word boundary. The scan
+    checks each match for both and, if either could apply, redacts that text
+    pattern by pattern instead. Custom patterns always run afterwards, on
+    the redacted text.
+    """
+
+    def __init__(self, config: Union[RedactionConfig, FrozenRedactionConfig, None] = None):
+        if config is None:
+            config = RedactionConfig()
+        enabled = {
+            "email": config.redact_emails,
+            "phone": config.redact_phone_numbers,
+            "ssn": config.redact_ssn,
+            "credit_card": config.redact_credit_cards,
+            "cpf": config.redact_cpf_cnpj,
+            "cnpj": config.redact_cpf_cnpj,
+            "ip_address": config.redact_ip_addresses,
+        }
+        self.types = [name for name in REPLACEMENTS if enabled[name]]
+        self.custom_patterns: List[re.Pattern] = []
+        for pattern_str in config.custom_patterns:
+            try:
+                self.custom_patterns.append(re.compile(pattern_str))
+            except re.error:
+                # Invalid regex, skip
+                pass
+
+        self._combined = None
+        if self.types:
+            starts = "|".join(dict.fromkeys(_STARTS[name] for name in self.types))
+            self._combined = re.compile(
+                f"(?={starts})(?:"
+                + "|".join(f"(?P<{name}>{PATTERNS[name].pattern})" for name in self.types)
+                + ")"
+            )
+        # Overlap and word-boundary checks per type, compiled on first use
+        self._checks: Dict[str, tuple] = {}
+
+    def redact(self, text: str) -> RedactionResult:
+        """
+        Redact PII from text.
+
+        Args:
+            text: Text to redact PII from
+
+        Returns:
+            RedactionResult with redacted text and statistics
+        """
+        counts = dict.fromkeys(self.types, 0)
+        result = text
+        if self._combined is not None:
+            in_order = False
+
+            def replace(match: re.Match) -> str:
+                nonlocal in_order
+                name = match.lastgroup
+                counts[name] += 1
+                if not in_order and self._depends_on_order(text, name, *match.span()):
+                    in_order = True
+                return REPLACEMENTS[name]
+
+            result = self._combined.sub(replace, text)
+            if in_order:
+                result = text
+                for name in self.types:
+                    result, counts[name] = PATTERNS[name].subn(REPLACEMENTS[name], result)
+
+        types = [name for name in self.types if counts[name]]
+        redacted_count = sum(counts.values())
+        for pattern in self.custom_patterns:
+            result, count = pattern.subn("[REDACTED]", result)
+            if count:
+                redacted_count += count
+                if "custom" not in types:
+                    types.append("custom")
+
+        return RedactionResult(text=result, redacted_count=redacted_count, types=types)
+
+    def _depends_on_order(self, text: str, name: str, start: int, end: int) -> bool:
+        """
+        Whether redacting pattern by pattern could treat this match differently.
+
+        That needs an earlier pattern to match starting inside it, or a later
+        pattern starting with ``\\b`` (or ending with it) to match right after
+        (or before) the replacement, which sees a bracket where the text has
+        a word character.
+        """
+        checks = self._checks.get(name)
+        if checks is None:
+            checks = self._checks[name] = self._compile_checks(name)
+        earlier, earlier_width, email_earlier, after, before, later_width = checks
+
+        if earlier is not None:
+            hit = earlier.search(text, start + 1, end + earlier_width + 1)
+            if hit is not None and hit.start() < end:
+                return True
+        if email_earlier and text[end - 1] in _LOCAL_CHARS and _LOCAL_PART.match(text, end):
+            return True
+
+        if after is not None and end < len(text) and _is_word(text[end - 1]) and _is_word(text[end]):
+            if after.match("]" + text[end:end + later_width + 1], 1):
+                return True
+        if before is not None and start > 0 and _is_word(text[start - 1]) and _is_word(text[start]):
+            first = max(start - later_width - 1, 0)
+            if before.search(text[first:start] + "[", 1 if first else 0):
+                return True
+        return False
+
+    def _compile_checks(self, name: str) -> tuple:
+        index = self.types.index(name)
+        # The email pattern has no maximum width; it is checked through its "@"
+        earlier = [PATTERNS[n].pattern for n in self.types[:index] if n != "email"]
+        later = [PATTERNS[n].pattern for n in self.types[index + 1:]]
+        # The far end's \b may hold once the text past it is redacted too,
+        # so it is left out
+        later_after = [p.removesuffix(r"\b") for p in later if p.startswith(r"\b")]
+        later_before = [p.removeprefix(r"\b") for p in later if p.endswith(r"\b")]
+        return (
+            re.compile("|".join(f"(?:{p})" for p in earlier)) if earlier else None,
+            _max_width(earlier),
+            "email" in self.types[:index],
+            re.compile("|".join(f"(?:{p})" for p in later_after)) if later_after else None,
+            re.compile("(?:" + "|".join(f"(?:{p})" for p in later_before) + r")(?=\[\Z)")
+            if later_before else None,
+            _max_width(later_after + later_before),
+        )
+
+
+def _is_word(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class RedactorCache:
+    """
+    LRU cache of compiled Redactors keyed by frozen config.
+
+    Counts hits and misses, and the total time spent compiling redactors on
+    misses. The least recently used redactor is dropped once ``max_size``
+    configs are cached.
+    """
+
+    def __init__(self, max_size: int = 32):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.compile_seconds = 0.0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[FrozenRedactionConfig, Redactor]" = OrderedDict()
+
+    def get(self, config: Union[RedactionConfig, FrozenRedactionConfig, None] = None) -> Redactor:
+        """The compiled redactor for ``config`` (None for defaults), compiling it if needed."""
+        if config is None:
+            key = FrozenRedactionConfig()
+        elif isinstance(config, RedactionConfig):
+            key = config.freeze()
+        else:
+            key = config
+        with self._lock:
+            redactor = self._entries.get(key)
+            if redactor is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return redactor
+            self.misses += 1
+
+        started = time.perf_counter()
+        redactor = Redactor(key)
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.compile_seconds += elapsed
+            self._entries[key] = redactor
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return redactor
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "compile_ms": round(self.compile_seconds * 1000, 3),
+        }
+
+
+# Compiled redactors shared by every redact_pii call in this process
+REDACTORS = RedactorCache()
+
+
+def get_redactor(config: Union[RedactionConfig, FrozenRedactionConfig, None] = None) -> Redactor:
+    """Compiled redactor for ``config``, from the shared cache."""
+    return REDACTORS.get(config)
+
+
 def redact_pii(
     text: str,
     config: Optional[RedactionConfig] = None
@@ -52,6 +323,9 @@ def redact_pii(
     """
     Redact PII from text based on configuration.
 
+    The config is compiled once and reused by later calls with an equal
+    config (see ``get_redactor``).
+
     Args:
         text: Text to redact PII from
         config: RedactionConfig or None for defaults
@@ -59,86 +333,7 @@ def redact_pii(
     Returns:
         RedactionResult with redacted text and statistics
     """
-    if config is None:
-        config = RedactionConfig()
-
-    result = text
-    types: List[str] = []
-    redacted_count = 0
-
-    # Email addresses
-    if config.redact_emails:
-        matches = PATTERNS["email"].findall(result)
-        if matches:
-            redacted_count += len(matches)
-            types.append("email")
-            result = PATTERNS["email"].sub("[EMAIL_REDACTED]", result)
-
-    # Phone numbers
-    if config.redact_phone_numbers:
-        matches = PATTERNS["phone"].findall(result)
-        if matches:
-            redacted_count += len(matches)
-            types.append("phone")
-            result = PATTERNS["phone"].sub("[PHONE_REDACTED]", result)
-
-    # SSN (always redact - highly sensitive)
-    if config.redact_ssn:
-        matches = PATTERNS["ssn"].findall(result)
-        if matches:
-            redacted_count += len(matches)
-            types.append("ssn")
-            result = PATTERNS["ssn"].sub("[SSN_REDACTED]", result)
-
-    # Credit cards (always redact - highly sensitive)
-    if config.redact_credit_cards:
-        matches = PATTERNS["credit_card"].findall(result)
-        if matches:
-            redacted_count += len(matches)
-            types.append("credit_card")
-            result = PATTERNS["credit_card"].sub("[CC_REDACTED]", result)
-
-    # Brazilian CPF
-    if config.redact_cpf_cnpj:
-        matches = PATTERNS["cpf"].findall(result)
-        if matches:
-            redacted_count += len(matches)
-            types.append("cpf")
-            result = PATTERNS["cpf"].sub("[CPF_REDACTED]", result)
-
-        # Brazilian CNPJ
-        matches = PATTERNS["cnpj"].findall(result)
-        if matches:
-            redacted_count += len(matches)
-            types.append("cnpj")
-            result = PATTERNS["cnpj"].sub("[CNPJ_REDACTED]", result)
-
-    # IP addresses
-    if config.redact_ip_addresses:
-        matches = PATTERNS["ip_address"].findall(result)
-        if matches:
-            redacted_count += len(matches)
-            types.append("ip_address")
-            result = PATTERNS["ip_address"].sub("[IP_REDACTED]", result)
-
-    # Custom patterns
-    for pattern_str in config.custom_patterns:
-        try:
-            pattern = re.compile(pattern_str)
-            matches = pattern.findall(result)
-            if matches:
-                redacted_count += len(matches)
-                types.append("custom")
-                result = pattern.sub("[REDACTED]", result)
-        except re.error:
-            # Invalid regex, skip
-            pass
-
-    return RedactionResult(
-        text=result,
-        redacted_count=redacted_count,
-        types=list(set(types))
-    )
+    return get_redactor(config).redact(text)
 
 
 def truncate_text(text: str, max_length: int = 500) -> str: